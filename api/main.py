@@ -3,12 +3,24 @@ FastAPI Backend para BooJ Dashboard - Production Ready
 Conecta ao banco SQLite do hunter.py
 """
 
-from fastapi import FastAPI, Query, HTTPException
+from fastapi import Depends, FastAPI, Query, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from typing import Optional
+from fastapi.responses import StreamingResponse
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import Callable, Iterable, Iterator, Optional
 import sqlite3
 from datetime import datetime
+import asyncio
+import base64
+import functools
+import hashlib
+import json
 import os
+import re
+import threading
+import time
 import logging
 
 # ========================================
@@ -24,6 +36,21 @@ DB_PATH = os.getenv(
     os.path.join(os.path.dirname(__file__), "..", "data", "jobs.db")
 )
 
+# Cache de respostas: memória (por worker) + arquivo SQLite (compartilhado entre workers).
+# Invalidado pela geração que o hunter incrementa a cada commit; o TTL cobre
+# contagens que dependem do relógio ("últimas 24h"). API_CACHE_PATH="" desliga o arquivo.
+API_CACHE_PATH = os.getenv(
+    "API_CACHE_PATH",
+    os.path.join(os.path.dirname(DB_PATH), "api_cache.db")
+)
+API_CACHE_SIZE = int(os.getenv("API_CACHE_SIZE", "256"))
+API_CACHE_TTL = int(os.getenv("API_CACHE_TTL", "300"))
+
+# O hunter grava o banco em WAL; leitores esperam um lock em vez de falhar
+DB_BUSY_TIMEOUT_MS = int(os.getenv("DB_BUSY_TIMEOUT_MS", "5000"))
+DB_MMAP_SIZE = int(os.getenv("DB_MMAP_SIZE", str(256 * 1024 * 1024)))
+API_DB_POOL_SIZE = int(os.getenv("API_DB_POOL_SIZE", "8"))  # conexões (e threads de I/O) por worker
+
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
 LOG_FILE = os.getenv("LOG_FILE", None)
 
@@ -41,6 +68,26 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# ========================================
+# LIFESPAN (startup/shutdown)
+# ========================================
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Log startup information, open the DB pool and close it on shutdown"""
+    logger.info("=" * 50)
+    logger.info("BooJ API Starting...")
+    logger.info(f"Version: 1.0.0")
+    logger.info(f"Database: {DB_PATH}")
+    logger.info(f"Allowed Origins: {ALLOWED_ORIGINS}")
+    logger.info(f"DB pool: {API_DB_POOL_SIZE} connections")
+    logger.info("=" * 50)
+    await database.open()
+    try:
+        yield
+    finally:
+        await database.close()
+
+
 # ========================================
 # FASTAPI APP
 # ========================================
@@ -49,7 +96,8 @@ app = FastAPI(
     description="API for BooJ - Intelligent Job Aggregator",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    lifespan=lifespan
 )
 
 # ========================================
@@ -68,34 +116,329 @@ logger.info(f"Database path: {DB_PATH}")
 
 
 # ========================================
-# DATABASE CONNECTION
+# DATABASE CONNECTION (pool assíncrono)
 # ========================================
-def get_db():
-    """Conexão com SQLite com logging"""
+def connect_db() -> sqlite3.Connection:
+    """Conexão somente-leitura com SQLite (pode ser usada por qualquer thread do pool)"""
     try:
-        conn = sqlite3.connect(DB_PATH)
+        conn = sqlite3.connect(DB_PATH, timeout=DB_BUSY_TIMEOUT_MS / 1000, check_same_thread=False)
         conn.row_factory = sqlite3.Row
+        conn.execute(f"PRAGMA busy_timeout = {DB_BUSY_TIMEOUT_MS}")
+        conn.execute(f"PRAGMA mmap_size = {DB_MMAP_SIZE}")
+        conn.execute("PRAGMA query_only = 1")
         return conn
     except Exception as e:
         logger.error(f"Database connection failed: {e}")
         raise HTTPException(status_code=500, detail="Database connection failed")
 
 
+class AsyncDatabase:
+    """
+    Pool de conexões SQLite para os endpoints async.
+    
+    O sqlite3 é bloqueante: cada consulta roda num executor próprio (uma thread
+    por conexão), então o event loop nunca espera o disco e o threadpool do
+    Starlette fica livre. A conexão sempre volta ao pool, mesmo com erro; se o
+    pool foi fechado enquanto ela estava em uso, é fechada na devolução.
+    """
+
+    def __init__(self, size: int = API_DB_POOL_SIZE):
+        self.size = size
+        self.opened = 0
+        self._pool: Optional[asyncio.Queue] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    async def open(self):
+        if self._pool is None:
+            self._pool = asyncio.Queue()
+            self._executor = ThreadPoolExecutor(max_workers=self.size, thread_name_prefix="api-db")
+
+    async def close(self):
+        if self._pool is None:
+            return
+        while not self._pool.empty():
+            self._pool.get_nowait().close()
+        self._executor.shutdown(wait=False)
+        self._pool, self._executor, self.opened = None, None, 0
+
+    async def offload(self, fn: Callable, *args):
+        """Executa trabalho bloqueante (sem conexão) nas threads do pool"""
+        await self.open()
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, functools.partial(fn, *args)
+        )
+
+    @asynccontextmanager
+    async def connection(self):
+        await self.open()
+        pool = self._pool
+        if pool.empty() and self.opened < self.size:
+            self.opened += 1
+            try:
+                conn = await self.offload(connect_db)
+            except Exception:
+                self.opened -= 1
+                raise
+        else:
+            conn = await pool.get()
+        try:
+            yield conn
+        finally:
+            if self._pool is pool:
+                pool.put_nowait(conn)
+            else:
+                conn.close()  # devolvida depois do shutdown
+
+    async def run(self, fn: Callable, *args):
+        """fn(conn, *args) numa conexão do pool, fora do event loop"""
+        async with self.connection() as conn:
+            return await self.offload(fn, conn, *args)
+
+
+database = AsyncDatabase()
+
+
+async def get_database() -> AsyncDatabase:
+    """Dependência FastAPI: pool do worker (aberto e fechado no lifespan)"""
+    return database
+
+
+def stream_json(payload: dict, list_key: str, rows: Iterable, item: Callable,
+                chunk_rows: int = 100) -> Iterator[bytes]:
+    """
+    Serializa {**payload, list_key: [item(row), ...]} em pedaços de chunk_rows
+    linhas, sem montar a lista de dicts nem o documento inteiro em memória.
+    """
+    head = json.dumps(payload)[:-1]
+    yield f'{head}{", " if payload else ""}{json.dumps(list_key)}: ['.encode()
+    buffer, first = [], True
+    for row in rows:
+        buffer.append(json.dumps(item(row)))
+        if len(buffer) >= chunk_rows:
+            yield (("" if first else ", ") + ", ".join(buffer)).encode()
+            buffer, first = [], False
+    if buffer:
+        yield (("" if first else ", ") + ", ".join(buffer)).encode()
+    yield b"]}"
+
+
+# ========================================
+# FULL-TEXT SEARCH (índice jobs_fts mantido pelo JobDatabase do hunter)
+# ========================================
+FTS_RANK = "bm25(jobs_fts, 10.0, 5.0, 2.0, 1.0)"  # pesos: titulo, empresa, localizacao, tags
+_known_tables = set()  # tabelas opcionais já vistas no banco (FTS, rollups)
+
+
+def fts_query(text: str) -> str:
+    """Texto livre → expressão MATCH segura com prefixo ('python jr' → '"python"* "jr"*')"""
+    return " ".join(f'"{term}"*' for term in re.findall(r"\w+", text or ""))
+
+
+def has_table(conn, name: str) -> bool:
+    """
+    Verifica se o banco tem a tabela opcional. Só a presença fica em cache:
+    a API pode subir antes de o hunter criar a tabela.
+    """
+    if name in _known_tables:
+        return True
+    found = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (name,)
+    ).fetchone() is not None
+    if found:
+        _known_tables.add(name)
+    return found
+
+
+def has_fts(conn) -> bool:
+    return has_table(conn, "jobs_fts")
+
+
+# ========================================
+# PAGINAÇÃO POR CURSOR (keyset sobre idx_jobs_feed)
+# ========================================
+TOTALS_TTL = int(os.getenv("API_TOTALS_TTL", "60"))  # segundos de cache do total por filtro
+TOTALS_CACHE_SIZE = int(os.getenv("API_TOTALS_CACHE_SIZE", "512"))  # combinações de filtros guardadas
+_totals_cache = OrderedDict()  # (filtros) -> (expira_em, total), LRU
+_totals_lock = threading.Lock()  # consultas rodam nas threads do pool
+
+
+def encode_cursor(kind: str, values) -> str:
+    """Cursor opaco: posição da última vaga da página (base64 de JSON)"""
+    raw = json.dumps({"k": kind, "v": list(values)}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(token: str, kind: str) -> list:
+    """Valida e abre o cursor; HTTP 400 se for inválido ou de outra ordenação"""
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        data = json.loads(raw)
+        if data["k"] != kind or not isinstance(data["v"], list):
+            raise ValueError(kind)
+        return data["v"]
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def cached_total(key, compute) -> int:
+    """
+    Total por combinação de filtros, recalculado no máximo a cada TOTALS_TTL.
+    A chave inclui a geração do banco: um commit do hunter nunca devolve o total
+    antigo (que o ResponseCache guardaria sob a geração nova). A busca é texto
+    livre: só as TOTALS_CACHE_SIZE combinações mais recentes ficam.
+    """
+    now = time.monotonic()
+    with _totals_lock:
+        hit = _totals_cache.get(key)
+        if hit and hit[0] > now:
+            _totals_cache.move_to_end(key)
+            return hit[1]
+    total = compute()
+    with _totals_lock:
+        _totals_cache[key] = (now + TOTALS_TTL, total)
+        _totals_cache.move_to_end(key)
+        while len(_totals_cache) > TOTALS_CACHE_SIZE:
+            _totals_cache.popitem(last=False)
+    return total
+
+
+# ========================================
+# RESPONSE CACHE (geração do banco + ETag/304)
+# ========================================
+class ResponseCache:
+    """
+    Respostas JSON já serializadas, válidas enquanto a geração do banco não muda.
+    L1: OrderedDict LRU no processo. L2: arquivo SQLite visto por todos os workers.
+    """
+
+    def __init__(self, path: str = "", size: int = 256, ttl: int = 300):
+        self.size = size
+        self.ttl = ttl
+        self._memory = OrderedDict()  # key -> (generation, expira_em, body)
+        self._lock = threading.Lock()
+        self._conn = None
+        if path:
+            try:
+                self._conn = sqlite3.connect(path, timeout=1, check_same_thread=False)
+                self._conn.execute("PRAGMA journal_mode = WAL")
+                self._conn.execute("""
+                    CREATE TABLE IF NOT EXISTS response_cache (
+                        key TEXT PRIMARY KEY, generation INTEGER, expires REAL, body BLOB
+                    )
+                """)
+                self._conn.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"API cache file disabled ({path}): {e}")
+                self._conn = None
+
+    def get(self, key: str, generation: int) -> Optional[bytes]:
+        now = time.time()
+        with self._lock:
+            hit = self._memory.get(key)
+            if hit and hit[0] == generation and hit[1] > now:
+                self._memory.move_to_end(key)
+                return hit[2]
+            if self._conn is None:
+                return None
+            try:
+                row = self._conn.execute(
+                    "SELECT expires, body FROM response_cache WHERE key = ? AND generation = ?",
+                    (key, generation)
+                ).fetchone()
+            except sqlite3.Error:
+                return None
+            if not row or row[0] <= now:
+                return None
+            self._remember(key, (generation, row[0], row[1]))
+            return row[1]
+
+    def put(self, key: str, generation: int, body: bytes):
+        expires = time.time() + self.ttl
+        with self._lock:
+            self._remember(key, (generation, expires, body))
+            if self._conn is None:
+                return
+            try:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO response_cache (key, generation, expires, body) VALUES (?, ?, ?, ?)",
+                    (key, generation, expires, body)
+                )
+                self._conn.execute(
+                    "DELETE FROM response_cache WHERE generation < ? OR expires <= ?",
+                    (generation, time.time())
+                )
+                self._conn.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"API cache write failed: {e}")
+
+    def _remember(self, key, entry):
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.size:
+            self._memory.popitem(last=False)
+
+
+response_cache = ResponseCache(API_CACHE_PATH, API_CACHE_SIZE, API_CACHE_TTL)
+
+
+def current_generation(conn) -> Optional[int]:
+    """Geração dos dados gravada pelo JobDatabase (None = banco sem contador, sem cache)"""
+    try:
+        row = conn.execute("SELECT value FROM meta WHERE key = 'generation'").fetchone()
+        return int(row["value"]) if row else 0
+    except sqlite3.Error:
+        return None
+
+
+def _cache_as_sent(chunks: Iterable[bytes], key: str, generation: int) -> Iterator[bytes]:
+    """Repassa os pedaços ao cliente e guarda o corpo completo no cache no fim"""
+    sent = []
+    for chunk in chunks:
+        sent.append(chunk)
+        yield chunk
+    response_cache.put(key, generation, b"".join(sent))
+
+
+async def serve_cached(request: Request, db: AsyncDatabase,
+                       build: Callable[[sqlite3.Connection], Iterable[bytes]]) -> Response:
+    """
+    Responde do cache quando a geração não mudou; 304 se o cliente já tem a
+    versão (If-None-Match). Caso contrário roda build(conn) no pool e transmite
+    o JSON em pedaços, guardando-o no cache.
+    """
+    generation = await db.run(current_generation)
+    if generation is None:
+        return StreamingResponse(await db.run(build), media_type="application/json")
+
+    key = f"{request.url.path}?{sorted(request.query_params.multi_items())}"
+    window = int(time.time() // API_CACHE_TTL) if API_CACHE_TTL else 0
+    digest = hashlib.sha1(f"{key}|{window}".encode()).hexdigest()[:16]
+    etag = f'W/"{generation}-{digest}"'
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+
+    if etag in request.headers.get("if-none-match", ""):
+        return Response(status_code=304, headers=headers)
+
+    body = await db.offload(response_cache.get, key, generation)
+    if body is not None:
+        return Response(content=body, media_type="application/json", headers=headers)
+
+    chunks = await db.run(build)
+    return StreamingResponse(_cache_as_sent(chunks, key, generation),
+                             media_type="application/json", headers=headers)
+
+
 # ========================================
 # HEALTH CHECK ENDPOINT
 # ========================================
 @app.get("/health")
-def health_check():
+async def health_check(db: AsyncDatabase = Depends(get_database)):
     """
     Health check endpoint for monitoring and load balancers
     """
     try:
         # Test database connection
-        conn = get_db()
-        cursor = conn.cursor()
-        cursor.execute("SELECT COUNT(*) FROM jobs")
-        job_count = cursor.fetchone()[0]
-        conn.close()
+        job_count = await db.run(lambda conn: conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0])
         db_status = "healthy"
     except Exception as e:
         logger.error(f"Health check failed: {e}")
@@ -130,103 +473,147 @@ def read_root():
 # JOBS ENDPOINT
 # ========================================
 @app.get("/api/v1/jobs")
-def get_jobs(
-    skip: int = Query(0, ge=0, description="Number of jobs to skip"),
+async def get_jobs(
+    request: Request,
+    skip: int = Query(0, ge=0, description="Number of jobs to skip (legacy; prefer cursor)"),
     limit: int = Query(50, ge=1, le=500, description="Max jobs to return"),
     platform: Optional[str] = Query(None, description="Filter by platform (e.g., 'LinkedIn')"),
-    search: Optional[str] = Query(None, description="Search in title or company"),
-    remote_only: bool = Query(False, description="Only remote jobs")
+    search: Optional[str] = Query(None, description="Full-text search (title, company, location, tags)"),
+    remote_only: bool = Query(False, description="Only remote jobs"),
+    after: Optional[str] = Query(None, alias="cursor", description="next_cursor of the previous page"),
+    count: str = Query("cached", pattern="^(exact|cached|none)$",
+                       description="Total: exact (COUNT every request), cached (TTL) or none"),
+    db: AsyncDatabase = Depends(get_database)
 ):
     """
-    Get list of jobs with filters
+    Get list of jobs with filters (cached per data generation, ETag/304)
+    
+    Pagination is keyset-based: pass the returned next_cursor as `cursor` to
+    get the following page. Every page costs the same regardless of depth.
     
     Returns:
-        - total: Total number of jobs matching filters
+        - total: Total number of jobs matching filters (null with count=none)
         - jobs: List of job objects
+        - next_cursor: Cursor for the next page (null on the last page)
         - skip: Current skip value
         - limit: Current limit value
     """
+    return await serve_cached(request, db, lambda conn: query_jobs(
+        conn, skip, limit, platform, search, remote_only, after, count
+    ))
+
+
+def job_item(row) -> dict:
+    return {
+        "id": row["id"],
+        "titulo": row["titulo"],
+        "empresa": row["empresa"],
+        "localizacao": row["localizacao"],
+        "link": row["link"],
+        "plataforma": row["plataforma"],
+        "data_publicacao": row["data_publicacao"],
+        "data_coleta": row["data_coleta"],
+        "score": row["score"] or 0
+    }
+
+
+def query_jobs(conn, skip: int, limit: int, platform: Optional[str], search: Optional[str],
+               remote_only: bool, after: Optional[str], count: str) -> Iterator[bytes]:
+    """Runs the /api/v1/jobs query (see get_jobs); rows are serialized lazily"""
     try:
-        conn = get_db()
         cursor = conn.cursor()
         
         # Base query
         query = """
             SELECT 
-                id,
-                titulo,
-                empresa,
-                localizacao,
-                link,
-                plataforma,
-                data_publicacao,
-                data_coleta,
-                created_at,
-                score
-            FROM jobs
-            WHERE 1=1
+                jobs.id,
+                jobs.titulo,
+                jobs.empresa,
+                jobs.localizacao,
+                jobs.link,
+                jobs.plataforma,
+                jobs.data_publicacao,
+                jobs.data_coleta,
+                jobs.created_at,
+                jobs.score
         """
+        source = " FROM jobs"
+        where = " WHERE 1=1"
         params = []
         
+        # Search: FTS5 (prefixo, sem acento, ranking BM25) ou LIKE se não houver índice
+        match = fts_query(search)
+        ranked = bool(match) and has_fts(conn)
+        if ranked:
+            query += f", {FTS_RANK} AS rank"
+            source += " JOIN jobs_fts ON jobs_fts.rowid = jobs.id"
+            where += " AND jobs_fts MATCH ?"
+            params.append(match)
+        elif search:
+            where += " AND (jobs.titulo LIKE ? OR jobs.empresa LIKE ?)"
+            params.extend([f"%{search}%", f"%{search}%"])
+        
         # Filters
         if platform:
-            query += " AND plataforma LIKE ?"
+            where += " AND jobs.plataforma LIKE ?"
             params.append(f"%{platform}%")
         
-        if search:
-            query += " AND (titulo LIKE ? OR empresa LIKE ?)"
-            params.extend([f"%{search}%", f"%{search}%"])
-        
         if remote_only:
-            query += " AND (localizacao LIKE '%remoto%' OR localizacao LIKE '%REMOTO%' OR localizacao LIKE '%🏠%')"
+            where += " AND (jobs.localizacao LIKE '%remoto%' OR jobs.localizacao LIKE '%REMOTO%' OR jobs.localizacao LIKE '%🏠%')"
         
-        # Order by newly collected first, then score
-        query += " ORDER BY created_at DESC, score DESC"
+        filter_sql, filter_params = source + where, list(params)
         
-        # Pagination
-        query += f" LIMIT {limit} OFFSET {skip}"
+        # Ordering + keyset: relevância (busca) ou recém-coletadas primeiro, depois score
+        if ranked:
+            kind = "rank"
+            order_by = " ORDER BY rank, jobs.id"
+            if after:
+                where += f" AND ({FTS_RANK}, jobs.id) > (?, ?)"
+                params.extend(decode_cursor(after, kind))
+        else:
+            kind = "feed"
+            order_by = " ORDER BY jobs.created_at DESC, jobs.score DESC, jobs.id DESC"
+            if after:
+                where += " AND (jobs.created_at, jobs.score, jobs.id) < (?, ?, ?)"
+                params.extend(decode_cursor(after, kind))
         
-        cursor.execute(query, params)
+        # Pagination (uma linha extra indica se há próxima página)
+        pagination = f" LIMIT {limit + 1}" if after else f" LIMIT {limit + 1} OFFSET {skip}"
+        cursor.execute(query + source + where + order_by + pagination, params)
         rows = cursor.fetchall()
         
-        # Count total
-        count_query = "SELECT COUNT(*) as total FROM jobs WHERE 1=1"
-        if platform:
-            count_query += " AND plataforma LIKE ?"
-        if search:
-            count_query += " AND (titulo LIKE ? OR empresa LIKE ?)"
-        if remote_only:
-            count_query += " AND (localizacao LIKE '%remoto%' OR localizacao LIKE '%REMOTO%' OR localizacao LIKE '%🏠%')"
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1]
+            values = (last["rank"], last["id"]) if ranked else \
+                (last["created_at"], last["score"], last["id"])
+            next_cursor = encode_cursor(kind, values)
         
-        cursor.execute(count_query, params)
-        total = cursor.fetchone()["total"]
-        
-        conn.close()
+        # Count total
+        def count_total():
+            cursor.execute("SELECT COUNT(*) as total" + filter_sql, filter_params)
+            return cursor.fetchone()["total"]
         
-        # Convert to dict
-        jobs = []
-        for row in rows:
-            jobs.append({
-                "id": row["id"],
-                "titulo": row["titulo"],
-                "empresa": row["empresa"],
-                "localizacao": row["localizacao"],
-                "link": row["link"],
-                "plataforma": row["plataforma"],
-                "data_publicacao": row["data_publicacao"],
-                "data_coleta": row["data_coleta"],
-                "score": row["score"] or 0
-            })
+        if count == "exact":
+            total = count_total()
+        elif count == "cached":
+            key = (DB_PATH, current_generation(conn), platform, search, remote_only)
+            total = cached_total(key, count_total)
+        else:
+            total = None
         
-        logger.info(f"Fetched {len(jobs)} jobs (total: {total})")
+        logger.info(f"Fetched {len(rows)} jobs (total: {total})")
         
-        return {
+        return stream_json({
             "total": total,
-            "jobs": jobs,
+            "next_cursor": next_cursor,
             "skip": skip,
             "limit": limit
-        }
+        }, "jobs", rows, job_item)
     
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error fetching jobs: {e}")
         raise HTTPException(status_code=500, detail="Error fetching jobs")
@@ -236,9 +623,9 @@ def get_jobs(
 # STATS ENDPOINT
 # ========================================
 @app.get("/api/v1/stats")
-def get_stats():
+async def get_stats(request: Request, db: AsyncDatabase = Depends(get_database)):
     """
-    Get general statistics
+    Get general statistics (cached per data generation, ETag/304)
     
     Returns:
         - total_jobs: Total number of jobs
@@ -247,15 +634,25 @@ def get_stats():
         - top_companies: Top 5 companies
         - top_platforms: Top 5 platforms
     """
+    return await serve_cached(request, db, lambda conn: [json.dumps(query_stats(conn)).encode()])
+
+
+def query_stats(conn) -> dict:
+    """Runs the /api/v1/stats aggregates (see get_stats)"""
     try:
-        conn = get_db()
         cursor = conn.cursor()
         
+        # Rollups (stats_daily_*) mantidos pelo hunter: poucas dezenas de linhas
+        rollups = has_table(conn, "stats_daily_platform")
+        
         # Total jobs
-        cursor.execute("SELECT COUNT(*) as total FROM jobs")
+        if rollups:
+            cursor.execute("SELECT COALESCE(SUM(jobs), 0) as total FROM stats_daily_platform")
+        else:
+            cursor.execute("SELECT COUNT(*) as total FROM jobs")
         total = cursor.fetchone()["total"]
         
-        # Jobs collected in last 24 hours (using created_at)
+        # Jobs collected in last 24 hours (using created_at, range on idx_jobs_created_at)
         cursor.execute("""
             SELECT COUNT(*) as count FROM jobs 
             WHERE created_at >= datetime('now', '-1 day')
@@ -270,27 +667,43 @@ def get_stats():
         jobs_last_week = cursor.fetchone()["count"]
         
         # Top companies
-        cursor.execute("""
-            SELECT empresa, COUNT(*) as count 
-            FROM jobs 
-            GROUP BY empresa 
-            ORDER BY count DESC 
-            LIMIT 5
-        """)
+        if rollups:
+            cursor.execute("""
+                SELECT NULLIF(empresa, '') as empresa, SUM(jobs) as count
+                FROM stats_daily_company
+                GROUP BY empresa
+                ORDER BY count DESC
+                LIMIT 5
+            """)
+        else:
+            cursor.execute("""
+                SELECT empresa, COUNT(*) as count 
+                FROM jobs 
+                GROUP BY empresa 
+                ORDER BY count DESC 
+                LIMIT 5
+            """)
         top_companies = [{"name": row["empresa"], "count": row["count"]} for row in cursor.fetchall()]
         
         # Top platforms
-        cursor.execute("""
-            SELECT plataforma, COUNT(*) as count 
-            FROM jobs 
-            GROUP BY plataforma 
-            ORDER BY count DESC 
-            LIMIT 5
-        """)
+        if rollups:
+            cursor.execute("""
+                SELECT NULLIF(plataforma, '') as plataforma, SUM(jobs) as count
+                FROM stats_daily_platform
+                GROUP BY plataforma
+                ORDER BY count DESC
+                LIMIT 5
+            """)
+        else:
+            cursor.execute("""
+                SELECT plataforma, COUNT(*) as count 
+                FROM jobs 
+                GROUP BY plataforma 
+                ORDER BY count DESC 
+                LIMIT 5
+            """)
         top_platforms = [{"name": row["plataforma"], "count": row["count"]} for row in cursor.fetchall()]
         
-        conn.close()
-        
         logger.info(f"Stats fetched: {total} total, {jobs_last_24h} last 24h, {jobs_last_week} last week")
         
         return {
@@ -307,20 +720,6 @@ def get_stats():
         raise HTTPException(status_code=500, detail="Error fetching stats")
 
 
-# ========================================
-# STARTUP EVENT
-# ========================================
-@app.on_event("startup")
-async def startup_event():
-    """Log startup information"""
-    logger.info("=" * 50)
-    logger.info("BooJ API Starting...")
-    logger.info(f"Version: 1.0.0")
-    logger.info(f"Database: {DB_PATH}")
-    logger.info(f"Allowed Origins: {ALLOWED_ORIGINS}")
-    logger.info("=" * 50)
-
-
 # ========================================
 # MAIN (for local development)
 # ========================================
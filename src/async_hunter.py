@@ -4,56 +4,26 @@ Async version of run_cycle for parallel scraping
 Reduces execution time from 15min to <3min!
 """
 
-import asyncio
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import List, Dict
-import time
+
+from scheduler import ScraperScheduler
+
 
 def run_cycle_parallel(scrapers_config: List[Dict]) -> List[Dict]:
     """
     Execute scraping cycle with parallel execution
     
+    Thin wrapper over ScraperScheduler (the scheduler used by hunter.main_loop),
+    kept for scripts that still import this module.
+    
     Args:
         scrapers_config: List of scraper configurations
         Each config: {"name": str, "scraper": callable, "args": tuple}
     
     Returns:
-        List of all jobs from all scrapers
+        List of all jobs from all scrapers that finished in time
     """
-    all_jobs = []
-    
-    # Use ThreadPoolExecutor for I/O-bound tasks
-    max_workers = min(16, len(scrapers_config))  # Cap at 16 workers
-    
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        # Submit all scraping tasks
-        future_to_scraper = {}
-        
-        for config in scrapers_config:
-            scraper_name = config['name']
-            scraper_func = config['scraper']
-            scraper_args = config.get('args', ())
-            
-            future = executor.submit(scraper_func, *scraper_args)
-            future_to_scraper[future] = scraper_name
-        
-        # Collect results as they complete
-        for future in as_completed(future_to_scraper):
-            scraper_name = future_to_scraper[future]
-            
-            try:
-                jobs = future.result(timeout=120)  # 2min timeout per scraper
-                
-                if jobs and isinstance(jobs, list):
-                    all_jobs.extend(jobs)
-                    print(f"✅ {scraper_name}: {len(jobs)} vagas")
-                else:
-                    print(f"⚠️ {scraper_name}: 0 vagas")
-                    
-            except Exception as e:
-                print(f"❌ {scraper_name}: {type(e).__name__} - {str(e)[:100]}")
-    
-    return all_jobs
+    return ScraperScheduler().run(scrapers_config)["jobs"]
 
 
 def create_scraper_configs():
@@ -88,7 +58,7 @@ def create_scraper_configs():
         {"name": "Reddit", "scraper": lambda: RedditScraper().fetch_jobs(SEARCH_TERMS)},
         {"name": "HackerNews", "scraper": lambda: HackerNewsScraper().fetch_jobs(SEARCH_TERMS)},
         {"name": "TabNews", "scraper": lambda: TabNewsScraper().fetch_jobs(SEARCH_TERMS)},
-        {"name": "RSS", "scraper": lambda: RssScraper().fetch_jobs(SEARCH_TERMS)},
+        {"name": "RSS", "scraper": lambda: RssScraper().fetch_all(SEARCH_TERMS)},
         {"name": "RemoteOK", "scraper": lambda: RemoteOKScraper().fetch_jobs(SEARCH_TERMS)},
         {"name": "Remotive", "scraper": lambda: RemotiveScraper().fetch_jobs(SEARCH_TERMS)},
         {"name": "BuscoJobs", "scraper": lambda: BuscoJobsScraper().fetch_jobs(SEARCH_TERMS)},
@@ -0,0 +1,296 @@
+# -*- coding: utf-8 -*-
+"""
+Browser Pool - Instâncias Chrome reaproveitadas pelos scrapers Selenium.
+
+Antes cada fetch_jobs abria (e fechava) o próprio Chrome e esperava com
+time.sleep fixo. O pool mantém drivers aquecidos e entrega uma aba nova por uso:
+
+    from browser_pool import get_pool, wait_for_any, scroll_to_load
+
+    with get_pool().page() as driver:
+        driver.get(url)
+        cards = wait_for_any(driver, ".job-card, article")
+        scroll_to_load(driver, rounds=2)
+
+- Uma aba por uso, fechada na devolução; com isolate=True os cookies de todos
+  os domínios são limpos via CDP (Network.clearBrowserCookies).
+  isolate=False mantém a sessão do driver para o próximo uso (login do LinkedIn).
+- Driver reciclado após BROWSER_MAX_PAGES páginas ou se a memória do Chrome
+  crescer mais que BROWSER_MAX_MEMORY_GROWTH_MB (requer psutil, opcional).
+- Esperas por evento (WebDriverWait) em vez de sleeps fixos.
+"""
+
+import atexit
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional
+
+from config import (
+    BROWSER_POOL_SIZE, BROWSER_MAX_PAGES, BROWSER_MAX_MEMORY_GROWTH_MB,
+    BROWSER_WAIT_TIMEOUT, REQUEST_HEADERS
+)
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+logger = logging.getLogger("BrowserPool")
+
+
+# ==================== FÁBRICAS DE DRIVER ====================
+
+def headless_chrome():
+    """Chrome headless padrão (Selenium)."""
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+
+    options = Options()
+    options.add_argument('--headless')
+    options.add_argument('--no-sandbox')
+    options.add_argument('--disable-dev-shm-usage')
+    options.add_argument('--disable-blink-features=AutomationControlled')
+    options.add_argument(f"user-agent={REQUEST_HEADERS['User-Agent']}")
+    return webdriver.Chrome(options=options)
+
+
+def stealth_chrome():
+    """Chrome com undetected-chromedriver (sem headless, mais stealth)."""
+    import undetected_chromedriver as uc
+
+    options = uc.ChromeOptions()
+    options.add_argument('--no-sandbox')
+    options.add_argument('--disable-dev-shm-usage')
+    options.add_argument('--disable-blink-features=AutomationControlled')
+    options.add_argument('--start-maximized')
+
+    driver = uc.Chrome(options=options)
+    driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+    return driver
+
+
+# ==================== POOL ====================
+
+class PooledBrowser:
+    """Driver do pool + contadores para reciclagem."""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.base_handle = driver.current_window_handle
+        self.pages = 0
+        self.baseline_mb = memory_mb(driver)
+
+
+class BrowserPool:
+    """Pool de drivers Chrome aquecidos (thread-safe)."""
+
+    def __init__(self, factory: Callable = None, size: int = None,
+                 max_pages: int = None, max_memory_growth_mb: float = None):
+        self.factory = factory or headless_chrome
+        self.size = size or BROWSER_POOL_SIZE
+        self.max_pages = max_pages or BROWSER_MAX_PAGES
+        self.max_memory_growth_mb = (
+            BROWSER_MAX_MEMORY_GROWTH_MB if max_memory_growth_mb is None else max_memory_growth_mb
+        )
+        self._idle: List[PooledBrowser] = []
+        self._all: List[PooledBrowser] = []
+        self._cond = threading.Condition()
+        self._closed = False
+        self.stats = {"started": 0, "recycled": 0, "pages": 0}
+
+    @contextmanager
+    def page(self, isolate: bool = True):
+        """Empresta uma aba nova de um driver aquecido."""
+        browser = self._acquire()
+        healthy = True
+        try:
+            browser.driver.switch_to.new_window('tab')
+            yield browser.driver
+        except Exception:
+            healthy = _is_alive(browser.driver)
+            raise
+        finally:
+            browser.pages += 1
+            with self._cond:
+                self.stats["pages"] += 1
+            if healthy:
+                healthy = self._close_tab(browser, isolate)
+            self._release(browser, healthy)
+
+    def close(self):
+        """Encerra todos os drivers."""
+        with self._cond:
+            self._closed = True
+            browsers, self._all, self._idle = self._all, [], []
+            self._cond.notify_all()
+        for browser in browsers:
+            _quit(browser.driver)
+
+    # ==================== INTERNOS ====================
+
+    def _acquire(self) -> PooledBrowser:
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise RuntimeError("BrowserPool encerrado")
+                if self._idle:
+                    return self._idle.pop()
+                if len(self._all) < self.size:
+                    # Reserva a vaga antes de iniciar o Chrome (fora do lock)
+                    self._all.append(None)
+                    break
+                self._cond.wait()
+
+        try:
+            browser = PooledBrowser(self.factory())
+        except Exception:
+            with self._cond:
+                self._all.remove(None)
+                self._cond.notify()
+            raise
+
+        with self._cond:
+            self._all[self._all.index(None)] = browser
+            self.stats["started"] += 1
+        return browser
+
+    def _release(self, browser: PooledBrowser, healthy: bool):
+        recycle = not healthy or browser.pages >= self.max_pages or self._memory_exceeded(browser)
+        with self._cond:
+            if recycle or self._closed:
+                if browser in self._all:
+                    self._all.remove(browser)
+                if recycle:
+                    self.stats["recycled"] += 1
+            else:
+                self._idle.append(browser)
+            self._cond.notify()
+        if recycle or self._closed:
+            logger.debug(f"Reciclando driver após {browser.pages} páginas")
+            _quit(browser.driver)
+
+    @staticmethod
+    def _close_tab(browser: PooledBrowser, isolate: bool) -> bool:
+        """Fecha a aba emprestada e volta para a aba base. False se o driver morreu."""
+        try:
+            driver = browser.driver
+            if isolate:
+                _clear_cookies(driver)
+            for handle in driver.window_handles:
+                if handle != browser.base_handle:
+                    driver.switch_to.window(handle)
+                    driver.close()
+            driver.switch_to.window(browser.base_handle)
+            return True
+        except Exception:
+            return False
+
+    def _memory_exceeded(self, browser: PooledBrowser) -> bool:
+        if browser.baseline_mb is None:
+            return False
+        current = memory_mb(browser.driver)
+        return current is not None and current - browser.baseline_mb > self.max_memory_growth_mb
+
+
+# ==================== ESPERAS POR EVENTO ====================
+
+def wait_for_any(driver, css_selector: str, timeout: float = None) -> list:
+    """Espera aparecer algum elemento do seletor. Retorna [] no timeout."""
+    from selenium.common.exceptions import TimeoutException
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.webdriver.support.ui import WebDriverWait
+
+    try:
+        return WebDriverWait(driver, timeout or BROWSER_WAIT_TIMEOUT).until(
+            EC.presence_of_all_elements_located((By.CSS_SELECTOR, css_selector))
+        )
+    except TimeoutException:
+        return []
+
+
+def scroll_to_load(driver, rounds: int = 3, timeout: float = 3) -> None:
+    """Rola até o fim e espera a página crescer (lazy loading); para quando não cresce mais."""
+    from selenium.common.exceptions import TimeoutException
+    from selenium.webdriver.support.ui import WebDriverWait
+
+    for _ in range(rounds):
+        height = driver.execute_script("return document.body.scrollHeight")
+        driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+        try:
+            WebDriverWait(driver, timeout, poll_frequency=0.2).until(
+                lambda d: d.execute_script("return document.body.scrollHeight") > height
+            )
+        except TimeoutException:
+            break
+
+
+# ==================== HELPERS ====================
+
+def memory_mb(driver) -> Optional[float]:
+    """RSS (MB) do chromedriver + processos Chrome filhos. None sem psutil."""
+    if not psutil:
+        return None
+    try:
+        process = psutil.Process(driver.service.process.pid)
+        processes = [process] + process.children(recursive=True)
+        return sum(p.memory_info().rss for p in processes) / (1024 * 1024)
+    except Exception:
+        return None
+
+
+def _is_alive(driver) -> bool:
+    try:
+        driver.current_window_handle
+        return True
+    except Exception:
+        return False
+
+
+def _quit(driver):
+    try:
+        driver.quit()
+    except Exception:
+        pass
+
+
+def _clear_cookies(driver):
+    """
+    Limpa os cookies de todos os domínios. delete_all_cookies() só alcança o
+    domínio da aba atual, então o CDP (Chrome) é o caminho principal.
+    """
+    if hasattr(driver, "execute_cdp_cmd"):
+        driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+    else:
+        driver.delete_all_cookies()
+
+
+# ==================== POOLS COMPARTILHADOS ====================
+
+_pools: Dict[str, BrowserPool] = {}
+_pools_lock = threading.Lock()
+
+_FACTORIES = {
+    "headless": headless_chrome,
+    "stealth": stealth_chrome,
+}
+
+
+def get_pool(kind: str = "headless") -> BrowserPool:
+    """Pool compartilhado do processo ('headless' ou 'stealth')."""
+    with _pools_lock:
+        pool = _pools.get(kind)
+        if pool is None:
+            pool = BrowserPool(factory=_FACTORIES[kind], size=1 if kind == "stealth" else None)
+            _pools[kind] = pool
+        return pool
+
+
+@atexit.register
+def close_all():
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+"""
+Chave Canônica de Vagas - Normalização na entrada do pipeline.
+
+A mesma vaga chega pelo JobSpy/LinkedIn, Indeed e Gupy com URLs diferentes,
+parâmetros de rastreamento e emojis no título (🟣 🟢 🔵 🎓 📱). Aqui cada vaga
+ganha uma canonical_key: hash de título + empresa normalizados (sem emoji,
+acento, pontuação e sufixo societário); sem empresa real ("Confidencial",
+"N/A"), título + link canônico (sem utm_*, trackingId, refId, ...).
+
+O link original não é alterado: é ele que vai para o banco e para as
+notificações. O banco indexa a chave, então o dedupe exato vira uma consulta
+indexada.
+"""
+
+import hashlib
+import re
+import unicodedata
+from typing import Dict
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# Rastreadores conhecidos (anúncios, e-mail marketing, LinkedIn). Nomes genéricos
+# (ref, src, from, position...) ficam: em alguns sites identificam a vaga.
+TRACKING_PARAMS = {
+    "fbclid", "gclid", "gclsrc", "dclid", "msclkid", "mc_cid", "mc_eid", "_hsenc", "_hsmi",
+    "refid", "trk", "trkinfo", "trackingid", "tracking_id", "lipi", "ebp", "originalsubdomain",
+}
+
+# Empresas que não identificam o anunciante (normalizadas por normalize_company)
+PLACEHOLDER_COMPANIES = {
+    "confidencial", "empresa confidencial", "sigilosa", "empresa sigilosa", "confidential",
+    "na", "nd", "nao informado", "nao informada", "nao divulgado", "nao divulgada",
+    "anonima", "unknown", "undisclosed", "none", "null",
+}
+
+# Sufixos societários removidos do fim do nome da empresa
+LEGAL_SUFFIXES = {
+    "ltda", "sa", "me", "epp", "eireli", "inc", "llc", "ltd", "corp", "gmbh", "limited",
+}
+
+_INVISIBLE = {"\u200d", "\ufe0f", "\ufe0e"}  # zero-width joiner / seletores de variação
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+
+
+def strip_decoration(text: str) -> str:
+    """Remove emojis/símbolos e espaços repetidos: '🟣  Dev  Jr 🚀' → 'Dev Jr'."""
+    cleaned = "".join(
+        ch for ch in str(text or "")
+        if ch not in _INVISIBLE and unicodedata.category(ch) not in ("So", "Sk", "Cs", "Co")
+    )
+    return " ".join(cleaned.split())
+
+
+def _fold(text: str) -> str:
+    """Minúsculas, sem acentos."""
+    text = unicodedata.normalize("NFKD", text.lower())
+    return "".join(ch for ch in text if not unicodedata.combining(ch))
+
+
+def normalize_title(titulo: str) -> str:
+    return _NON_ALNUM.sub(" ", _fold(strip_decoration(titulo))).strip()
+
+
+def normalize_company(empresa: str) -> str:
+    """'ACME Tecnologia S/A.' → 'acme tecnologia'."""
+    text = _fold(strip_decoration(empresa))
+    text = re.sub(r"[./]", "", text)  # S.A. / S/A / Ltda. viram 'sa' / 'ltda'
+    tokens = _NON_ALNUM.sub(" ", text).split()
+    while len(tokens) > 1 and tokens[-1] in LEGAL_SUFFIXES:
+        tokens.pop()
+    return " ".join(tokens)
+
+
+def canonical_url(link: str) -> str:
+    """
+    Link sem rastreamento, fragmento, 'www.' e barra final (parâmetros úteis ficam).
+    Fragmentos de rota de SPA ('#/vaga/123', '#!/vaga/123') identificam a vaga e ficam.
+    """
+    link = str(link or "").strip()
+    if not link:
+        return link
+    try:
+        parts = urlsplit(link)
+    except ValueError:
+        return link
+    if not parts.scheme or not parts.netloc:
+        return link
+
+    host = parts.netloc.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    query = urlencode(sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith("utm_")
+    ))
+    path = parts.path.rstrip("/") or "/"
+    fragment = parts.fragment if parts.fragment.startswith(("/", "!/")) else ""
+    return urlunsplit((parts.scheme.lower(), host, path, query, fragment))
+
+
+def canonical_key(job: Dict) -> str:
+    """
+    Hash de título + empresa normalizados ('' se não houver título). Sem empresa
+    real, o link entra no lugar: 'Estágio TI' de duas empresas confidenciais
+    não é a mesma vaga ('' se também não houver link).
+    """
+    title = normalize_title(job.get("titulo", ""))
+    if not title:
+        return ""
+    company = normalize_company(job.get("empresa", ""))
+    if not company or company in PLACEHOLDER_COMPANIES:
+        link = canonical_url(job.get("link", ""))
+        if not link:
+            return ""
+        company = f"link:{link}"
+    signature = f"{title}|{company}"
+    return hashlib.blake2b(signature.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def canonicalize_job(job: Dict) -> Dict:
+    """Estágio de entrada: grava a canonical_key (in-place, link original intacto)."""
+    job["canonical_key"] = canonical_key(job)
+    return job
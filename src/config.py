@@ -138,6 +138,83 @@ CSV_PATH = os.path.join(DATA_DIR, OUTPUT_FILENAME)
 
 # SQLite Database Path (Memory-efficient storage)
 DB_PATH = os.path.join(DATA_DIR, "jobs.db")
+DB_READ_POOL_SIZE = 4       # Conexões de leitura mantidas abertas (database.ConnectionManager)
+DB_STATEMENT_CACHE = 256    # Statements preparados em cache por conexão
+
+# Perfil de armazenamento SQLite (aplicado em cada conexão do JobDatabase).
+# WAL: o hunter grava enquanto a API e o dashboard leem, sem um bloquear o outro.
+DB_PRAGMAS = {
+    "journal_mode": os.getenv("DB_JOURNAL_MODE", "WAL"),
+    "synchronous": "NORMAL",      # Seguro com WAL (fsync só no checkpoint)
+    "busy_timeout": 5000,         # ms esperando um lock antes de SQLITE_BUSY
+    "cache_size": -65536,         # 64 MB de page cache (negativo = KiB)
+    "mmap_size": 268435456,       # 256 MB lidos via mmap
+    "temp_store": "MEMORY",
+}
+DB_MAINTENANCE_INTERVAL = 6 * 3600  # s entre wal_checkpoint(TRUNCATE) + PRAGMA optimize
+
+# Índice de similaridade MinHash-LSH (src/similarity.py) para o dedupe fuzzy.
+# Limiar aproximado de Jaccard = (1/BANDS) ** (1/(NUM_PERM/BANDS)) ≈ 0.5 com 64/16.
+# Mais faixas = mais recall; menos faixas = mais precisão. Mudar reindexa o banco.
+SIMILARITY_NUM_PERM = 64
+SIMILARITY_BANDS = 16
+SIMILARITY_SHINGLE_SIZE = 3     # Shingles de 3 caracteres
+
+# Cache de scores por texto normalizado (src/score_cache.py)
+SCORE_CACHE_PATH = os.path.join(DATA_DIR, "score_cache.db")
+SCORE_CACHE_SIZE = 10000         # Entradas no LRU em memória
+SCORE_CACHE_MAX_AGE_DAYS = 30    # Entradas mais antigas são descartadas
+
+# Rescoring da tabela jobs (python src/rescore.py)
+RESCORE_CHUNK_SIZE = 5000       # Linhas lidas/gravadas por transação
+RESCORE_WORKERS = os.cpu_count() or 1  # Processos pontuando em paralelo
+
+# Camada HTTP compartilhada (src/http_client.py)
+HTTP_CACHE_PATH = os.path.join(DATA_DIR, "http_cache.db")  # Cache de respostas em disco
+HTTP_CACHE_TTL = 300          # Segundos em que uma resposta é servida sem revalidar
+HTTP_CACHE_MAX_AGE_DAYS = 7   # Entradas mais antigas são descartadas
+HTTP_POOL_SIZE = 10           # Conexões keep-alive por host
+HTTP_MAX_RETRIES = 1          # Retentativas em erro de conexão
+
+# Rate limiting por host (src/rate_limiter.py)
+# capacity = rajada permitida, per_second = reposição de tokens.
+# Os headers X-RateLimit-* / Retry-After do servidor ajustam os baldes em tempo real.
+RATE_LIMITS = {
+    "api.github.com": {"capacity": 10, "per_second": 10 / 60},   # Search API: 10 req/min sem token
+    "discord.com": {"capacity": 5, "per_second": 0.5},           # Webhook: rajada de 5, ~30/min
+    "api.telegram.org": {"capacity": 20, "per_second": 1},
+    "www.reddit.com": {"capacity": 10, "per_second": 1},
+    "www.empregos.com.br": {"capacity": 1, "per_second": 0.5},   # 1 página a cada 2s
+    "www.linkedin.com": {"capacity": 1, "per_second": 0.5},
+}
+RATE_LIMIT_MAX_WAIT = 120     # Espera máxima por cota antes de desistir (segundos)
+
+# GitHub Search: repositórios agrupados por query + coleta incremental (updated:>)
+GITHUB_QUERY_MAX_LENGTH = 256      # Limite de caracteres da query de busca
+GITHUB_PER_PAGE = 100              # Máximo permitido pela Search API
+GITHUB_MAX_PAGES = 10              # Search API só expõe os 1000 primeiros resultados
+GITHUB_INITIAL_LOOKBACK_DAYS = 30  # Janela da primeira coleta (sem estado salvo)
+GITHUB_STATE_PATH = os.path.join(DATA_DIR, "github_state.json")
+
+# JobSpy: matriz termo × local × site em paralelo + cache curto de resultados
+JOBSPY_MAX_WORKERS = 6
+JOBSPY_SITE_CONCURRENCY = {      # Consultas simultâneas por site
+    "linkedin": 2,               # LinkedIn bloqueia rajadas rapidamente
+    "indeed": 3,
+    "google": 2,
+}
+JOBSPY_HOURS_OLD = 72            # Janela de publicação (últimos 3 dias)
+JOBSPY_CACHE_TTL = 1800          # Segundos em que uma combinação não é refeita
+
+# Pool de navegadores Selenium (src/browser_pool.py)
+BROWSER_POOL_SIZE = 2                # Chromes headless aquecidos
+BROWSER_MAX_PAGES = 50               # Recicla o driver após N páginas
+BROWSER_MAX_MEMORY_GROWTH_MB = 300   # ...ou se a memória crescer mais que isso (psutil)
+BROWSER_WAIT_TIMEOUT = 10            # Espera máxima por elementos (segundos)
+
+# Hacker News: itens buscados em paralelo + cache persistente de IDs já vistos
+HN_MAX_WORKERS = 8
+HN_ITEMS_CACHE_PATH = os.path.join(DATA_DIR, "hn_items.json")
 
 
 
@@ -164,20 +241,38 @@ RSS_FEEDS = {
 # Discord Webhook (Notificações) - From environment variable
 DISCORD_WEBHOOK_URL = os.getenv("DISCORD_WEBHOOK_URL", "")
 
-# Keywords de "Vaga Perfeita" (Prioridade Alta)
-GOLD_KEYWORDS = [
-    'python',
-    'cybersecurity',
-    'segurança',
-    'pentest',
-    'redes',
-    'linux'
-]
+# Regras de scoring/blacklists/gold keywords (src/scoring_rules.py)
+# Editar o arquivo com o hunter rodando: as regras são recarregadas sozinhas.
+SCORING_RULES_PATH = os.getenv(
+    "SCORING_RULES_PATH",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "scoring_rules.json"),
+)
+SCORING_RULES_POLL_SECONDS = 5   # Intervalo de checagem do arquivo
 
 # Intervalo de loop (minutos)
 HUNTER_SLEEP_MIN = 15
 HUNTER_SLEEP_MAX = 30
 
+# Scheduler paralelo (segundos)
+SCRAPER_TIMEOUT_DEFAULT = 300    # Deadline padrão por fonte
+SCRAPER_TIMEOUTS = {             # Fontes lentas ganham mais tempo
+    "GitHub": 240,
+    "JobSpy": 900,
+}
+CYCLE_BUDGET_SECONDS = 1200      # Orçamento total do ciclo (20 min)
+
+# Polling adaptativo por fonte (minutos)
+# Fontes com muitas vagas novas são consultadas mais vezes, fontes paradas menos.
+POLL_INTERVAL_MIN = 10
+POLL_INTERVAL_MAX = 360
+POLL_TARGET_NEW_JOBS = 5         # Vagas novas esperadas por coleta
+POLL_HISTORY_SIZE = 20           # Coletas recentes usadas na estimativa
+
+# Pipeline em streaming (scrapers -> fila -> filtros/score -> SQLite)
+PIPELINE_QUEUE_SIZE = 500        # Vagas pendentes antes de segurar os scrapers
+PIPELINE_BATCH_SIZE = 50         # Vagas por micro-lote gravado
+PIPELINE_FLUSH_SECONDS = 5       # Grava o lote parcial após N segundos
+
 # Persistência
 SENT_JOBS_FILE = "data/sent_jobs.txt"
 LOG_FILE = "logs/hunter.log"
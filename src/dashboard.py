@@ -9,7 +9,8 @@ import pandas as pd
 import os
 from math import ceil
 from datetime import datetime, timedelta
-from config import GOLD_KEYWORDS, DATA_DIR, OUTPUT_FILENAME, LOG_FILE
+from config import DATA_DIR, OUTPUT_FILENAME, LOG_FILE
+from scoring_rules import current_rules
 import base64
 
 # --- PAGE CONFIG ---
@@ -342,7 +343,25 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 # --- DATA LOGIC ---
-from config import DB_PATH
+from config import DB_PATH, DB_PRAGMAS
+
+SEARCH_LIMIT = 1000  # resultados da busca FTS considerados no painel
+
+@st.cache_resource
+def get_database():
+    # Só leitura: o painel não roda migrações nem disputa o writer do hunter
+    from database import JobDatabase
+    return JobDatabase(DB_PATH, read_only=True)
+
+@st.cache_data(ttl=60)
+def search_links(query: str) -> tuple:
+    """Links das vagas que casam com a busca (mais relevante primeiro) e se a lista foi cortada."""
+    try:
+        jobs = get_database().search_jobs(query, limit=SEARCH_LIMIT + 1)
+    except Exception as e:
+        st.error(f"Erro na busca: {e}")
+        return [], False
+    return [job['link'] for job in jobs[:SEARCH_LIMIT]], len(jobs) > SEARCH_LIMIT
 
 @st.cache_data(ttl=300)
 def load_data():
@@ -353,7 +372,8 @@ def load_data():
     if os.path.exists(DB_PATH):
         try:
             import sqlite3
-            conn = sqlite3.connect(DB_PATH)
+            conn = sqlite3.connect(f"file:{DB_PATH}?mode=ro", uri=True,
+                                   timeout=DB_PRAGMAS["busy_timeout"] / 1000)
             df = pd.read_sql_query("SELECT * FROM jobs ORDER BY created_at DESC", conn)
             conn.close()
         except Exception as e:
@@ -411,7 +431,8 @@ df = load_data()
 
 # Process Tags
 if not df.empty:
-    df['is_gold'] = df['titulo'].apply(lambda x: any(kw.lower() in str(x).lower() for kw in GOLD_KEYWORDS))
+    gold_rules = current_rules()
+    df['is_gold'] = df['titulo'].apply(lambda x: gold_rules.gold_score(x) > 0)
     df['tag'] = df['titulo'].apply(get_seniority_tag)
     
     # --- BLACKLIST LOGIC ---
@@ -607,9 +628,14 @@ query = st.text_input("QUERY_DB", placeholder="Buscar por tecnologia, empresa...
 filtered_df = df.copy()
 
 if query:
-    mask = filtered_df['titulo'].str.contains(query, case=False, na=False) | \
-           filtered_df['empresa'].str.contains(query, case=False, na=False)
-    filtered_df = filtered_df[mask]
+    # Busca no índice FTS5 (prefixo, sem acento, ranking BM25) em vez de varrer o DataFrame
+    links, truncated = search_links(query)
+    rank = {link: i for i, link in enumerate(links)}
+    filtered_df = filtered_df[filtered_df['link'].isin(rank)]
+    if truncated:
+        st.warning(f"A busca encontrou mais de {SEARCH_LIMIT} vagas; mostrando só as {SEARCH_LIMIT} "
+                   "mais relevantes. Refine os termos para ver o resto.")
+    filtered_df = filtered_df.sort_values('link', key=lambda links: links.map(rank))
 
 if sel_loc != "Todas":
     loc_map = {
@@ -8,8 +8,16 @@ import sqlite3
 import json
 import os
 import logging
-from typing import Dict, List, Optional
+import re
+import queue
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
 from datetime import datetime, timedelta
+from urllib.request import pathname2url
+
+from canonical import canonical_key
+from similarity import LSHIndex, get_hasher, jaccard, normalize_signature, shingles
 
 try:
     from fuzzywuzzy import fuzz
@@ -19,31 +27,231 @@ except ImportError:
 logger = logging.getLogger("JobDatabase")
 
 
+# Full-text index over the searchable columns (external content = jobs)
+FTS_SCHEMA = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5(
+        titulo, empresa, localizacao, tags,
+        content='jobs', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS jobs_fts_ai AFTER INSERT ON jobs BEGIN
+        INSERT INTO jobs_fts (rowid, titulo, empresa, localizacao, tags)
+        VALUES (new.id, new.titulo, new.empresa, new.localizacao, new.tags);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS jobs_fts_ad AFTER DELETE ON jobs BEGIN
+        INSERT INTO jobs_fts (jobs_fts, rowid, titulo, empresa, localizacao, tags)
+        VALUES ('delete', old.id, old.titulo, old.empresa, old.localizacao, old.tags);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS jobs_fts_au AFTER UPDATE OF titulo, empresa, localizacao, tags ON jobs BEGIN
+        INSERT INTO jobs_fts (jobs_fts, rowid, titulo, empresa, localizacao, tags)
+        VALUES ('delete', old.id, old.titulo, old.empresa, old.localizacao, old.tags);
+        INSERT INTO jobs_fts (rowid, titulo, empresa, localizacao, tags)
+        VALUES (new.id, new.titulo, new.empresa, new.localizacao, new.tags);
+    END
+    """,
+]
+
+# BM25 column weights: titulo, empresa, localizacao, tags
+FTS_RANK = "bm25(jobs_fts, 10.0, 5.0, 2.0, 1.0)"
+
+
+def build_fts_query(text: str) -> str:
+    """
+    Turn free text into a safe FTS5 MATCH expression: every word becomes a
+    quoted prefix term ('python jr' -> '"python"* "jr"*'), so user input can
+    never inject FTS operators.
+    """
+    return " ".join(f'"{term}"*' for term in re.findall(r"\w+", text or ""))
+
+
+def _is_match(current_sig: str, candidate_sig: str, threshold: int) -> bool:
+    """Final check for an LSH candidate: token_set_ratio, or shingle Jaccard without fuzzywuzzy."""
+    if fuzz:
+        return fuzz.token_set_ratio(current_sig, candidate_sig) > threshold
+    return jaccard(shingles(normalize_signature(current_sig, "")),
+                   shingles(normalize_signature(candidate_sig, ""))) * 100 > threshold
+
+
+class ConnectionManager:
+    """
+    Long-lived SQLite connections shared by all threads of a process.
+    
+    - One writer connection, serialized by an RLock (SQLite allows a single
+      writer anyway); the transaction is committed when the block exits.
+    - A pool of reader connections, handed out one per block.
+    - Each connection keeps a prepared-statement cache (cached_statements),
+      so repeated queries skip SQL parsing.
+    - Each connection gets the storage profile (DB_PRAGMAS: WAL, synchronous,
+      mmap/cache sizes, busy timeout) when it is opened.
+    - read_only=True opens every connection with mode=ro + query_only, for
+      processes that must never compete with the hunter's writer.
+    """
+    
+    def __init__(self, db_path: str, pool_size: int = None, cached_statements: int = None,
+                 pragmas: Dict = None, read_only: bool = False):
+        from config import DB_READ_POOL_SIZE, DB_STATEMENT_CACHE, DB_PRAGMAS
+        
+        self.db_path = db_path
+        self.read_only = read_only
+        self.cached_statements = cached_statements or DB_STATEMENT_CACHE
+        self.pragmas = dict(DB_PRAGMAS if pragmas is None else pragmas)
+        if read_only:
+            # The journal mode belongs to the writer; a read-only connection cannot set it
+            self.pragmas.pop("journal_mode", None)
+            self.pragmas["query_only"] = 1
+        self._write_lock = threading.RLock()
+        self._writer: Optional[sqlite3.Connection] = None
+        self._readers: queue.LifoQueue = queue.LifoQueue(maxsize=pool_size or DB_READ_POOL_SIZE)
+        self._closed = False
+    
+    def _connect(self) -> sqlite3.Connection:
+        target = f"file:{pathname2url(os.path.abspath(self.db_path))}?mode=ro" if self.read_only else self.db_path
+        conn = sqlite3.connect(
+            target,
+            timeout=self.pragmas.get("busy_timeout", 5000) / 1000,
+            check_same_thread=False,
+            cached_statements=self.cached_statements,
+            uri=self.read_only
+        )
+        conn.row_factory = sqlite3.Row
+        self._apply_pragmas(conn)
+        return conn
+    
+    def _apply_pragmas(self, conn: sqlite3.Connection):
+        """Apply the storage profile; unknown or unsupported values are logged, not fatal."""
+        for name, value in self.pragmas.items():
+            try:
+                row = conn.execute(f"PRAGMA {name} = {value}").fetchone()
+            except sqlite3.Error as e:
+                logger.warning(f"PRAGMA {name}={value} failed: {e}")
+                continue
+            if name == "journal_mode" and row and str(row[0]).lower() != str(value).lower():
+                # e.g. WAL is not available on some network filesystems
+                logger.warning(f"journal_mode={value} not applied (using {row[0]})")
+    
+    @contextmanager
+    def writer(self) -> Iterator[sqlite3.Connection]:
+        """Exclusive access to the writer connection (commit on success, rollback on error)."""
+        with self._write_lock:
+            if self._writer is None:
+                self._writer = self._connect()
+            conn = self._writer
+            try:
+                yield conn
+                conn.commit()
+            except BaseException:
+                conn.rollback()
+                raise
+    
+    @contextmanager
+    def reader(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a reader connection from the pool."""
+        try:
+            conn = self._readers.get_nowait()
+        except queue.Empty:
+            conn = self._connect()
+        try:
+            yield conn
+        finally:
+            if conn.in_transaction:
+                conn.rollback()
+            try:
+                if self._closed:
+                    raise queue.Full
+                self._readers.put_nowait(conn)
+            except queue.Full:
+                conn.close()
+    
+    def close(self):
+        """Close every pooled connection."""
+        self._closed = True
+        with self._write_lock:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+        while True:
+            try:
+                self._readers.get_nowait().close()
+            except queue.Empty:
+                break
+
+
 class JobDatabase:
     """SQLite database for job storage with efficient querying."""
     
-    def __init__(self, db_path: str = None):
+    def __init__(self, db_path: str = None, read_only: bool = False):
+        """
+        read_only=True (dashboard, reports): no schema setup or migrations and
+        read-only connections; the database must already exist.
+        """
         if db_path is None:
             from config import DB_PATH
             db_path = db_path or DB_PATH
         
         self.db_path = db_path
-        self._ensure_dir()
-        self._init_db()
+        self.read_only = read_only
+        self._connections = ConnectionManager(db_path, read_only=read_only)
+        self._last_maintenance: Optional[datetime] = None
+        self.has_fts = False
+        if read_only:
+            with self._read() as conn:
+                self.has_fts = conn.execute(
+                    "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'jobs_fts'"
+                ).fetchone() is not None
+        else:
+            self._ensure_dir()
+            self._init_db()
     
     def _ensure_dir(self):
         """Ensure data directory exists."""
         os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
     
-    def _get_conn(self) -> sqlite3.Connection:
-        """Get a database connection with row factory."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        return conn
+    def _read(self):
+        """Pooled read-only connection (context manager)."""
+        return self._connections.reader()
+    
+    def _write(self):
+        """Shared writer connection; commits when the block exits."""
+        return self._connections.writer()
+    
+    def close(self):
+        """Close all pooled connections."""
+        self._connections.close()
+    
+    def maintenance(self) -> Dict:
+        """
+        Periodic upkeep: fold the WAL back into the main file (so it does not
+        grow unbounded while readers are active) and refresh planner statistics.
+        """
+        with self._write() as conn:
+            busy, wal_pages, checkpointed = conn.execute(
+                "PRAGMA wal_checkpoint(TRUNCATE)"
+            ).fetchone()
+            conn.execute("PRAGMA optimize")
+        self._last_maintenance = datetime.now()
+        return {"busy": bool(busy), "wal_pages": wal_pages, "checkpointed": checkpointed}
+    
+    def maintenance_due(self, interval: int = None) -> bool:
+        """True when DB_MAINTENANCE_INTERVAL seconds passed since the last maintenance()."""
+        if interval is None:
+            from config import DB_MAINTENANCE_INTERVAL
+            interval = DB_MAINTENANCE_INTERVAL
+        last = self._last_maintenance
+        return last is None or (datetime.now() - last).total_seconds() >= interval
     
     def _init_db(self):
         """Initialize database schema."""
-        with self._get_conn() as conn:
+        with self._write() as conn:
+            had_rollups = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'stats_daily_platform'"
+            ).fetchone()
             conn.executescript("""
                 CREATE TABLE IF NOT EXISTS jobs (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -59,7 +267,8 @@ class JobDatabase:
                     tags TEXT DEFAULT '[]',
                     sent_discord BOOLEAN DEFAULT 0,
                     sent_telegram BOOLEAN DEFAULT 0,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    canonical_key TEXT
                 );
 
                 CREATE TABLE IF NOT EXISTS users (
@@ -73,13 +282,337 @@ class JobDatabase:
                     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
                 );
                 
+                CREATE TABLE IF NOT EXISTS source_fetches (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    source TEXT NOT NULL,
+                    fetched_at TEXT NOT NULL,
+                    status TEXT DEFAULT 'ok',
+                    jobs_found INTEGER DEFAULT 0,
+                    jobs_new INTEGER DEFAULT 0
+                );
+                
+                -- MinHash-LSH buckets of the title+company signature (similarity.py)
+                CREATE TABLE IF NOT EXISTS job_lsh (
+                    band INTEGER NOT NULL,
+                    bucket INTEGER NOT NULL,
+                    job_id INTEGER NOT NULL,
+                    PRIMARY KEY (band, bucket, job_id)
+                ) WITHOUT ROWID;
+                
+                CREATE TABLE IF NOT EXISTS meta (
+                    key TEXT PRIMARY KEY,
+                    value TEXT
+                );
+                
+                -- Rollups for /api/v1/stats, kept in step by add_job(s) (day = UTC date of created_at)
+                CREATE TABLE IF NOT EXISTS stats_daily_platform (
+                    day TEXT NOT NULL,
+                    plataforma TEXT NOT NULL,
+                    jobs INTEGER NOT NULL DEFAULT 0,
+                    PRIMARY KEY (day, plataforma)
+                ) WITHOUT ROWID;
+                
+                CREATE TABLE IF NOT EXISTS stats_daily_company (
+                    day TEXT NOT NULL,
+                    empresa TEXT NOT NULL,
+                    jobs INTEGER NOT NULL DEFAULT 0,
+                    PRIMARY KEY (day, empresa)
+                ) WITHOUT ROWID;
+                
                 CREATE INDEX IF NOT EXISTS idx_jobs_link ON jobs(link);
                 CREATE INDEX IF NOT EXISTS idx_jobs_titulo_empresa ON jobs(titulo, empresa);
                 CREATE INDEX IF NOT EXISTS idx_jobs_created_at ON jobs(created_at);
                 CREATE INDEX IF NOT EXISTS idx_jobs_sent ON jobs(sent_discord, sent_telegram);
                 CREATE INDEX IF NOT EXISTS idx_users_email ON users(email);
+                CREATE INDEX IF NOT EXISTS idx_source_fetches_source ON source_fetches(source, fetched_at);
+            """)
+            self._migrate(conn)
+            self._init_fts(conn)
+            self._sync_similarity_index(conn)
+            if not had_rollups:
+                self._rebuild_stats_rollups(conn)
+    
+    def _init_fts(self, conn: sqlite3.Connection):
+        """Create the FTS5 index and its sync triggers (LIKE fallback without FTS5)."""
+        exists = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'jobs_fts'"
+        ).fetchone()
+        try:
+            for statement in FTS_SCHEMA:
+                conn.execute(statement)
+        except sqlite3.OperationalError as e:
+            logger.warning(f"FTS5 unavailable, search falls back to LIKE: {e}")
+            self.has_fts = False
+            return
+        if not exists:
+            # Index rows stored before the FTS table existed
+            conn.execute("INSERT INTO jobs_fts (jobs_fts) VALUES ('rebuild')")
+        self.has_fts = True
+    
+    def _migrate(self, conn: sqlite3.Connection):
+        """Bring databases created by older versions up to the current schema."""
+        columns = {row['name'] for row in conn.execute("PRAGMA table_info(jobs)")}
+        if 'canonical_key' not in columns:
+            conn.execute("ALTER TABLE jobs ADD COLUMN canonical_key TEXT")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_canonical_key ON jobs(canonical_key)")
+        
+        # Keyset pagination of the API feed (created_at, score, id) needs non-null scores.
+        # One-time full scan, recorded in meta so later opens (API, dashboard) skip it.
+        if not conn.execute("SELECT 1 FROM meta WHERE key = 'migrated_null_scores'").fetchone():
+            conn.execute("UPDATE jobs SET score = 0 WHERE score IS NULL")
+            conn.execute("INSERT INTO meta (key, value) VALUES ('migrated_null_scores', '1')")
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_jobs_feed
+            ON jobs(created_at DESC, score DESC, id DESC)
+        """)
+        
+        # Backfill rows stored before the column existed ('' = no usable key)
+        rows = conn.execute(
+            "SELECT id, titulo, empresa FROM jobs WHERE canonical_key IS NULL"
+        ).fetchall()
+        if rows:
+            conn.executemany(
+                "UPDATE jobs SET canonical_key = ? WHERE id = ?",
+                [(canonical_key(dict(row)), row['id']) for row in rows]
+            )
+    
+    # ==================== STATS ROLLUPS ====================
+    
+    def _update_stats_rollups(self, conn: sqlite3.Connection, jobs: List[Dict]):
+        """Add freshly inserted jobs to today's rollup rows (caller's transaction)."""
+        platforms: Dict[str, int] = {}
+        companies: Dict[str, int] = {}
+        for job in jobs:
+            platform = job.get('plataforma') or ''
+            company = job.get('empresa') or ''
+            platforms[platform] = platforms.get(platform, 0) + 1
+            companies[company] = companies.get(company, 0) + 1
+        
+        conn.executemany("""
+            INSERT INTO stats_daily_platform (day, plataforma, jobs) VALUES (date('now'), ?, ?)
+            ON CONFLICT (day, plataforma) DO UPDATE SET jobs = jobs + excluded.jobs
+        """, list(platforms.items()))
+        conn.executemany("""
+            INSERT INTO stats_daily_company (day, empresa, jobs) VALUES (date('now'), ?, ?)
+            ON CONFLICT (day, empresa) DO UPDATE SET jobs = jobs + excluded.jobs
+        """, list(companies.items()))
+    
+    def _rebuild_stats_rollups(self, conn: sqlite3.Connection):
+        conn.execute("DELETE FROM stats_daily_platform")
+        conn.execute("DELETE FROM stats_daily_company")
+        conn.execute("""
+            INSERT INTO stats_daily_platform (day, plataforma, jobs)
+            SELECT date(created_at), COALESCE(plataforma, ''), COUNT(*)
+            FROM jobs GROUP BY 1, 2
+        """)
+        conn.execute("""
+            INSERT INTO stats_daily_company (day, empresa, jobs)
+            SELECT date(created_at), COALESCE(empresa, ''), COUNT(*)
+            FROM jobs GROUP BY 1, 2
+        """)
+    
+    def rebuild_stats_rollups(self) -> int:
+        """
+        Recompute the rollups from the jobs table (backfill / repair).
+        Returns the number of rollup rows written.
+        """
+        with self._write() as conn:
+            self._rebuild_stats_rollups(conn)
+            self._bump_generation(conn)
+            return sum(
+                conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+                for table in ('stats_daily_platform', 'stats_daily_company')
+            )
+    
+    def get_stats(self, top: int = 5) -> Dict:
+        """Totals and top companies/platforms from the rollups; windowed counts via idx_jobs_created_at."""
+        with self._read() as conn:
+            total = conn.execute(
+                "SELECT COALESCE(SUM(jobs), 0) FROM stats_daily_platform"
+            ).fetchone()[0]
+            last_24h = conn.execute(
+                "SELECT COUNT(*) FROM jobs WHERE created_at >= datetime('now', '-1 day')"
+            ).fetchone()[0]
+            last_week = conn.execute(
+                "SELECT COUNT(*) FROM jobs WHERE created_at >= datetime('now', '-7 days')"
+            ).fetchone()[0]
+            top_companies = conn.execute("""
+                SELECT NULLIF(empresa, '') AS name, SUM(jobs) AS count
+                FROM stats_daily_company GROUP BY empresa
+                ORDER BY count DESC LIMIT ?
+            """, (top,)).fetchall()
+            top_platforms = conn.execute("""
+                SELECT NULLIF(plataforma, '') AS name, SUM(jobs) AS count
+                FROM stats_daily_platform GROUP BY plataforma
+                ORDER BY count DESC LIMIT ?
+            """, (top,)).fetchall()
+        return {
+            "total_jobs": total,
+            "jobs_last_24h": last_24h,
+            "jobs_last_week": last_week,
+            "top_companies": [dict(row) for row in top_companies],
+            "top_platforms": [dict(row) for row in top_platforms],
+        }
+    
+    # ==================== DATA GENERATION ====================
+    
+    def _bump_generation(self, conn: sqlite3.Connection):
+        """
+        Advance the data generation inside the caller's write transaction.
+        Readers (the API response cache) compare it to know when cached
+        results are stale.
+        """
+        conn.execute("""
+            INSERT INTO meta (key, value) VALUES ('generation', '1')
+            ON CONFLICT(key) DO UPDATE SET value = CAST(value AS INTEGER) + 1
+        """)
+    
+    def generation(self) -> int:
+        """Current data generation (0 before the first insert)."""
+        with self._read() as conn:
+            row = conn.execute("SELECT value FROM meta WHERE key = 'generation'").fetchone()
+            return int(row['value']) if row else 0
+    
+    def get_meta(self, key: str) -> Optional[str]:
+        with self._read() as conn:
+            row = conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+            return row['value'] if row else None
+    
+    def set_meta(self, key: str, value: Optional[str]) -> None:
+        """Store a meta value (None deletes the key)."""
+        with self._write() as conn:
+            if value is None:
+                conn.execute("DELETE FROM meta WHERE key = ?", (key,))
+            else:
+                conn.execute("""
+                    INSERT INTO meta (key, value) VALUES (?, ?)
+                    ON CONFLICT(key) DO UPDATE SET value = excluded.value
+                """, (key, value))
+    
+    # ==================== RESCORING ====================
+    
+    def iter_job_chunks(self, after_id: int = 0, size: int = 5000) -> Iterator[List[Dict]]:
+        """
+        Yield the jobs table in id order, `size` rows at a time. Each chunk is
+        a keyset query in its own short read, so no snapshot is held open
+        across the whole scan.
+        """
+        while True:
+            with self._read() as conn:
+                rows = conn.execute("""
+                    SELECT id, link, titulo, empresa, localizacao, plataforma,
+                           data_publicacao, data_coleta
+                    FROM jobs WHERE id > ? ORDER BY id LIMIT ?
+                """, (after_id, size)).fetchall()
+            if not rows:
+                return
+            after_id = rows[-1]['id']
+            yield [dict(row) for row in rows]
+    
+    def apply_scores(self, scores: List[Dict], checkpoint: Optional[str] = None) -> int:
+        """
+        Write back score/is_relevant/tags for a chunk of rescored jobs (dicts
+        with id, score, is_relevant, tags) through a temp table and a single
+        UPDATE ... FROM. Only rows whose values changed are touched, so the
+        FTS trigger and the API cache see real changes only.
+        
+        `checkpoint` is stored in meta 'rescore_checkpoint' in the same
+        transaction, so an interrupted run resumes exactly after this chunk.
+        Returns the number of rows updated.
+        """
+        with self._write() as conn:
+            conn.execute("""
+                CREATE TEMP TABLE IF NOT EXISTS rescored (
+                    id INTEGER PRIMARY KEY, score INTEGER, is_relevant INTEGER, tags TEXT
+                )
             """)
-            conn.commit()
+            conn.execute("DELETE FROM temp.rescored")
+            conn.executemany(
+                "INSERT INTO temp.rescored (id, score, is_relevant, tags) VALUES (?, ?, ?, ?)",
+                [(job['id'], job['score'], int(bool(job['is_relevant'])), json.dumps(job['tags']))
+                 for job in scores]
+            )
+            updated = conn.execute("""
+                UPDATE jobs SET score = r.score, is_relevant = r.is_relevant, tags = r.tags
+                FROM temp.rescored r
+                WHERE jobs.id = r.id
+                  AND (jobs.score IS NOT r.score OR jobs.is_relevant IS NOT r.is_relevant
+                       OR jobs.tags IS NOT r.tags)
+            """).rowcount
+            conn.execute("DELETE FROM temp.rescored")
+            if checkpoint is not None:
+                conn.execute("""
+                    INSERT INTO meta (key, value) VALUES ('rescore_checkpoint', ?)
+                    ON CONFLICT(key) DO UPDATE SET value = excluded.value
+                """, (checkpoint,))
+            if updated:
+                self._bump_generation(conn)
+            return updated
+    
+    # ==================== SIMILARITY INDEX ====================
+    
+    def _sync_similarity_index(self, conn: sqlite3.Connection) -> int:
+        """
+        Index jobs inserted since the last sync (id watermark in `meta`).
+        Runs inside the caller's write transaction; rebuilds from scratch when
+        the MinHash parameters changed.
+        """
+        hasher = get_hasher()
+        meta = dict(conn.execute(
+            "SELECT key, value FROM meta WHERE key IN ('lsh_params', 'lsh_indexed_id')"
+        ).fetchall())
+        watermark = int(meta.get('lsh_indexed_id') or 0)
+        if meta.get('lsh_params') != hasher.fingerprint:
+            conn.execute("DELETE FROM job_lsh")
+            watermark = 0
+        
+        rows = conn.execute(
+            "SELECT id, titulo, empresa FROM jobs WHERE id > ? ORDER BY id", (watermark,)
+        ).fetchall()
+        if rows:
+            conn.executemany(
+                "INSERT OR IGNORE INTO job_lsh (band, bucket, job_id) VALUES (?, ?, ?)",
+                [(band, bucket, row['id'])
+                 for row in rows
+                 for band, bucket in hasher.keys_for(row['titulo'], row['empresa'])]
+            )
+            watermark = rows[-1]['id']
+        
+        conn.executemany("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", [
+            ('lsh_params', hasher.fingerprint),
+            ('lsh_indexed_id', str(watermark)),
+        ])
+        return len(rows)
+    
+    def _similar_candidates(self, conn: sqlite3.Connection,
+                            keys_by_item: Dict[int, List]) -> Dict[int, List[Dict]]:
+        """
+        LSH lookup for many signatures at once: one join of the probe keys
+        against job_lsh, then one fetch of the candidate rows.
+        """
+        conn.execute("""
+            CREATE TEMP TABLE IF NOT EXISTS lsh_probe (
+                item INTEGER, band INTEGER, bucket INTEGER
+            )
+        """)
+        conn.execute("DELETE FROM temp.lsh_probe")
+        conn.executemany(
+            "INSERT INTO temp.lsh_probe (item, band, bucket) VALUES (?, ?, ?)",
+            [(item, band, bucket) for item, keys in keys_by_item.items() for band, bucket in keys]
+        )
+        cursor = conn.execute("""
+            SELECT DISTINCT p.item, j.id, j.link, j.titulo, j.empresa
+            FROM temp.lsh_probe p
+            JOIN job_lsh l ON l.band = p.band AND l.bucket = p.bucket
+            JOIN jobs j ON j.id = l.job_id
+        """)
+        candidates: Dict[int, List[Dict]] = {}
+        for row in cursor.fetchall():
+            candidates.setdefault(row['item'], []).append({
+                'id': row['id'], 'link': row['link'],
+                'titulo': row['titulo'], 'empresa': row['empresa'],
+            })
+        return candidates
     
     # ==================== JOB OPERATIONS ====================
     
@@ -89,12 +622,13 @@ class JobDatabase:
         Returns True if inserted, False if duplicate.
         """
         try:
-            with self._get_conn() as conn:
+            with self._write() as conn:
                 conn.execute("""
                     INSERT INTO jobs (
                         link, titulo, empresa, localizacao, plataforma,
-                        data_publicacao, data_coleta, score, is_relevant, tags
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                        data_publicacao, data_coleta, score, is_relevant, tags,
+                        canonical_key
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 """, (
                     job.get('link'),
                     job.get('titulo'),
@@ -105,9 +639,12 @@ class JobDatabase:
                     job.get('data_coleta'),
                     job.get('score', 0),
                     job.get('is_relevant', True),
-                    json.dumps(job.get('tags', []))
+                    json.dumps(job.get('tags', [])),
+                    job.get('canonical_key') or canonical_key(job)
                 ))
-                conn.commit()
+                self._sync_similarity_index(conn)
+                self._update_stats_rollups(conn, [job])
+                self._bump_generation(conn)
                 return True
         except sqlite3.IntegrityError:
             # Duplicate link
@@ -121,15 +658,16 @@ class JobDatabase:
         Add multiple jobs in a single transaction.
         Returns number of jobs successfully inserted.
         """
-        inserted = 0
-        with self._get_conn() as conn:
+        inserted = []
+        with self._write() as conn:
             for job in jobs:
                 try:
                     conn.execute("""
                         INSERT INTO jobs (
                             link, titulo, empresa, localizacao, plataforma,
-                            data_publicacao, data_coleta, score, is_relevant, tags
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                            data_publicacao, data_coleta, score, is_relevant, tags,
+                            canonical_key
+                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                     """, (
                         job.get('link'),
                         job.get('titulo'),
@@ -140,26 +678,41 @@ class JobDatabase:
                         job.get('data_coleta'),
                         job.get('score', 0),
                         job.get('is_relevant', True),
-                        json.dumps(job.get('tags', []))
+                        json.dumps(job.get('tags', [])),
+                        job.get('canonical_key') or canonical_key(job)
                     ))
-                    inserted += 1
+                    inserted.append(job)
                 except sqlite3.IntegrityError:
                     continue  # Skip duplicates
-            conn.commit()
-        return inserted
+            if inserted:
+                self._sync_similarity_index(conn)
+                self._update_stats_rollups(conn, inserted)
+                self._bump_generation(conn)
+        return len(inserted)
     
     def job_exists(self, link: str) -> bool:
         """Check if a job with this link exists. O(1) via index."""
-        with self._get_conn() as conn:
+        with self._read() as conn:
             cursor = conn.execute(
                 "SELECT 1 FROM jobs WHERE link = ? LIMIT 1", 
                 (link,)
             )
             return cursor.fetchone() is not None
     
+    def canonical_exists(self, key: str) -> bool:
+        """Check if a job with this canonical key exists. O(1) via index."""
+        if not key:
+            return False
+        with self._read() as conn:
+            cursor = conn.execute(
+                "SELECT 1 FROM jobs WHERE canonical_key = ? LIMIT 1",
+                (key,)
+            )
+            return cursor.fetchone() is not None
+    
     def get_job(self, link: str) -> Optional[Dict]:
         """Get a single job by link."""
-        with self._get_conn() as conn:
+        with self._read() as conn:
             cursor = conn.execute(
                 "SELECT * FROM jobs WHERE link = ?", 
                 (link,)
@@ -170,7 +723,7 @@ class JobDatabase:
     def get_recent_jobs(self, days: int = 30) -> List[Dict]:
         """Get jobs from the last N days."""
         cutoff = datetime.now() - timedelta(days=days)
-        with self._get_conn() as conn:
+        with self._read() as conn:
             cursor = conn.execute("""
                 SELECT * FROM jobs 
                 WHERE created_at >= ? 
@@ -180,13 +733,38 @@ class JobDatabase:
     
     def get_all_jobs(self) -> List[Dict]:
         """Get all jobs (use sparingly - for export only)."""
-        with self._get_conn() as conn:
+        with self._read() as conn:
             cursor = conn.execute("SELECT * FROM jobs ORDER BY created_at DESC")
             return [dict(row) for row in cursor.fetchall()]
     
+    def search_jobs(self, text: str, limit: int = 50) -> List[Dict]:
+        """
+        Full-text search over titulo, empresa, localizacao and tags.
+        Prefix and accent-insensitive ('estag' finds 'Estágio'), BM25 ranked.
+        """
+        match = build_fts_query(text)
+        if not match:
+            return []
+        with self._read() as conn:
+            if self.has_fts:
+                cursor = conn.execute(f"""
+                    SELECT jobs.*, {FTS_RANK} AS rank
+                    FROM jobs_fts JOIN jobs ON jobs.id = jobs_fts.rowid
+                    WHERE jobs_fts MATCH ?
+                    ORDER BY rank
+                    LIMIT ?
+                """, (match, limit))
+            else:
+                cursor = conn.execute("""
+                    SELECT * FROM jobs
+                    WHERE titulo LIKE ? OR empresa LIKE ?
+                    ORDER BY created_at DESC
+                    LIMIT ?
+                """, (f"%{text}%", f"%{text}%", limit))
+            return [dict(row) for row in cursor.fetchall()]
     def count_jobs(self) -> int:
         """Get total job count."""
-        with self._get_conn() as conn:
+        with self._read() as conn:
             cursor = conn.execute("SELECT COUNT(*) FROM jobs")
             return cursor.fetchone()[0]
     
@@ -194,37 +772,34 @@ class JobDatabase:
     
     def mark_sent_discord(self, link: str) -> bool:
         """Mark job as sent to Discord."""
-        with self._get_conn() as conn:
-            conn.execute(
+        with self._write() as conn:
+            cursor = conn.execute(
                 "UPDATE jobs SET sent_discord = 1 WHERE link = ?", 
                 (link,)
             )
-            conn.commit()
-            return conn.total_changes > 0
+            return cursor.rowcount > 0
     
     def mark_sent_telegram(self, link: str) -> bool:
         """Mark job as sent to Telegram."""
-        with self._get_conn() as conn:
-            conn.execute(
+        with self._write() as conn:
+            cursor = conn.execute(
                 "UPDATE jobs SET sent_telegram = 1 WHERE link = ?", 
                 (link,)
             )
-            conn.commit()
-            return conn.total_changes > 0
+            return cursor.rowcount > 0
     
     def mark_sent(self, link: str) -> bool:
         """Mark job as sent to both Discord and Telegram."""
-        with self._get_conn() as conn:
-            conn.execute(
+        with self._write() as conn:
+            cursor = conn.execute(
                 "UPDATE jobs SET sent_discord = 1, sent_telegram = 1 WHERE link = ?", 
                 (link,)
             )
-            conn.commit()
-            return conn.total_changes > 0
+            return cursor.rowcount > 0
     
     def is_sent(self, link: str) -> bool:
         """Check if job was already sent (Discord)."""
-        with self._get_conn() as conn:
+        with self._read() as conn:
             cursor = conn.execute(
                 "SELECT sent_discord FROM jobs WHERE link = ?", 
                 (link,)
@@ -234,7 +809,7 @@ class JobDatabase:
     
     def get_unsent_jobs(self) -> List[Dict]:
         """Get jobs that haven't been sent yet."""
-        with self._get_conn() as conn:
+        with self._read() as conn:
             cursor = conn.execute("""
                 SELECT * FROM jobs 
                 WHERE sent_discord = 0 
@@ -247,28 +822,21 @@ class JobDatabase:
     def find_similar_jobs(self, titulo: str, empresa: str, limit: int = 10) -> List[Dict]:
         """
         Find potentially similar jobs for fuzzy matching.
-        Uses SQL LIKE for initial filtering, then fuzzy in Python.
+        Uses the MinHash-LSH index for candidates, ranked by shingle Jaccard.
         """
-        # Extract first significant word for SQL pre-filter
-        titulo_words = titulo.lower().split()[:2]
-        empresa_word = empresa.lower().split()[0] if empresa else ""
+        keys = get_hasher().keys_for(titulo, empresa)
+        if not keys:
+            return []
         
-        with self._get_conn() as conn:
-            # Broad SQL filter
-            cursor = conn.execute("""
-                SELECT link, titulo, empresa FROM jobs 
-                WHERE (titulo LIKE ? OR titulo LIKE ? OR empresa LIKE ?)
-                LIMIT ?
-            """, (
-                f"%{titulo_words[0]}%" if titulo_words else "%",
-                f"%{titulo_words[1]}%" if len(titulo_words) > 1 else "%",
-                f"%{empresa_word}%",
-                limit * 5  # Get more for fuzzy filtering
-            ))
-            
-            candidates = [dict(row) for row in cursor.fetchall()]
+        with self._read() as conn:
+            candidates = self._similar_candidates(conn, {0: keys}).get(0, [])
         
-        return candidates[:limit]
+        current = shingles(normalize_signature(titulo, empresa))
+        candidates.sort(
+            key=lambda c: jaccard(current, shingles(normalize_signature(c['titulo'], c['empresa']))),
+            reverse=True
+        )
+        return [{k: c[k] for k in ('link', 'titulo', 'empresa')} for c in candidates[:limit]]
     
     def is_fuzzy_duplicate(self, job: Dict, threshold: int = 90) -> bool:
         """
@@ -279,8 +847,8 @@ class JobDatabase:
         empresa = job.get('empresa', '')
         link = job.get('link', '')
         
-        # 1. Exact link match (fastest)
-        if self.job_exists(link):
+        # 1. Exact link / canonical key match (fastest, indexed)
+        if self.job_exists(link) or self.canonical_exists(job.get('canonical_key') or canonical_key(job)):
             return True
         
         # 2. Fuzzy match on title+company
@@ -298,6 +866,98 @@ class JobDatabase:
         
         return False
     
+    def filter_new_jobs(self, jobs: List[Dict], threshold: int = 90) -> List[Dict]:
+        """
+        Bulk dedupe for a whole batch. Returns the jobs that are neither an
+        exact link match nor a fuzzy duplicate (of the table or of an earlier
+        job in the same batch), in their original order.
+        
+        - Exact: links and canonical keys, one indexed join each against a
+          temp table of the incoming batch.
+        - Fuzzy: one LSH lookup for the whole batch, candidates confirmed
+          with token_set_ratio.
+        """
+        if not jobs:
+            return []
+        hasher = get_hasher()
+        ckeys = [job.get('canonical_key') or canonical_key(job) for job in jobs]
+        keys_by_item = {
+            i: hasher.keys_for(job.get('titulo', ''), job.get('empresa', ''))
+            for i, job in enumerate(jobs)
+        }
+        
+        with self._read() as conn:
+            conn.execute("""
+                CREATE TEMP TABLE IF NOT EXISTS incoming (link TEXT, canonical_key TEXT)
+            """)
+            conn.execute("DELETE FROM temp.incoming")
+            conn.executemany(
+                "INSERT INTO temp.incoming (link, canonical_key) VALUES (?, ?)",
+                [(job.get('link'), ckey) for job, ckey in zip(jobs, ckeys)]
+            )
+            known_links = {row[0] for row in conn.execute("""
+                SELECT i.link FROM temp.incoming i
+                JOIN jobs j ON j.link = i.link
+            """)}
+            known_keys = {row[0] for row in conn.execute("""
+                SELECT i.canonical_key FROM temp.incoming i
+                JOIN jobs j ON j.canonical_key = i.canonical_key
+                WHERE i.canonical_key != ''
+            """)}
+            candidates = self._similar_candidates(conn, keys_by_item)
+        
+        batch_index = LSHIndex(hasher)
+        novel = []
+        for i, job in enumerate(jobs):
+            link = job.get('link')
+            if link in known_links or ckeys[i] in known_keys:
+                continue
+            titulo = job.get('titulo', '') or ''
+            empresa = job.get('empresa', '') or ''
+            current_sig = f"{titulo} {empresa}".lower()
+            
+            others = candidates.get(i, []) + [novel[n] for n in batch_index.candidates(titulo, empresa)]
+            if any(_is_match(current_sig,
+                             f"{other.get('titulo') or ''} {other.get('empresa') or ''}".lower(),
+                             threshold)
+                   for other in others):
+                continue
+            
+            batch_index.add(len(novel), titulo, empresa)
+            if link:
+                known_links.add(link)
+            if ckeys[i]:
+                known_keys.add(ckeys[i])
+            novel.append(job)
+        
+        return novel
+    
+    # ==================== SOURCE FETCH HISTORY ====================
+    
+    def record_source_fetch(self, source: str, jobs_found: int, jobs_new: int,
+                            status: str = "ok", fetched_at: datetime = None) -> None:
+        """Record one fetch of a source (used by the polling planner)."""
+        fetched_at = fetched_at or datetime.now()
+        with self._write() as conn:
+            conn.execute("""
+                INSERT INTO source_fetches (source, fetched_at, status, jobs_found, jobs_new)
+                VALUES (?, ?, ?, ?, ?)
+            """, (source, fetched_at.isoformat(), status, jobs_found, jobs_new))
+    
+    def get_source_history(self, source: str, limit: int = 20) -> List[Dict]:
+        """Get the most recent fetches of a source, oldest first."""
+        with self._read() as conn:
+            cursor = conn.execute("""
+                SELECT source, fetched_at, status, jobs_found, jobs_new
+                FROM source_fetches
+                WHERE source = ?
+                ORDER BY fetched_at DESC
+                LIMIT ?
+            """, (source, limit))
+            rows = [dict(row) for row in cursor.fetchall()]
+        rows.reverse()
+        return rows
+    
     # ==================== MIGRATION HELPERS ====================
     
     def import_sent_jobs(self, sent_jobs_file: str) -> int:
@@ -312,7 +972,7 @@ class JobDatabase:
         with open(sent_jobs_file, 'r') as f:
             links = [line.strip() for line in f if line.strip()]
         
-        with self._get_conn() as conn:
+        with self._write() as conn:
             for link in links:
                 # First check if job exists
                 cursor = conn.execute(
@@ -325,7 +985,6 @@ class JobDatabase:
                         (link,)
                     )
                     count += 1
-            conn.commit()
         
         return count
     
@@ -345,3 +1004,19 @@ class JobDatabase:
         except Exception as e:
             logger.error(f"Export failed: {e}")
             return False
+
+
+if __name__ == "__main__":
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="JobDatabase maintenance commands")
+    parser.add_argument("command", choices=["rebuild-stats", "maintenance"])
+    parser.add_argument("--db", default=None, help="Database path (default: config.DB_PATH)")
+    args = parser.parse_args()
+    
+    db = JobDatabase(args.db)
+    if args.command == "rebuild-stats":
+        print(f"Stats rollups rebuilt: {db.rebuild_stats_rollups()} rows")
+    else:
+        print(f"Maintenance: {db.maintenance()}")
+    db.close()
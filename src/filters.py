@@ -7,6 +7,9 @@ import re
 from typing import List, Dict
 from datetime import datetime
 
+from canonical import canonical_key
+from scoring_rules import current_rules
+
 
 def parse_relative_date(date_text: str) -> int:
     """
@@ -141,7 +144,8 @@ def filter_recent_only(jobs: List[Dict], max_days: int = 30) -> List[Dict]:
 
 def remove_duplicates(jobs: List[Dict]) -> List[Dict]:
     """
-    Remove vagas duplicadas baseado no título e empresa.
+    Remove vagas duplicadas baseado no título e empresa normalizados
+    (chave canônica: ignora emojis, acentos e sufixos societários).
     
     Args:
         jobs: Lista de vagas
@@ -153,10 +157,7 @@ def remove_duplicates(jobs: List[Dict]) -> List[Dict]:
     unique = []
 
     for job in jobs:
-        key = (
-            str(job.get("titulo", "") or "").lower().strip(),
-            str(job.get("empresa", "") or "").lower().strip()
-        )
+        key = job.get("canonical_key") or canonical_key(job) or id(job)
         if key not in seen:
             seen.add(key)
             unique.append(job)
@@ -164,16 +165,10 @@ def remove_duplicates(jobs: List[Dict]) -> List[Dict]:
     return unique
 
 
-# Blacklist de domínios ruins (agregadores de baixa qualidade)
-BLACKLISTED_DOMAINS = [
-    'emprego.pt',
-    'net-empregos',
-    'empregos.pt'
-]
-
 def filter_blacklisted_domains(jobs: List[Dict]) -> List[Dict]:
     """
-    Remove vagas de domínios na blacklist (agregadores ruins).
+    Remove vagas de domínios na blacklist (agregadores ruins; blacklisted_domains
+    do arquivo de regras).
     
     Args:
         jobs: Lista de vagas
@@ -181,18 +176,8 @@ def filter_blacklisted_domains(jobs: List[Dict]) -> List[Dict]:
     Returns:
         Lista filtrada sem domínios blacklisted
     """
-    filtered = []
-    
-    for job in jobs:
-        link = job.get('link', '').lower()
-        
-        # Checar se o link contém algum domínio blacklisted
-        is_blacklisted = any(domain in link for domain in BLACKLISTED_DOMAINS)
-        
-        if not is_blacklisted:
-            filtered.append(job)
-    
-    return filtered
+    rules = current_rules()
+    return [job for job in jobs if not rules.is_blacklisted_link(job.get('link', ''))]
 
 
 def apply_all_filters(
@@ -0,0 +1,335 @@
+# -*- coding: utf-8 -*-
+"""
+HTTP Client - Camada HTTP compartilhada pelos scrapers.
+
+- Uma requests.Session por host (keep-alive + pool de conexões), em vez de um
+  handshake TCP+TLS novo a cada requests.get.
+- Cache de respostas em disco (SQLite) com TTL, por URL + headers que variam a
+  resposta (Authorization, Cookie, Accept...). Respeita Cache-Control: no-store
+  não é guardado; no-cache e max-age=0 são sempre revalidados.
+- Requisições condicionais (If-None-Match / If-Modified-Since): um 304 reaproveita
+  o corpo salvo.
+- Descompressão transparente (gzip/deflate, e br/zstd quando suportado).
+- Rate limiting por host (src/rate_limiter.py): cada requisição de rede pega um
+  token do balde do host e os headers X-RateLimit-*/Retry-After realimentam o balde.
+- Contadores de requisições e bytes economizados.
+
+Uso nos scrapers:
+    import http_client
+    response = http_client.get(url, headers=self.headers, timeout=15)
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import DEFAULT_ACCEPT_ENCODING, get_encoding_from_headers
+
+from config import (
+    HTTP_CACHE_PATH, HTTP_CACHE_TTL, HTTP_CACHE_MAX_AGE_DAYS,
+    HTTP_POOL_SIZE, HTTP_MAX_RETRIES
+)
+from rate_limiter import RateLimiter, limiter as shared_limiter
+
+logger = logging.getLogger("HttpClient")
+
+# Headers que descrevem o corpo comprimido/transferido, não o corpo salvo
+_HOP_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection"}
+
+# Headers do pedido que mudam a resposta: entram na chave do cache
+_KEY_HEADERS = ("authorization", "cookie", "accept", "accept-language", "user-agent")
+
+
+def _cache_directives(headers) -> Dict[str, Optional[str]]:
+    """Cache-Control como dict ('max-age=60, no-cache' -> {'max-age': '60', 'no-cache': None})."""
+    directives = {}
+    for directive in headers.get("Cache-Control", "").split(","):
+        name, _, value = directive.strip().lower().partition("=")
+        if name:
+            directives[name] = value.strip('"') or None
+    return directives
+
+
+class ResponseCache:
+    """Cache de respostas GET em SQLite (corpo já descomprimido + validadores)."""
+
+    def __init__(self, path: str):
+        self.path = path
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS http_cache (
+                    key TEXT PRIMARY KEY,
+                    url TEXT,
+                    status INTEGER,
+                    headers TEXT,
+                    body BLOB,
+                    etag TEXT,
+                    last_modified TEXT,
+                    stored_at REAL,
+                    expires_at REAL
+                )
+            """)
+            self._conn.commit()
+
+    def get(self, key: str) -> Optional[Dict]:
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM http_cache WHERE key = ?", (key,)).fetchone()
+        return dict(row) if row else None
+
+    def put(self, key: str, response: requests.Response, ttl: float) -> None:
+        headers = {k: v for k, v in response.headers.items() if k.lower() not in _HOP_HEADERS}
+        now = time.time()
+        with self._lock:
+            self._conn.execute("""
+                INSERT OR REPLACE INTO http_cache
+                    (key, url, status, headers, body, etag, last_modified, stored_at, expires_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, (
+                key,
+                response.url,
+                response.status_code,
+                json.dumps(headers),
+                response.content,
+                response.headers.get("ETag"),
+                response.headers.get("Last-Modified"),
+                now,
+                now + ttl
+            ))
+            self._conn.commit()
+
+    def touch(self, key: str, ttl: float) -> None:
+        """Renova a validade de uma entrada revalidada (304)."""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE http_cache SET expires_at = ? WHERE key = ?",
+                (time.time() + ttl, key)
+            )
+            self._conn.commit()
+
+    def prune(self, max_age_days: float) -> int:
+        """Remove entradas não atualizadas há mais de max_age_days."""
+        cutoff = time.time() - max_age_days * 86400
+        with self._lock:
+            cursor = self._conn.execute("DELETE FROM http_cache WHERE stored_at < ?", (cutoff,))
+            self._conn.commit()
+            return cursor.rowcount
+
+
+class HttpClient:
+    """Cliente HTTP com sessões por host, cache em disco e GET condicional."""
+
+    def __init__(self, cache_path: str = None, default_ttl: float = None,
+                 pool_size: int = None, max_retries: int = None,
+                 limiter: RateLimiter = None):
+        self.default_ttl = HTTP_CACHE_TTL if default_ttl is None else default_ttl
+        self.pool_size = pool_size or HTTP_POOL_SIZE
+        self.max_retries = HTTP_MAX_RETRIES if max_retries is None else max_retries
+        self.cache = ResponseCache(cache_path or HTTP_CACHE_PATH)
+        self.cache.prune(HTTP_CACHE_MAX_AGE_DAYS)
+        self.limiter = limiter or shared_limiter
+
+        self._sessions: Dict[str, requests.Session] = {}
+        self._sessions_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._stats = {
+            "requests": 0,          # Chamadas a get()/post()
+            "network_requests": 0,  # Requisições que saíram para a rede
+            "cache_hits": 0,        # Respondidas do cache sem rede
+            "not_modified": 0,      # Revalidadas com 304
+            "bytes_downloaded": 0,
+            "bytes_saved": 0,
+        }
+
+    # ==================== SESSÕES ====================
+
+    def session_for(self, url: str) -> requests.Session:
+        """Sessão (pool keep-alive) dedicada ao host da URL."""
+        parts = urlsplit(url)
+        host = f"{parts.scheme}://{parts.netloc}"
+        with self._sessions_lock:
+            session = self._sessions.get(host)
+            if session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=1,
+                    pool_maxsize=self.pool_size,
+                    max_retries=self.max_retries  # Só erros de conexão (DNS, reset)
+                )
+                session.mount(host, adapter)
+                self._sessions[host] = session
+            return session
+
+    # ==================== REQUISIÇÕES ====================
+
+    def get(self, url: str, params: Dict = None, headers: Dict = None,
+            timeout: float = None, ttl: float = None, use_cache: bool = True,
+            **kwargs) -> requests.Response:
+        """
+        GET com cache. Mesma interface de requests.get (+ ttl/use_cache).
+        Respostas vindas do cache têm o atributo `from_cache = True`.
+        """
+        self._count("requests")
+        session = self.session_for(url)
+        headers = self._clean_headers(headers)
+        full_url = requests.Request("GET", url, params=params).prepare().url
+        key = self._cache_key(full_url, headers)
+
+        entry = self.cache.get(key) if use_cache else None
+        if entry and entry["expires_at"] > time.time():
+            self._count("cache_hits")
+            self._count("bytes_saved", len(entry["body"] or b""))
+            return self._from_cache(entry)
+
+        if entry:
+            if entry["etag"]:
+                headers["If-None-Match"] = entry["etag"]
+            if entry["last_modified"]:
+                headers["If-Modified-Since"] = entry["last_modified"]
+
+        response = self._send(
+            url, session.get, params=params, headers=headers, timeout=timeout, **kwargs
+        )
+
+        if response.status_code == 304 and entry:
+            self._count("not_modified")
+            self._count("bytes_saved", len(entry["body"] or b""))
+            self.cache.touch(key, self._ttl_for(response, ttl))
+            return self._from_cache(entry)
+
+        if use_cache and response.status_code == 200 and self._is_storable(response):
+            self.cache.put(key, response, self._ttl_for(response, ttl))
+
+        return response
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        """POST pela sessão do host (sem cache)."""
+        self._count("requests")
+        return self._send(url, self.session_for(url).post, **kwargs)
+
+    def stats(self) -> Dict:
+        """Snapshot dos contadores (requisições e bytes economizados)."""
+        with self._stats_lock:
+            snapshot = dict(self._stats)
+        snapshot["requests_saved"] = snapshot["cache_hits"]
+        return snapshot
+
+    def close(self):
+        with self._sessions_lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+
+    # ==================== HELPERS ====================
+
+    def _send(self, url: str, method, **kwargs) -> requests.Response:
+        """Requisição de rede respeitando a cota do host."""
+        host = urlsplit(url).netloc
+        self.limiter.acquire(host)
+        response = method(url, **kwargs)
+        self.limiter.update_from_headers(host, response.headers, response.status_code)
+        self._count("network_requests")
+        self._count("bytes_downloaded", self._wire_size(response))
+        return response
+
+    def _count(self, name: str, amount: int = 1):
+        with self._stats_lock:
+            self._stats[name] += amount
+
+    @staticmethod
+    def _clean_headers(headers: Optional[Dict]) -> Dict:
+        """
+        Copia os headers do scraper, trocando Accept-Encoding pelo que a
+        biblioteca realmente sabe descomprimir (config pede 'br' mesmo sem brotli).
+        """
+        cleaned = {k: v for k, v in (headers or {}).items() if k.lower() != "accept-encoding"}
+        cleaned["Accept-Encoding"] = DEFAULT_ACCEPT_ENCODING
+        return cleaned
+
+    @staticmethod
+    def _cache_key(url: str, headers: Dict) -> str:
+        """URL + headers do pedido que mudam a resposta (credenciais, formato, idioma)."""
+        lowered = {k.lower(): v for k, v in headers.items()}
+        parts = [url] + [f"{name}: {lowered[name]}" for name in _KEY_HEADERS if name in lowered]
+        return hashlib.sha1("\n".join(parts).encode("utf-8")).hexdigest()
+
+    def _ttl_for(self, response: requests.Response, ttl: Optional[float]) -> float:
+        directives = _cache_directives(response.headers)
+        if "no-cache" in directives:
+            return 0  # Guarda corpo e validadores, mas revalida a cada uso
+        if ttl is not None:
+            return ttl
+        if directives.get("max-age"):
+            try:
+                return max(float(directives["max-age"]), 0)
+            except ValueError:
+                pass
+        return self.default_ttl
+
+    @staticmethod
+    def _is_storable(response: requests.Response) -> bool:
+        """Sem no-store e sem Vary fora da chave (Accept-Encoding: o corpo é salvo descomprimido)."""
+        if "no-store" in _cache_directives(response.headers):
+            return False
+        vary = {name.strip().lower() for name in response.headers.get("Vary", "").split(",") if name.strip()}
+        return not (vary - {"accept-encoding"} - set(_KEY_HEADERS))
+
+    @staticmethod
+    def _wire_size(response: requests.Response) -> int:
+        """Bytes trafegados (comprimidos, se o servidor informar)."""
+        length = response.headers.get("Content-Length")
+        if length and length.isdigit():
+            return int(length)
+        return len(response.content or b"")
+
+    @staticmethod
+    def _from_cache(entry: Dict) -> requests.Response:
+        response = requests.Response()
+        response.status_code = entry["status"]
+        response.reason = "OK"
+        response.url = entry["url"]
+        response._content = entry["body"] or b""
+        response.headers = CaseInsensitiveDict(json.loads(entry["headers"] or "{}"))
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.from_cache = True
+        return response
+
+
+# ==================== CLIENTE PADRÃO ====================
+
+_default_client: Optional[HttpClient] = None
+_default_lock = threading.Lock()
+
+
+def get_client() -> HttpClient:
+    """Cliente compartilhado por todos os scrapers do processo."""
+    global _default_client
+    with _default_lock:
+        if _default_client is None:
+            _default_client = HttpClient()
+        return _default_client
+
+
+def get(url: str, **kwargs) -> requests.Response:
+    return get_client().get(url, **kwargs)
+
+
+def post(url: str, **kwargs) -> requests.Response:
+    return get_client().post(url, **kwargs)
+
+
+def stats() -> Dict:
+    return get_client().stats()
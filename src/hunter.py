@@ -7,14 +7,13 @@ Executa ciclo contínuo de busca e notifica no Discord e Telegram.
 import sys
 import os
 import time
-import random
 import logging
 from datetime import datetime
 
 # Setup paths
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from config import SEARCH_TERMS, HUNTER_SLEEP_MIN, HUNTER_SLEEP_MAX, LOG_FILE
+from config import SEARCH_TERMS, LOG_FILE, SCRAPER_TIMEOUTS
 
 # Working scrapers (API/RSS based - NO BROWSER NEEDED!)
 from scraper_rss import RssScraper
@@ -38,9 +37,14 @@ from scraper_jobspy_real import JobSpyRealScraper
 
 from notifier import send_discord_alert
 from notifier_telegram import TelegramNotifier
-from filters import apply_all_filters
+from pipeline import JobPipeline
 from database import JobDatabase
 from intelligence import Intelligence
+from score_cache import ScoreCache
+from scheduler import ScraperScheduler
+import http_client
+from rate_limiter import limiter
+from polling_planner import PollingPlanner
 
 # Garantir diretório de logs
 os.makedirs(os.path.dirname(LOG_FILE), exist_ok=True)
@@ -57,149 +61,121 @@ logging.basicConfig(
 logger = logging.getLogger("HunterBot")
 
 # Inicializar Inteligência e Notificadores
-brain = Intelligence()
+brain = Intelligence(score_cache=ScoreCache())
 telegram = TelegramNotifier()
+scheduler = ScraperScheduler()
+
+
+def build_sources():
+    """
+    Monta a lista de fontes ativas para o ScraperScheduler.
+    Cada fonte roda em paralelo com deadline próprio (config.SCRAPER_TIMEOUTS).
+    """
+    # Instância única: o cache de consultas do JobSpy sobrevive entre ciclos
+    jobspy = JobSpyRealScraper()
+
+    sources = [
+        # 1. GitHub (API)
+        {"name": "GitHub", "emoji": "🐙", "scraper": lambda: GithubScraper().fetch_jobs()},
+        # 2. RSS Feeds
+        {"name": "RSS", "emoji": "📡", "scraper": lambda: RssScraper().fetch_all(SEARCH_TERMS)},
+        # 3. Adzuna API - DESABILITADO (baixa qualidade)
+        # 4. RemoteOK (Remotas internacionais)
+        {"name": "RemoteOK", "emoji": "🌍", "scraper": lambda: RemoteOKScraper().fetch_jobs(SEARCH_TERMS)},
+        # 5. Reddit (Subreddits de vagas)
+        {"name": "Reddit", "emoji": "📱", "scraper": lambda: RedditScraper().fetch_jobs(SEARCH_TERMS)},
+        # 6. Hacker News (Jobs)
+        {"name": "HackerNews", "emoji": "🔶", "scraper": lambda: HackerNewsScraper().fetch_jobs(SEARCH_TERMS)},
+        # 7. Telegram (Canais BR de vagas) - DESABILITADO (Pede código interativo, trava o bot)
+        # 8. Sites BR (Programathor)
+        {"name": "Programathor", "emoji": "🇧🇷", "scraper": lambda: BRScraper().fetch_jobs(SEARCH_TERMS)},
+        # 9. TabNews (API)
+        {"name": "TabNews", "emoji": "📑", "scraper": lambda: TabNewsScraper().fetch_jobs()},
+        # 10. Apinfo (Legacy)
+        {"name": "Apinfo", "emoji": "💾", "scraper": lambda: ApinfoScraper().fetch_jobs()},
+        # 11. BuscoJobs (América Latina)
+        {"name": "BuscoJobs", "emoji": "🌎", "scraper": lambda: BuscoJobsScraper().fetch_jobs(SEARCH_TERMS)},
+        # 12. Remotive (Remote Premium)
+        {"name": "Remotive", "emoji": "🌐", "scraper": lambda: RemotiveScraper().fetch_jobs(SEARCH_TERMS)},
+        # 13. Telegram Channels (Tempo Real) - DESABILITADO (Pede código interativo)
+        # 14. Catho (Brasil - Qualidade)
+        {"name": "Catho", "emoji": "🟢", "scraper": lambda: CathoScraper().fetch_jobs(SEARCH_TERMS)},
+        # 15. Trampo.co (Startups BR - Qualidade)
+        {"name": "Trampo.co", "emoji": "🚀", "scraper": lambda: TrampoCoScraper().fetch_jobs(SEARCH_TERMS)},
+        # 16. Gupy (MAIOR Plataforma BR)
+        {"name": "Gupy", "emoji": "🔵", "scraper": lambda: GupyScraper().fetch_jobs(SEARCH_TERMS)},
+        # 17. JobSpy (LinkedIn + Indeed + ZipRecruiter) **PYTHON 3.11** - generator (streaming)
+        {"name": "JobSpy", "emoji": "🌐", "scraper": lambda: jobspy.iter_jobs(SEARCH_TERMS)},
+    ]
 
+    # --- DISABLED / BROKEN ---
+    # Gupy -> API changed, returns HTML
+    # Indeed -> Too complex/anti-scraping
 
-def run_cycle():
-    """Executa um ciclo de busca em TODAS as fontes gratuitas."""
-    logger.info("=== 🚀 INICIANDO CICLO DE CAÇA (16 FONTES DE QUALIDADE) ===")
-    
-    raw_jobs = []
-    
-    # 1. GitHub (API)
-    try:
-        logger.info("🐙 Caçando no GitHub...")
-        gh = GithubScraper()
-        raw_jobs.extend(gh.fetch_jobs())
-    except Exception as e: logger.error(f"Erro GitHub: {e}")
-
-    # 2. RSS Feeds
-    try:
-        logger.info("📡 Caçando RSS...")
-        rss = RssScraper()
-        raw_jobs.extend(rss.fetch_all(SEARCH_TERMS))
-    except Exception as e: logger.error(f"Erro RSS: {e}")
-
-    # 3. Adzuna API - DESABILITADO (baixa qualidade)    # adzuna_jobs = []
-    # for attempt in range(2):
-    #     try:
-    #         logger.info(f"🌐 Caçando no Adzuna Brasil (tentativa {attempt+1}/2)...")
-    #         adzuna = AdzunaScraper()
-    #         adzuna_jobs = adzuna.fetch_jobs(SEARCH_TERMS)
-    #         raw_jobs.extend(adzuna_jobs)
-    #         logger.info(f"  ✅ Adzuna: {len(adzuna_jobs)} vagas")
-    #         break
-    #     except Exception as e:
-    #         logger.error(f"  ❌ Erro Adzuna (tentativa {attempt+1}): {e}")
-    #         if attempt == 0:
-    #             import time
-    #             time.sleep(5)
-
-    # 4. RemoteOK (Remotas internacionais)
-    try:
-        logger.info("🌍 Caçando no RemoteOK...")
-        remoteok = RemoteOKScraper()
-        raw_jobs.extend(remoteok.fetch_jobs(SEARCH_TERMS))
-    except Exception as e: logger.error(f"Erro RemoteOK: {e}")
-
-    # 5. Reddit (Subreddits de vagas)
-    try:
-        logger.info("📱 Caçando no Reddit...")
-        reddit = RedditScraper()
-        raw_jobs.extend(reddit.fetch_jobs(SEARCH_TERMS))
-    except Exception as e: logger.error(f"Erro Reddit: {e}")
-
-    # 6. Hacker News (Jobs)
-    try:
-        logger.info("🔶 Caçando no Hacker News...")
-        hn = HackerNewsScraper()
-        raw_jobs.extend(hn.fetch_jobs(SEARCH_TERMS))
-    except Exception as e: logger.error(f"Erro HN: {e}")
-
-    # 7. Telegram (Canais BR de vagas) - DESABILITADO (Pede código interativo, trava o bot)
-    # try:
-    #     logger.info("💬 Caçando no Telegram...")
-    #     tg_scraper = TelegramScraper()
-    #     raw_jobs.extend(tg_scraper.fetch_jobs(SEARCH_TERMS))
-    # except Exception as e: logger.error(f"Erro Telegram: {e}")
-
-    # 8. Sites BR (Programathor)
-    try:
-        logger.info("🇧🇷 Caçando no Programathor...")
-        br_scraper = BRScraper()
-        raw_jobs.extend(br_scraper.fetch_jobs(SEARCH_TERMS))
-    except Exception as e: logger.error(f"Erro Sites BR: {e}")
-
-    # 9. TabNews (API)
-    try:
-        logger.info("📑 Caçando no TabNews...")
-        tabnews = TabNewsScraper()
-        raw_jobs.extend(tabnews.fetch_jobs())
-    except Exception as e: logger.error(f"Erro TabNews: {e}")
-
-    # 10. Apinfo (Legacy)
-    try:
-        logger.info("💾 Caçando no Apinfo...")
-        apinfo = ApinfoScraper()
-        raw_jobs.extend(apinfo.fetch_jobs())
-    except Exception as e: logger.error(f"Erro Apinfo: {e}")
-
-    # 11. BuscoJobs (América Latina)
-    try:
-        logger.info("🌎 Caçando no BuscoJobs...")
-        buscojobs = BuscoJobsScraper()
-        raw_jobs.extend(buscojobs.fetch_jobs(SEARCH_TERMS))
-    except Exception as e: logger.error(f"Erro BuscoJobs: {e}")
+    for source in sources:
+        source["timeout"] = SCRAPER_TIMEOUTS.get(source["name"])
+    return sources
 
-    # 12. Remotive (Remote Premium)
-    try:
-        logger.info("🌐 Caçando no Remotive...")
-        remotive = RemotiveScraper()
-        raw_jobs.extend(remotive.fetch_jobs(SEARCH_TERMS))
-    except Exception as e: logger.error(f"Erro Remotive: {e}")
 
-    # 13. Telegram Channels (Tempo Real) - DESABILITADO (Pede código interativo)
-    # try:
-    #     logger.info("📱 Caçando no Telegram (Canais BR)...")
-    #     telegram_scraper = TelegramJobScraper()
-    #     raw_jobs.extend(telegram_scraper.fetch_jobs(SEARCH_TERMS))
-    # except Exception as e: logger.error(f"Erro Telegram: {e}")
+def notify_job(db, job):
+    """Notifica uma vaga nova (Discord sempre, Telegram se score >= 40)."""
+    link = job['link']
     
-    # 14. Catho (Brasil - Qualidade)
-    try:
-        logger.info("🟢 Caçando no Catho...")
-        catho = CathoScraper()
-        raw_jobs.extend(catho.fetch_jobs(SEARCH_TERMS))
-    except Exception as e: logger.error(f"Erro Catho: {e}")
+    # Verifica se já foi enviado (via SQL)
+    if db.is_sent(link):
+        return False
     
-    # 15. Trampo.co (Startups BR - Qualidade)
-    try:
-        logger.info("🚀 Caçando no Trampo.co...")
-        trampoco = TrampoCoScraper()
-        raw_jobs.extend(trampoco.fetch_jobs(SEARCH_TERMS))
-    except Exception as e: logger.error(f"Erro Trampo.co: {e}")
+    # Discord (Todas as relevantes) - rate limiting via rate_limiter
+    send_discord_alert(job)
     
-    # 16. Gupy (MAIOR Plataforma BR) **NOVO**
-    try:
-        logger.info("🔵 Caçando no Gupy (Maior BR)...")
-        gupy = GupyScraper()
-        raw_jobs.extend(gupy.fetch_jobs(SEARCH_TERMS))
-    except Exception as e: logger.error(f"Erro Gupy: {e}")
+    # Telegram (Apenas as Melhores - Score > 40)
+    if job['score'] >= 40:
+        try: 
+            telegram.send_job_alert(job)
+            db.mark_sent_telegram(link)
+        except: pass
     
-    # 17. JobSpy (LinkedIn + Indeed + ZipRecruiter) **PYTHON 3.11**
-    try:
-        logger.info("🌐 Caçando via JobSpy (Multi-Platform)...")
-        jobspy = JobSpyRealScraper()
-        raw_jobs.extend(jobspy.fetch_jobs(SEARCH_TERMS))
-    except Exception as e: logger.error(f"Erro JobSpy: {e}")
-    except Exception as e: logger.error(f"Erro Telegram Channels: {e}")
-
-    # --- DISABLED / BROKEN ---
-    # Gupy -> API changed, returns HTML
-    # Indeed -> Too complex/anti-scraping
-
-    return raw_jobs
+    db.mark_sent_discord(link)
+    return True
+
+def run_cycle(sources=None, sink=None):
+    """
+    Executa um ciclo de busca em paralelo.
+    Sem argumentos roda TODAS as fontes gratuitas; o main_loop passa apenas
+    as fontes vencidas segundo o PollingPlanner.
+
+    Com `sink` (ex.: JobPipeline.put) as vagas são repassadas em streaming.
+
+    Returns:
+        Resultado do ScraperScheduler (jobs + status por fonte)
+    """
+    if sources is None:
+        sources = build_sources()
+    logger.info(f"=== 🚀 INICIANDO CICLO DE CAÇA ({len(sources)} FONTES EM PARALELO) ===")
+    for source in sources:
+        logger.info(f"{source['emoji']} Caçando no {source['name']}...")
+
+    result = scheduler.run(sources, sink=sink)
+
+    failed = [name for name, entry in result["sources"].items() if entry["status"] != "ok"]
+    collected = sum(entry["count"] for entry in result["sources"].values())
+    logger.info(
+        f"⚡ Coleta concluída em {result['duration']:.0f}s: {collected} vagas"
+        + (f" (sem resultado: {', '.join(failed)})" if failed else "")
+    )
+    http = http_client.stats()
+    logger.info(
+        f"🌐 HTTP (acumulado): {http['network_requests']} requisições de rede, "
+        f"{http['cache_hits']} do cache, {http['not_modified']} revalidadas (304), "
+        f"{http['bytes_saved'] / 1024:.0f} KB economizados"
+    )
+    for host, bucket in limiter.state().items():
+        if bucket["throttled"]:
+            logger.info(
+                f"⏳ Rate limit {host}: {bucket['throttled']} esperas, "
+                f"{bucket['wait_seconds']:.0f}s aguardando cota"
+            )
+    return result
 
 def main_loop():
     """Loop principal do Hunter Bot."""
@@ -214,95 +190,73 @@ def main_loop():
     db = JobDatabase()
     job_count = db.count_jobs()
     logger.info(f"💾 SQLite inicializado com {job_count} vagas no banco.")
+    
+    # Regras de scoring recarregadas quando scoring_rules.json muda (sem reiniciar)
+    brain.watcher.start()
+    
+    # Intervalo de coleta aprendido por fonte (histórico em source_fetches)
+    planner = PollingPlanner(db)
+    all_sources = build_sources()
 
     while True:
         try:
             start_time = datetime.now()
             
-            # 1. Coletar
-            jobs = run_cycle()
+            # 1. Coletar (apenas fontes vencidas)
+            due_sources = planner.due_sources(all_sources, now=start_time)
+            if not due_sources:
+                _sleep_until_next(planner, all_sources)
+                continue
             
-            # 2. Filtrar vagas antigas (apenas últimos 30 dias, exclui 2023 e antes)
-            recent_jobs = apply_all_filters(jobs, max_days=30)
+            # 2-5. Filtrar, pontuar, deduplicar, salvar e notificar em streaming:
+            # cada vaga entra no pipeline assim que o scraper a produz.
+            pipeline = JobPipeline(db, brain, notify=lambda job: notify_job(db, job)).start()
+            try:
+                cycle = run_cycle(due_sources, sink=pipeline.put)
+            finally:
+                summary = pipeline.close()
+            new_by_source = summary["new_by_source"]
+            new_count = summary["notified"]
             
-            # 3. Processamento Inteligente (Score + Dedupe via SQL)
-            processed_jobs = []
-            logger.info("🧠 Aplicando Inteligência (Match 0-100)...")
-
-            # BLACKLIST BACKEND
-            BLACKLIST = [
-                "pedreiro", "servente", "motorista", "limpeza", "vigilante", "porteiro", "recepcionista",
-                "vendedor de loja", "atendente", "frentista", "operador de caixa", "segurança patrimonial",
-                "advogado", "juridico", "direito", "financeiro", "contabil", "facilities", "serviços gerais"
-            ]
-            
-            for job in recent_jobs:
-                # 0. Filtro de Blacklist (Extermínio Imediato)
-                if any(bad in job['titulo'].lower() for bad in BLACKLIST):
-                    continue
+            # Enviar Resumo Diário no Telegram se houve novidades
+            if new_count > 0:
+                telegram.send_daily_summary(pipeline.top_jobs(), total=new_count)
 
-                # Deduplicação via SQLite (O(1) lookup, não carrega tudo na RAM!)
-                if db.is_fuzzy_duplicate(job):
-                    continue
-                
-                # Calcular Score
-                job = brain.enhance_job_data(job)
-                
-                # Descartar lixo (score < 0)
-                if job['score'] < 0:
-                    continue
-                    
-                processed_jobs.append(job)
-            
-            # 4. Salvar no SQLite (batch insert)
-            if processed_jobs:
-                inserted = db.add_jobs_batch(processed_jobs)
-                logger.info(f"💾 {inserted} vagas novas salvas no SQLite.")
+            logger.info(
+                f"Ciclo finalizado. {summary['inserted']} vagas salvas, "
+                f"{summary['duplicates']} duplicadas, {new_count} novos alertas enviados."
+            )
             
-            # 5. Notificar
-            new_count = 0
-            for job in processed_jobs:
-                link = job['link']
-                
-                # Verifica se já foi enviado (via SQL)
-                if db.is_sent(link):
+            # 6. Aprender o rendimento de cada fonte (fontes puladas não contam)
+            for name, entry in cycle["sources"].items():
+                if entry["status"] == "skipped":
                     continue
-                
-                # Discord (Todas as relevantes) - notifier já tem rate limiting interno
-                send_discord_alert(job)
-                
-                # Telegram (Apenas as Melhores - Score > 40)
-                if job['score'] >= 40:
-                    try: 
-                        telegram.send_job_alert(job)
-                        db.mark_sent_telegram(link)
-                    except: pass
-                
-                db.mark_sent_discord(link)
-                new_count += 1
-                # Rate limiting agora é feito pelo notifier.py
-
+                planner.record(name, entry["count"], new_by_source.get(name, 0),
+                               status=entry["status"], now=start_time)
             
-            # Enviar Resumo Diário no Telegram se houve novidades
-            if new_count > 0:
-                telegram.send_daily_summary(processed_jobs)
-
-            logger.info(f"Ciclo finalizado. {new_count} novos alertas enviados.")
+            # 7. Manutenção do SQLite (checkpoint do WAL + optimize)
+            if db.maintenance_due():
+                result = db.maintenance()
+                logger.info(f"🧹 Manutenção do banco: {result['checkpointed']} páginas do WAL consolidadas.")
             
-            # Dormência
-            minutes = random.randint(HUNTER_SLEEP_MIN, HUNTER_SLEEP_MAX)
-            seconds = minutes * 60
-            next_run = datetime.now().timestamp() + seconds
-            next_run_str = datetime.fromtimestamp(next_run).strftime("%H:%M:%S")
-            logger.info(f"Dormindo por {minutes} min. Volta às {next_run_str}...")
-            time.sleep(seconds)
+            # Dormência até a próxima fonte vencer
+            _sleep_until_next(planner, all_sources)
 
         except KeyboardInterrupt:
             logger.info("Hunter Bot desativado pelo usuário.")
+            scheduler.cancel()
             sys.exit(0)
         except Exception as e:
             logger.error(f"ERRO CRÍTICO NO LOOP: {e}")
             time.sleep(60)
 
+def _sleep_until_next(planner, sources):
+    """Dorme até a próxima fonte vencer (mínimo de 1 minuto)."""
+    seconds = max(planner.seconds_until_next(sources), 60)
+    next_run_str = datetime.fromtimestamp(datetime.now().timestamp() + seconds).strftime("%H:%M:%S")
+    logger.info(f"Dormindo por {seconds / 60:.0f} min. Volta às {next_run_str}...")
+    time.sleep(seconds)
+
+
 if __name__ == '__main__':
     main_loop()
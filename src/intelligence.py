@@ -1,152 +1,84 @@
+import copy
 import re
 from typing import List, Dict
+
+from score_cache import ScoreCache, text_key
+from scoring_rules import RuleSet, ScoringRules, compile_scoring, get_watcher, keyword_boundaries
+
 try:
     from fuzzywuzzy import fuzz
 except ImportError:
     fuzz = None 
 
+# Padrões de salário (R$ 1000, 1.000,00, etc)
+# Regex captura: (R$ ou Bolsa) + (espaços opcionais) + (números com ponto/vírgula)
+SALARY_PATTERNS = [
+    re.compile(r'(?:salário|bolsa|remuneração)(?:\s+(?:auxílio|mensal|estágio))?\s*:?\s*(?:de\s*)?(?:r\$\s*)?([\d\.,]{3,})'),
+    re.compile(r'r\$\s*([\d\.,]{3,})'),
+]
+
+# Campos gravados por enhance_job_data / enhance_jobs
+ENHANCED_FIELDS = ("score", "is_relevant", "tags", "salario")
+
+TAG_ORDER = ("🔥 HOT", "🛡️ CYBER", "🐍 PYTHON")
+# Versão do código de scoring na chave do ScoreCache: o arquivo de regras não cobre
+# SALARY_PATTERNS, _topic_tags, o limite do HOT... Incrementar ao mudar qualquer um.
+SCORING_CODE_VERSION = 1
+# Campos que entram na chave do ScoreCache (o resto da vaga só influencia as tags)
+_KEY_FIELDS = {"titulo", "empresa", "descricao", "tags"}
+
+
 class Intelligence:
-    def __init__(self):
-        # CATEGORIAS COM PESOS (Scoring System)
-        self.weights = {
-            # Ouro: Se tiver isso, o score explode (Cyber & Infra)
-            "dream_job": {
-                "keywords": ["segurança", "security", "cyber", "ciber", "pentest", 
-                             "vulnerabilidade", "defensiva", "offensive", "red team", 
-                             "blue team", "nmap", "burp", "owasp", "soc", "noc"],
-                "points": 30
-            },
-            # Prata: O Core da sua busca (Dev & Suporte)
-            "core_tech": {
-                "keywords": ["python", "sql", "linux", "docker", "aws", "git", 
-                             "selenium", "automação", "script", "bash", "suporte", 
-                             "infraestrutura", "redes", "help desk", "service desk"],
-                "points": 15
-            },
-            # Geral TI (Termos genéricos para garantir que é TI)
-            "general_tech": {
-                "keywords": ["ti", "t.i.", "tecnologia", "informática", "computação", 
-                             "sistemas", "software", "desenvolvimento", "programação", "análise de dados",
-                             "desenvolvedor", "developer", "programador", "engenharia de software"],
-                "points": 10
-            },
-            # Bronze: Coisas que você sabe, mas não é o foco principal
-            "secondary": {
-                "keywords": ["django", "flask", "fastapi", "pandas", "react", 
-                             "javascript", "api", "rest", "html", "css", "java", "node", "c#", ".net",
-                             "golang", "go", "ruby", "php", "laravel", "spring", "vue", "angular",
-                             "ia", "ai", "artificial intelligence", "nlp", "llm"],
-                "points": 10
-            }
-        }
-
-        # Anti-patterns (Agora divididos por severidade)
-        # Block List: Mata a vaga imediatamente
-        self.block_list = [
-            "sênior", "senior", "specialist", "especialista", "manager", "gerente", "coordenador",
-            "motorista", "recepcionista", "estoquista", "operador de caixa", "atendente", "loja",
-            "auxiliar administrativo", "secretária", "enfermeiro", "técnico de enfermagem", "médico", 
-            "advogado", "cozinheiro", "garçom", "manobrista", "portaria", "vigilante", "limpeza",
-            "obra", "pedreiro", "servente", "eletricista predial", "mecânico", "produção",
-            "telemarketing", "call center", "cobrança", "rh", "recursos humanos", "departamento pessoal",
-            "contábil", "fiscal", "financeiro", "almoxarife", "logística"
-        ]
-        
-        self.penalty_list = ["pleno"] # Vendas removido da penalidade
+    def __init__(self, rules_path: str = None, score_cache: ScoreCache = None):
+        # Pesos, block list, penalidades e spam vêm do arquivo de regras
+        # (scoring_rules.json), recarregado sem reiniciar o hunter
+        self.watcher = get_watcher(rules_path)
+        # Vagas repetidas (mesmo título/empresa/descrição) reaproveitam o resultado
+        self.score_cache = score_cache
+        self._use(self.watcher.current)
+
+    def _use(self, ruleset: RuleSet):
+        # Cópias: ajustes em runtime (weights/block_list) não alteram o RuleSet compartilhado
+        self.ruleset = ruleset
+        self.weights = copy.deepcopy(ruleset.weights)
+        self.block_list = list(ruleset.block_list)
+        self.penalty_list = list(ruleset.penalty_list)
+        self.spam_keywords = list(ruleset.spam_keywords)
+        self.rules = ruleset.scoring
 
-        # Adicionar Sales como categoria de interesse
-        self.weights["sales"] = {
-            "keywords": ["sdr", "bdr", "vendas", "comercial", "closer", "inside sales", "customer success"],
-            "points": 20 # Pontuação alta para Vendas
-        }
+    def _refresh(self):
+        """Adota a versão nova do arquivo de regras, se houver (uma comparação de referência)."""
+        if self.watcher.current is not self.ruleset:
+            self._use(self.watcher.current)
+
+    def compile_rules(self):
+        """Recompila o matcher (chamar depois de alterar weights/block_list/penalty_list)."""
+        self.rules = compile_scoring(self.weights, self.block_list, self.penalty_list, self.spam_keywords)
+        return self.rules
 
     def verify_spam(self, text):
         """Verifica se a vaga tem cara de spam/golpe/curso/candidato."""
-        # Mantive sua lista que estava ótima, só adicionei uns gatilhos de 'bomba'
-        spam_keywords = [
-            "renda extra", "ganhar dinheiro", "seja seu chefe",
-            "marketing multinível", "sem investimento", "fature alto",
-            "trabalhe em casa digitando", "assistente de envio",
-            "ganhe dinheiro assistindo", "vagas ilimitadas",
-            "curso completo", "mentoria paga", "taxa de adesão",
-            "investimento inicial", "compre seu kit", "apenas com celular",
-            "pix diario", "pix diário", "ganhos rápidos", "dinheiro extra",
-            "for hire", "[for hire]", "seeking job", "seeking work",
-            "looking for job", "looking for work", "available for",
-            "procurando vaga", "busco oportunidade", "tenho experiência em",
-            "my portfolio", "meu portfólio", "open to work"
-        ]
-        
-        text_lower = str(text).lower()
-        for kw in spam_keywords:
-            if kw in text_lower:
-                return True, kw
-        return False, None
+        self._refresh()
+        kw = self.rules.first_spam(str(text).lower())
+        return (True, kw) if kw else (False, None)
 
     def safe_match(self, keyword, text):
         """Verifica se a keyword está no texto respeitando fronteiras de palavra para termos curtos."""
         keyword = keyword.lower().strip()
         text = text.lower()
-        
-        # Keywords curtas (< 4 chars) ou perigosas exigem regex \bWORD\b
-        # Ex: "ti", "go", "r", "c", "net", "ia", "bio", "agro"
-        dangerous = ["ti", "go", "r", "c", "net", "ia", "bio", "agro", "dev", "mec", "rh", "law", "qa", "ux", "ui"]
-        if len(keyword) < 4 or keyword in dangerous:
-            # Escape keyword special chars (like . or +)
-            # C# -> c\#
-            if keyword == "c++": pattern = r'\bc\+\+\b'
-            elif keyword == "c#": pattern = r'\bc#\b'
-            elif keyword == ".net": pattern = r'\.net\b'
-            elif keyword == "node.js": pattern = r'node\.js\b'
-            else: pattern = f'\\b{re.escape(keyword)}\\b'
-            
+
+        boundaries = keyword_boundaries(keyword)
+        if boundaries:
+            start, end = boundaries
+            pattern = (r'\b' if start else '') + re.escape(keyword) + (r'\b' if end else '')
             return bool(re.search(pattern, text))
-        
-        # Keywords longas podem usar substring (mas 'banco' em 'banco de dados' ok, mas 'bancario'?)
-        # 'Java' -> 'Javascript'? Não.
-        # Melhor usar regex pra tudo que for tech.
         return keyword in text
 
     def calculate_match_score(self, job: Dict) -> int:
-        score = 0
-        topic_hits = 0 # Contador de tópicos relevantes
-        
-        # Normaliza texto (Junta Título + Empresa + Descrição se tiver)
+        # Normaliza texto (Junta Título + Empresa) e faz uma passada no matcher compilado
+        self._refresh()
         text = (str(job.get('titulo', '') or '') + " " + str(job.get('empresa', '') or '')).lower()
-        
-        # 0. Filtro de SPAM (Kill Switch)
-        is_spam, _ = self.verify_spam(text)
-        if is_spam: return -999 
-        
-        # 1. Bloqueio Hard (Mata a vaga)
-        for block in self.block_list:
-            if block in text: return -1
-
-        # 2. Penalidade Soft
-        for penalty in self.penalty_list:
-            if penalty in text:
-                score -= 10
-
-        # 3. Cálculo de Pesos (Categorias)
-        for category, data in self.weights.items():
-            for kw in data["keywords"]:
-                if self.safe_match(kw, text):
-                    score += data["points"]
-                    topic_hits += 1
-                    break # Pontua apenas uma vez por categoria (evita spam de keywords)
-
-        # 4. Validação de Relevância
-        # Se não bateu em NENHUM tópico técnico ou de vendas, é lixo (ex: "Estágio em Direito")
-        if topic_hits == 0:
-            return 0
-        
-        # Bônus Crítico: Se for explicitamente "Estágio" ou "Junior" E tem relevância de tópico
-        if "estágio" in text or "estagiário" in text or "intern" in text:
-            score += 20
-        if "junior" in text or "júnior" in text or "trainee" in text:
-            score += 10
-            
-        return min(max(score, 0), 100) # Mantém entre 0 e 100
+        return self.rules.score(text)
 
     def is_duplicate(self, job: Dict, existing_jobs: List[Dict]) -> bool:
         # Mantive sua lógica Fuzzy que está perfeita
@@ -165,34 +97,76 @@ class Intelligence:
         return False
 
     def enhance_job_data(self, job: Dict) -> Dict:
-        job['score'] = self.calculate_match_score(job)
-        job['is_relevant'] = job['score'] > 0 # Só é relevante se pontuar positivo
-        
-        # Tagging automático pra ficar bonito no painel
-        job['tags'] = []
-        if job['score'] >= 80: job['tags'].append("🔥 HOT")
-        if "segurança" in str(job).lower() or "cyber" in str(job).lower(): job['tags'].append("🛡️ CYBER")
-        if "python" in str(job).lower(): job['tags'].append("🐍 PYTHON")
-        
-        # Extração de Salário
-        job['salario'] = self.extract_salary(str(job.get('descricao', '') or '') + " " + str(job.get('titulo', '') or ''))
-
+        self.enhance_jobs([job])
         return job
 
+    def enhance_jobs(self, jobs):
+        """
+        Versão em lote do enhance_job_data (ciclo inteiro ou rescoring do banco).
+
+        Aceita lista de dicts (anotados in-place) ou DataFrame (retorna uma cópia
+        com as colunas score/is_relevant/tags/salario). O texto de cada vaga é
+        normalizado uma vez e textos repetidos (no lote ou no score_cache) não são
+        pontuados de novo.
+        """
+        if hasattr(jobs, "to_dict"):  # pandas.DataFrame
+            records = jobs.to_dict("records")
+            self.enhance_jobs(records)
+            return jobs.assign(**{col: [job[col] for job in records] for col in ENHANCED_FIELDS})
+
+        self._refresh()
+        rules = self.rules
+        keys = [text_key(job.get('titulo'), job.get('empresa'), job.get('descricao')) for job in jobs]
+        version = f"{SCORING_CODE_VERSION}:{rules.version}"
+        cached = self.score_cache.get_many(version, keys) if self.score_cache is not None else {}
+        computed = {}
+        scores: Dict[str, int] = {}  # título+empresa já pontuados no lote
+        for job, key in zip(jobs, keys):
+            entry = cached.get(key) or computed.get(key)
+            if entry is None:
+                entry = computed[key] = self._score_entry(rules, job, scores)
+            score, tags, salario = entry
+
+            # Tags olham a vaga inteira (link, localização...), menos as tags antigas
+            rest = " ".join(str(value) for field, value in job.items() if field not in _KEY_FIELDS).lower()
+            found = set(tags).union(self._topic_tags(rest))
+
+            job['score'] = score
+            job['is_relevant'] = score > 0 # Só é relevante se pontuar positivo
+            job['tags'] = [tag for tag in TAG_ORDER if tag in found]
+            job['salario'] = salario
+
+        if self.score_cache is not None:
+            self.score_cache.put_many(version, computed)
+        return jobs
+
+    def _score_entry(self, rules: ScoringRules, job: Dict, scores: Dict[str, int]):
+        """(score, tags, salário) a partir de título, empresa e descrição."""
+        titulo = str(job.get('titulo', '') or '')
+        empresa = str(job.get('empresa', '') or '')
+        descricao = str(job.get('descricao', '') or '')
+
+        text = (titulo + " " + empresa).lower()
+        score = scores.get(text)
+        if score is None:
+            score = scores[text] = rules.score(text)
+        tags = ["🔥 HOT"] if score >= 80 else []
+        tags += self._topic_tags(f"{titulo} {empresa} {descricao}".lower())
+        return score, tuple(tags), self.extract_salary(descricao + " " + titulo)
+
+    @staticmethod
+    def _topic_tags(text: str) -> List[str]:
+        tags = []
+        if "segurança" in text or "cyber" in text: tags.append("🛡️ CYBER")
+        if "python" in text: tags.append("🐍 PYTHON")
+        return tags
+
     def extract_salary(self, text: str) -> str:
         """Extrai menções de salário ou bolsa do texto."""
-        import re
         text = text.lower()
         
-        # Padrões de salário (R$ 1000, 1.000,00, etc)
-        # Regex captura: (R$ ou Bolsa) + (espaços opcionais) + (números com ponto/vírgula)
-        patterns = [
-            r'(?:salário|bolsa|remuneração)(?:\s+(?:auxílio|mensal|estágio))?\s*:?\s*(?:de\s*)?(?:r\$\s*)?([\d\.,]{3,})',
-            r'r\$\s*([\d\.,]{3,})',
-        ]
-        
-        for p in patterns:
-            match = re.search(p, text)
+        for p in SALARY_PATTERNS:
+            match = p.search(text)
             if match:
                 value = match.group(1).strip()
                 # Limpeza básica (ignora valores muito pequenos que podem ser horas ou lixo)
@@ -204,4 +178,4 @@ class Intelligence:
                 except:
                     pass
                     
-        return None
\ No newline at end of file
+        return None
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+"""
+Matcher de Palavras-Chave - Aho-Corasick para o scoring.
+
+Todas as keywords (spam, block list, penalidades, categorias, bônus) viram um
+único autômato montado uma vez. O texto da vaga é percorrido em uma passada e
+o resultado é o conjunto de padrões encontrados, inclusive sobrepostos
+("segurança" dentro de "segurança patrimonial").
+
+Padrões com fronteira de palavra (termos curtos como "ti", "go", "c#")
+conferem o \\b no início/fim da ocorrência com a mesma regra do `re`
+(caractere de palavra = alfanumérico ou '_').
+"""
+
+from collections import deque
+from typing import Dict, Iterable, List, Set, Tuple
+
+# (keyword, exige \b no início, exige \b no fim)
+Pattern = Tuple[str, bool, bool]
+
+
+def _is_word(ch: str) -> bool:
+    return ch.isalnum() or ch == "_"
+
+
+def _at_boundary(text: str, pos: int) -> bool:
+    """Equivalente ao \\b do `re` na posição `pos`."""
+    before = pos > 0 and _is_word(text[pos - 1])
+    after = pos < len(text) and _is_word(text[pos])
+    return before != after
+
+
+class KeywordMatcher:
+    """Autômato Aho-Corasick: `find(text)` → ids (índices) dos padrões presentes."""
+
+    def __init__(self, patterns: Iterable[Pattern]):
+        self.patterns: List[Pattern] = list(patterns)
+
+        goto: List[Dict[str, int]] = [{}]
+        out: List[List[int]] = [[]]
+        for pid, (keyword, _, _) in enumerate(self.patterns):
+            if not keyword:
+                continue
+            node = 0
+            for ch in keyword:
+                nxt = goto[node].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[node][ch] = nxt
+                    goto.append({})
+                    out.append([])
+                node = nxt
+            out[node].append(pid)
+
+        # BFS: links de falha resolvidos numa tabela de transição completa
+        # (um dict.get por caractere na busca, sem voltar pela cadeia de falhas)
+        fail = [0] * len(goto)
+        delta: List[Dict[str, int]] = [dict() for _ in goto]
+        delta[0] = dict(goto[0])
+        pending = deque(goto[0].values())
+        while pending:
+            node = pending.popleft()
+            delta[node] = {**delta[fail[node]], **goto[node]}
+            out[node].extend(out[fail[node]])
+            for ch, child in goto[node].items():
+                fail[child] = delta[fail[node]].get(ch, 0)
+                pending.append(child)
+
+        self._delta = delta
+        self._out = [tuple(ids) for ids in out]
+        self._lengths = [len(keyword) for keyword, _, _ in self.patterns]
+
+    def __len__(self) -> int:
+        return len(self.patterns)
+
+    def find(self, text: str) -> Set[int]:
+        found: Set[int] = set()
+        delta, outputs = self._delta, self._out
+        node = 0
+        for end, ch in enumerate(text, 1):
+            node = delta[node].get(ch, 0)
+            if not outputs[node]:
+                continue
+            for pid in outputs[node]:
+                if pid in found:
+                    continue
+                _, start_boundary, end_boundary = self.patterns[pid]
+                if start_boundary and not _at_boundary(text, end - self._lengths[pid]):
+                    continue
+                if end_boundary and not _at_boundary(text, end):
+                    continue
+                found.add(pid)
+        return found
@@ -57,6 +57,37 @@ new_jobs_per_cycle = Histogram(
     buckets=(0, 10, 50, 100, 200, 500, 1000)
 )
 
+# Rate limiter state (by host)
+rate_limit_tokens = Gauge(
+    'rate_limit_tokens',
+    'Tokens currently available in the host bucket',
+    ['host']
+)
+
+rate_limit_blocked_seconds = Gauge(
+    'rate_limit_blocked_seconds',
+    'Seconds until the host quota is released',
+    ['host']
+)
+
+rate_limit_wait_seconds = Gauge(
+    'rate_limit_wait_seconds',
+    'Cumulative seconds spent waiting for host quota',
+    ['host']
+)
+
+# Score cache (memoized scoring by normalized job text)
+score_cache_hits_total = Counter(
+    'score_cache_hits_total',
+    'Jobs whose score was served from the score cache',
+    ['tier']
+)
+
+score_cache_misses_total = Counter(
+    'score_cache_misses_total',
+    'Jobs scored from scratch (not in the score cache)'
+)
+
 
 class MetricsTracker:
     """Helper class to track metrics with context manager"""
@@ -3,6 +3,8 @@ from telegram import Bot
 from telegram.error import TelegramError
 import logging
 
+from rate_limiter import limiter
+
 try:
     from config import TELEGRAM_TOKEN, TELEGRAM_CHAT_ID
 except ImportError:
@@ -22,6 +24,7 @@ class TelegramNotifier:
             return
             
         try:
+            await limiter.acquire_async("api.telegram.org")
             bot = Bot(token=self.token)
             await bot.send_message(chat_id=self.chat_id, text=message, parse_mode='Markdown')
             logger.info("📢 Notificação Telegram enviada com sucesso.")
@@ -48,13 +51,14 @@ class TelegramNotifier:
         loop.run_until_complete(self.send_message_async(msg))
         loop.close()
 
-    def send_daily_summary(self, jobs):
-        """Envia um resumo diário."""
+    def send_daily_summary(self, jobs, total: int = None):
+        """Envia um resumo diário (total: quantidade de vagas, se jobs for só o top)."""
         if not self.enabled or not jobs: return
         
         top_jobs = sorted(jobs, key=lambda x: x.get('score', 0), reverse=True)[:5]
+        total = len(jobs) if total is None else total
         
-        msg = f"📊 **Resumo JobPulse**\n\nForam encontradas {len(jobs)} vagas hoje.\n\n🔥 **Top 5 Melhores Matches:**\n"
+        msg = f"📊 **Resumo JobPulse**\n\nForam encontradas {total} vagas hoje.\n\n🔥 **Top 5 Melhores Matches:**\n"
         
         for i, job in enumerate(top_jobs, 1):
             msg += f"{i}. [{job['titulo']}]({job['link']}) - {job['empresa']} ({job.get('score')}pts)\n"
@@ -0,0 +1,236 @@
+# -*- coding: utf-8 -*-
+"""
+Pipeline de Vagas - Do scraper ao banco em streaming.
+
+Os scrapers publicam vagas numa fila limitada assim que as produzem (o
+ScraperScheduler chama `pipeline.put`). Uma thread consome a fila em
+micro-lotes: canonicalização → filtros → blacklist → dedupe → score → insert,
+e as vagas novas seguem para uma segunda thread de notificação
+(Discord/Telegram), que é lenta por causa do rate limit e não deve segurar as
+gravações.
+
+A memória fica proporcional ao lote, não ao volume do ciclo, e vagas de fontes
+rápidas chegam no banco (e no Discord) sem esperar as fontes lentas.
+
+Uso:
+    pipeline = JobPipeline(db, brain, notify=send).start()
+    scheduler.run(sources, sink=pipeline.put)
+    summary = pipeline.close()
+"""
+
+import heapq
+import logging
+import queue
+import threading
+import time
+from typing import Callable, Dict, List
+
+from canonical import canonicalize_job
+from config import PIPELINE_QUEUE_SIZE, PIPELINE_BATCH_SIZE, PIPELINE_FLUSH_SECONDS
+from filters import apply_all_filters
+from scoring_rules import current_rules
+
+logger = logging.getLogger("JobPipeline")
+
+_STOP = object()
+_PUT_POLL = 0.5  # s entre checagens de fechamento enquanto put() espera espaço na fila
+
+
+class JobPipeline:
+    """Fila limitada + estágios de processamento em threads próprias."""
+
+    def __init__(self, db, brain, notify: Callable[[Dict], bool] = None,
+                 batch_size: int = None, flush_interval: float = None,
+                 max_queue: int = None, max_days: int = 30, top_size: int = 5):
+        self.db = db
+        self.brain = brain
+        self.notify = notify
+        self.batch_size = batch_size or PIPELINE_BATCH_SIZE
+        self.flush_interval = PIPELINE_FLUSH_SECONDS if flush_interval is None else flush_interval
+        self.max_days = max_days
+        self.top_size = top_size
+
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue or PIPELINE_QUEUE_SIZE)
+        self._notify_queue: queue.Queue = queue.Queue()
+        self._threads: List[threading.Thread] = []
+        self._lock = threading.Lock()
+        self._top: List = []  # heap (score, seq, job) das melhores vagas do ciclo
+        self._seq = 0
+        self._closed = False
+
+        self.stats = {
+            "received": 0,
+            "filtered": 0,      # Antigas / domínios ruins / repetidas no lote
+            "blacklisted": 0,
+            "duplicates": 0,
+            "discarded": 0,     # Score < 0
+            "inserted": 0,
+            "notified": 0,
+            "batches": 0,
+            "dropped": 0,       # Publicadas com o pipeline fechado ou após o timeout
+            "new_by_source": {},
+        }
+
+    # ==================== CICLO DE VIDA ====================
+
+    def start(self) -> "JobPipeline":
+        for target, name in ((self._process_loop, "pipeline-process"),
+                             (self._notify_loop, "pipeline-notify")):
+            thread = threading.Thread(target=target, name=name, daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        return self
+
+    def put(self, source: str, job: Dict, timeout: float = None) -> bool:
+        """
+        Publica uma vaga (bloqueia se a fila estiver cheia: backpressure).
+        Retorna False se a vaga foi descartada: pipeline fechado (ninguém mais
+        consome a fila) ou `timeout` esgotado.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not self._closed:
+            wait = _PUT_POLL if deadline is None else min(_PUT_POLL, deadline - time.monotonic())
+            if wait <= 0:
+                break
+            try:
+                self._queue.put((source, job), timeout=wait)
+                return True
+            except queue.Full:
+                continue
+        with self._lock:
+            self.stats["dropped"] += 1
+        return False
+
+    def close(self) -> Dict:
+        """Processa o que restou na fila, espera as notificações e retorna as estatísticas."""
+        self._closed = True
+        self._queue.put(_STOP)
+        for thread in self._threads:
+            thread.join()
+        self._threads.clear()
+        with self._lock:
+            summary = dict(self.stats)
+            summary["new_by_source"] = dict(self.stats["new_by_source"])
+        return summary
+
+    def top_jobs(self) -> List[Dict]:
+        """Melhores vagas notificadas no ciclo (para o resumo do Telegram)."""
+        with self._lock:
+            return [job for _, _, job in sorted(self._top, reverse=True)]
+
+    # ==================== ESTÁGIO 1: PROCESSAMENTO ====================
+
+    def _process_loop(self):
+        batch = []
+        batch_started = None
+
+        while True:
+            timeout = None
+            if batch:
+                timeout = max(0.0, batch_started + self.flush_interval - time.monotonic())
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+
+            if item is _STOP:
+                self._flush(batch)
+                self._notify_queue.put(_STOP)
+                return
+
+            if item is not None:
+                if not batch:
+                    batch_started = time.monotonic()
+                batch.append(item)
+
+            if batch and (len(batch) >= self.batch_size
+                          or time.monotonic() - batch_started >= self.flush_interval):
+                self._flush(batch)
+                batch = []
+
+    def _flush(self, batch: List):
+        """Processa e grava um micro-lote (erros não derrubam o pipeline)."""
+        if not batch:
+            return
+        try:
+            self._process_batch(batch)
+        except Exception as e:
+            logger.error(f"Erro processando lote de {len(batch)} vagas: {e}")
+
+    def _process_batch(self, batch: List):
+        # 0. Canonicalização (canonical_key; o link fica como veio)
+        for _, job in batch:
+            canonicalize_job(job)
+
+        source_by_link = {}
+        for source, job in batch:
+            source_by_link.setdefault(job.get('link'), source)
+        jobs = [job for _, job in batch]
+
+        # 1. Filtrar vagas antigas (apenas últimos N dias) e repetidas no lote
+        recent_jobs = apply_all_filters(jobs, max_days=self.max_days)
+        counts = {"filtered": len(jobs) - len(recent_jobs), "blacklisted": 0,
+                  "duplicates": 0, "discarded": 0}
+        new_by_source: Dict[str, int] = {}
+
+        # 2. Filtro de Blacklist (Extermínio Imediato; title_blacklist do arquivo de regras)
+        rules = current_rules()
+        allowed = [job for job in recent_jobs if not rules.is_blacklisted_title(job['titulo'])]
+        counts["blacklisted"] = len(recent_jobs) - len(allowed)
+
+        # 3. Deduplicação via SQLite (lote inteiro numa consulta)
+        new_jobs = self.db.filter_new_jobs(allowed)
+        counts["duplicates"] = len(allowed) - len(new_jobs)
+
+        for job in new_jobs:
+            source = source_by_link.get(job.get('link'))
+            if source:
+                new_by_source[source] = new_by_source.get(source, 0) + 1
+
+        # 4. Calcular Score do lote (descartar lixo: score < 0)
+        scored = self.brain.enhance_jobs(new_jobs) if new_jobs else []
+        processed_jobs = [job for job in scored if job['score'] >= 0]
+        counts["discarded"] = len(scored) - len(processed_jobs)
+
+        # 5. Salvar no SQLite (micro-lote em uma transação)
+        inserted = self.db.add_jobs_batch(processed_jobs) if processed_jobs else 0
+
+        with self._lock:
+            self.stats["received"] += len(batch)
+            self.stats["batches"] += 1
+            self.stats["inserted"] += inserted
+            for key, value in counts.items():
+                self.stats[key] += value
+            for source, value in new_by_source.items():
+                self.stats["new_by_source"][source] = self.stats["new_by_source"].get(source, 0) + value
+
+        if inserted:
+            logger.info(f"💾 {inserted} vagas novas salvas no SQLite (lote de {len(batch)}).")
+
+        for job in processed_jobs:
+            self._notify_queue.put(job)
+
+    # ==================== ESTÁGIO 2: NOTIFICAÇÃO ====================
+
+    def _notify_loop(self):
+        while True:
+            job = self._notify_queue.get()
+            if job is _STOP:
+                return
+            if not self.notify:
+                continue
+            try:
+                if self.notify(job):
+                    self._remember(job)
+            except Exception as e:
+                logger.error(f"Erro notificando vaga: {e}")
+
+    def _remember(self, job: Dict):
+        with self._lock:
+            self.stats["notified"] += 1
+            self._seq += 1
+            entry = (job.get('score', 0), self._seq, job)
+            if len(self._top) < self.top_size:
+                heapq.heappush(self._top, entry)
+            else:
+                heapq.heappushpop(self._top, entry)
@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+"""
+Polling Planner - Intervalo de coleta adaptativo por fonte.
+
+Em vez de consultar todas as fontes a cada HUNTER_SLEEP_MIN/MAX minutos,
+estima a taxa de vagas novas de cada fonte (novas vagas / hora) a partir do
+histórico em `source_fetches` e agenda a próxima coleta para quando se
+espera ~POLL_TARGET_NEW_JOBS vagas novas. Fontes movimentadas são
+consultadas mais vezes; fontes paradas vão para o intervalo máximo.
+"""
+
+import logging
+import random
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from config import (
+    HUNTER_SLEEP_MIN, HUNTER_SLEEP_MAX,
+    POLL_INTERVAL_MIN, POLL_INTERVAL_MAX,
+    POLL_TARGET_NEW_JOBS, POLL_HISTORY_SIZE
+)
+
+logger = logging.getLogger("PollingPlanner")
+
+
+class PollingPlanner:
+    """Decide quais fontes estão 'vencidas' e quando acordar de novo."""
+
+    def __init__(self, db, min_interval: float = None, max_interval: float = None,
+                 target_new: float = None, history_size: int = None):
+        """
+        Args:
+            db: JobDatabase (fornece record_source_fetch/get_source_history)
+            min_interval / max_interval: limites do intervalo (minutos)
+            target_new: vagas novas esperadas por coleta
+            history_size: quantas coletas recentes usar na estimativa
+        """
+        self.db = db
+        self.min_interval = min_interval or POLL_INTERVAL_MIN
+        self.max_interval = max_interval or POLL_INTERVAL_MAX
+        self.target_new = target_new or POLL_TARGET_NEW_JOBS
+        self.history_size = history_size or POLL_HISTORY_SIZE
+        # Cache em memória: {fonte: (última coleta, intervalo em minutos)}
+        self._schedule: Dict[str, tuple] = {}
+
+    # ==================== ESTIMATIVA ====================
+
+    def estimate_rate(self, history: List[Dict]) -> Optional[float]:
+        """
+        Estima vagas novas por hora de uma fonte.
+        As vagas novas de uma coleta acumularam desde a coleta ok anterior,
+        então taxa = soma(novas) / soma(intervalos entre coletas ok). Coletas
+        com falha não contam: as horas delas entram na próxima coleta ok.
+        Retorna None se ainda não há histórico suficiente.
+        """
+        new_jobs = 0
+        hours = 0.0
+        previous = None
+
+        for fetch in history:
+            if fetch["status"] != "ok":
+                continue
+            fetched_at = datetime.fromisoformat(fetch["fetched_at"])
+            if previous is not None:
+                new_jobs += fetch["jobs_new"] or 0
+                hours += (fetched_at - previous).total_seconds() / 3600
+            previous = fetched_at
+
+        if hours <= 0:
+            return None
+        return new_jobs / hours
+
+    def interval_for(self, source: str) -> float:
+        """Intervalo (minutos) até a próxima coleta da fonte."""
+        history = self.db.get_source_history(source, limit=self.history_size)
+        rate = self.estimate_rate(history)
+
+        if rate is None:
+            # Fonte nova: mantém o comportamento antigo do hunter
+            return float(random.randint(HUNTER_SLEEP_MIN, HUNTER_SLEEP_MAX))
+        if rate <= 0:
+            return float(self.max_interval)
+
+        minutes = self.target_new / rate * 60
+        # Jitter de ±10% para as fontes não sincronizarem
+        minutes *= random.uniform(0.9, 1.1)
+        return float(min(max(minutes, self.min_interval), self.max_interval))
+
+    # ==================== AGENDA ====================
+
+    def _entry(self, source: str):
+        if source not in self._schedule:
+            history = self.db.get_source_history(source, limit=1)
+            last = datetime.fromisoformat(history[-1]["fetched_at"]) if history else None
+            self._schedule[source] = (last, self.interval_for(source))
+        return self._schedule[source]
+
+    def next_run(self, source: str) -> datetime:
+        """Momento da próxima coleta (agora, se nunca foi coletada)."""
+        last, interval = self._entry(source)
+        if last is None:
+            return datetime.min
+        return last + timedelta(minutes=interval)
+
+    def due_sources(self, sources: List[Dict], now: datetime = None) -> List[Dict]:
+        """Filtra as fontes cuja próxima coleta já venceu."""
+        now = now or datetime.now()
+        return [s for s in sources if self.next_run(s["name"]) <= now]
+
+    def seconds_until_next(self, sources: List[Dict], now: datetime = None) -> float:
+        """Segundos até a próxima fonte vencer (0 se alguma já venceu)."""
+        now = now or datetime.now()
+        if not sources:
+            return self.min_interval * 60
+        next_at = min(self.next_run(s["name"]) for s in sources)
+        return max((next_at - now).total_seconds(), 0.0)
+
+    def record(self, source: str, jobs_found: int, jobs_new: int,
+               status: str = "ok", now: datetime = None) -> float:
+        """
+        Registra uma coleta e recalcula o intervalo da fonte.
+
+        Returns:
+            Novo intervalo em minutos
+        """
+        now = now or datetime.now()
+        self.db.record_source_fetch(source, jobs_found, jobs_new, status=status, fetched_at=now)
+        interval = self.interval_for(source)
+        self._schedule[source] = (now, interval)
+        logger.info(f"⏲️ {source}: {jobs_new}/{jobs_found} novas, próxima coleta em {interval:.0f} min")
+        return interval
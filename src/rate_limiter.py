@@ -0,0 +1,225 @@
+# -*- coding: utf-8 -*-
+"""
+Rate Limiter - Token buckets por host, compartilhados por scrapers e notificadores.
+
+Cada host configurado em config.RATE_LIMITS tem um balde com capacidade (rajada)
+e taxa de reposição. Os headers do servidor (X-RateLimit-Remaining/Reset,
+X-RateLimit-Reset-After, Retry-After) corrigem o balde em tempo real, então só
+se dorme quando a cota realmente acabou - em vez de sleeps fixos.
+
+Uso:
+    from rate_limiter import limiter
+    limiter.acquire("api.github.com")            # threads
+    await limiter.acquire_async("discord.com")   # asyncio
+    limiter.update_from_headers("api.github.com", response.headers, response.status_code)
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from typing import Dict, Optional
+
+import requests
+
+from config import RATE_LIMITS, RATE_LIMIT_MAX_WAIT
+
+try:
+    import metrics
+except ImportError:
+    metrics = None
+
+logger = logging.getLogger("RateLimiter")
+
+
+class RateLimitExceeded(requests.exceptions.RequestException):
+    """A cota do host só libera depois do tempo máximo de espera."""
+
+
+class TokenBucket:
+    """
+    Balde de tokens. `rate` em tokens/segundo; rate=None significa sem limite
+    local (o balde só bloqueia quando o servidor manda esperar).
+    """
+
+    def __init__(self, capacity: float = None, rate: float = None):
+        self.capacity = capacity
+        self.rate = rate
+        self.tokens = capacity if capacity is not None else 0.0
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        # Estatísticas
+        self.acquired = 0
+        self.throttled = 0
+        self.wait_seconds = 0.0
+
+    @property
+    def unlimited(self) -> bool:
+        return self.rate is None
+
+    def _refill(self, now: float):
+        if not self.unlimited:
+            elapsed = max(now - self.updated, 0.0)
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+        self.updated = now
+
+    def reserve(self, now: float = None) -> float:
+        """Consome um token se houver; senão retorna quantos segundos esperar."""
+        now = time.monotonic() if now is None else now
+        self._refill(now)
+        if now < self.blocked_until:
+            return self.blocked_until - now
+        if self.unlimited:
+            return 0.0
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+    def block_for(self, seconds: float, now: float = None):
+        now = time.monotonic() if now is None else now
+        self.blocked_until = max(self.blocked_until, now + seconds)
+
+    def apply_server_state(self, remaining: Optional[int], reset_after: Optional[float], now: float = None):
+        """Ajusta o balde ao que o servidor informou."""
+        now = time.monotonic() if now is None else now
+        self._refill(now)
+        if remaining is None:
+            return
+        if not self.unlimited:
+            self.tokens = min(self.tokens, float(remaining))
+        if remaining <= 0 and reset_after is not None:
+            self.block_for(reset_after, now)
+
+    def state(self, now: float = None) -> Dict:
+        now = time.monotonic() if now is None else now
+        self._refill(now)
+        return {
+            "tokens": None if self.unlimited else round(self.tokens, 2),
+            "capacity": self.capacity,
+            "rate_per_second": self.rate,
+            "blocked_for": round(max(self.blocked_until - now, 0.0), 2),
+            "acquired": self.acquired,
+            "throttled": self.throttled,
+            "wait_seconds": round(self.wait_seconds, 2),
+        }
+
+
+class RateLimiter:
+    """Registro de TokenBuckets por host (thread-safe)."""
+
+    def __init__(self, limits: Dict[str, Dict] = None, max_wait: float = None):
+        self.limits = RATE_LIMITS if limits is None else limits
+        self.max_wait = RATE_LIMIT_MAX_WAIT if max_wait is None else max_wait
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def bucket(self, host: str) -> TokenBucket:
+        with self._lock:
+            return self._bucket(host)
+
+    def _bucket(self, host: str) -> TokenBucket:
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            limit = self.limits.get(host)
+            if limit:
+                bucket = TokenBucket(capacity=limit["capacity"], rate=limit["per_second"])
+            else:
+                bucket = TokenBucket()
+            self._buckets[host] = bucket
+        return bucket
+
+    def _reserve(self, host: str, deadline: float) -> float:
+        """Tenta pegar um token; retorna a espera necessária (0 = liberado)."""
+        with self._lock:
+            bucket = self._bucket(host)
+            wait = bucket.reserve()
+            if wait <= 0:
+                bucket.acquired += 1
+                self._publish(host, bucket)
+                return 0.0
+            if time.monotonic() + wait > deadline:
+                raise RateLimitExceeded(f"Cota de {host} só libera em {wait:.0f}s")
+            bucket.throttled += 1
+            bucket.wait_seconds += wait
+            return wait
+
+    def acquire(self, host: str, max_wait: float = None) -> None:
+        """Bloqueia a thread até haver cota para o host."""
+        deadline = time.monotonic() + (self.max_wait if max_wait is None else max_wait)
+        while True:
+            wait = self._reserve(host, deadline)
+            if wait <= 0:
+                return
+            logger.debug(f"Rate limit {host}: aguardando {wait:.1f}s...")
+            time.sleep(wait)
+
+    async def acquire_async(self, host: str, max_wait: float = None) -> None:
+        """Versão asyncio de acquire()."""
+        deadline = time.monotonic() + (self.max_wait if max_wait is None else max_wait)
+        while True:
+            wait = self._reserve(host, deadline)
+            if wait <= 0:
+                return
+            await asyncio.sleep(wait)
+
+    def penalize(self, host: str, seconds: float) -> None:
+        """Bloqueia o host por `seconds` (ex.: Retry-After de um 429)."""
+        with self._lock:
+            bucket = self._bucket(host)
+            bucket.block_for(seconds)
+            self._publish(host, bucket)
+
+    def update_from_headers(self, host: str, headers, status_code: int = 200) -> None:
+        """
+        Lê os headers de cota do servidor:
+            - X-RateLimit-Remaining + X-RateLimit-Reset-After (Discord)
+            - X-RateLimit-Remaining + X-RateLimit-Reset (epoch, GitHub/Discord)
+            - Retry-After em respostas 429/403
+        """
+        remaining = _to_float(headers.get("X-RateLimit-Remaining"))
+        reset_after = _to_float(headers.get("X-RateLimit-Reset-After"))
+        if reset_after is None:
+            reset_at = _to_float(headers.get("X-RateLimit-Reset"))
+            if reset_at is not None:
+                reset_after = max(reset_at - time.time(), 0.0)
+
+        retry_after = _to_float(headers.get("Retry-After"))
+
+        with self._lock:
+            bucket = self._bucket(host)
+            if remaining is not None:
+                bucket.apply_server_state(int(remaining), reset_after)
+            if status_code in (403, 429) and retry_after is not None:
+                bucket.block_for(retry_after)
+            elif status_code == 429:
+                bucket.block_for(reset_after if reset_after is not None else 60)
+            self._publish(host, bucket)
+
+    def state(self) -> Dict[str, Dict]:
+        """Estado de todos os baldes (para logs/métricas)."""
+        with self._lock:
+            return {host: bucket.state() for host, bucket in self._buckets.items()}
+
+    @staticmethod
+    def _publish(host: str, bucket: TokenBucket):
+        if not metrics:
+            return
+        state = bucket.state()
+        if state["tokens"] is not None:
+            metrics.rate_limit_tokens.labels(host=host).set(state["tokens"])
+        metrics.rate_limit_blocked_seconds.labels(host=host).set(state["blocked_for"])
+        metrics.rate_limit_wait_seconds.labels(host=host).set(state["wait_seconds"])
+
+
+def _to_float(value) -> Optional[float]:
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+# Limitador compartilhado pelo processo
+limiter = RateLimiter()
@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+"""
+Rescoring - Recalcula score/tags/is_relevant da tabela jobs inteira.
+
+O score só é calculado na ingestão, então ajustar `Intelligence.weights` ou a
+block_list deixa as vagas antigas com valores velhos. Este comando:
+    - lê a tabela em blocos por id (keyset, leituras curtas)
+    - pontua os blocos num pool de processos (enhance_jobs em lote)
+    - grava cada bloco com temp table + UPDATE ... FROM numa transação curta
+      (em WAL os leitores da API não ficam bloqueados)
+    - guarda um checkpoint (versão das regras + último id) na mesma transação,
+      então um rescoring interrompido continua de onde parou
+
+Uso:
+    python src/rescore.py [--db data/jobs.db] [--workers 4] [--chunk 5000] [--restart]
+"""
+
+import argparse
+import json
+import logging
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List
+
+from config import RESCORE_CHUNK_SIZE, RESCORE_WORKERS
+from database import JobDatabase
+from intelligence import Intelligence
+from score_cache import ScoreCache
+
+logger = logging.getLogger("Rescore")
+
+CHECKPOINT_KEY = "rescore_checkpoint"
+
+_worker_brain = None
+
+
+def _init_worker(weights: Dict, block_list: List[str], penalty_list: List[str],
+                 spam_keywords: List[str], version: str):
+    """Cada processo compila as mesmas regras do processo principal (conferido pela versão)."""
+    global _worker_brain
+    brain = Intelligence(score_cache=ScoreCache(path=None))  # títulos repetidos, só em memória
+    brain.weights, brain.block_list, brain.penalty_list = weights, block_list, penalty_list
+    brain.spam_keywords = spam_keywords
+    brain.compile_rules()
+    if brain.rules.version != version:
+        raise RuntimeError(f"Worker compilou as regras {brain.rules.version}, esperado {version}")
+    _worker_brain = brain
+
+
+def score_chunk(brain: Intelligence, rows: List[Dict]) -> List[Dict]:
+    """Pontua um bloco de linhas e devolve só o que será gravado."""
+    return [
+        {"id": job["id"], "score": job["score"], "is_relevant": job["is_relevant"], "tags": job["tags"]}
+        for job in brain.enhance_jobs(rows)
+    ]
+
+
+def _score_in_worker(rows: List[Dict]) -> List[Dict]:
+    return score_chunk(_worker_brain, rows)
+
+
+def rescore(db: JobDatabase, brain: Intelligence = None, workers: int = None,
+            chunk_size: int = None, restart: bool = False) -> Dict:
+    """
+    Recalcula a tabela inteira com as regras atuais de `brain`.
+    workers <= 1 pontua no próprio processo. Retorna as estatísticas da execução.
+    """
+    brain = brain or Intelligence()
+    workers = RESCORE_WORKERS if workers is None else workers
+    chunk_size = chunk_size or RESCORE_CHUNK_SIZE
+    version = brain.rules.version
+
+    # Checkpoint só vale para a mesma versão das regras
+    after_id = 0
+    saved = None if restart else db.get_meta(CHECKPOINT_KEY)
+    if saved:
+        state = json.loads(saved)
+        if state.get("rules") == version:
+            after_id = state["last_id"]
+            logger.info(f"♻️ Retomando rescoring após o id {after_id}")
+
+    stats = {"rules": version, "resumed_from": after_id, "scanned": 0, "updated": 0, "chunks": 0}
+    started = time.monotonic()
+
+    def write(rows: List[Dict], scored: List[Dict]):
+        last_id = rows[-1]["id"]
+        stats["updated"] += db.apply_scores(
+            scored, checkpoint=json.dumps({"rules": version, "last_id": last_id})
+        )
+        stats["scanned"] += len(rows)
+        stats["chunks"] += 1
+        logger.info(f"📝 {stats['scanned']} vagas reavaliadas ({stats['updated']} alteradas)")
+
+    chunks = db.iter_job_chunks(after_id, chunk_size)
+    if workers <= 1:
+        for rows in chunks:
+            write(rows, score_chunk(brain, rows))
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(brain.weights, brain.block_list, brain.penalty_list,
+                                           brain.spam_keywords, version)) as pool:
+            # Blocos gravados na ordem de leitura: o checkpoint nunca pula um bloco pendente
+            pending = deque()
+            for rows in chunks:
+                pending.append((rows, pool.submit(_score_in_worker, rows)))
+                if len(pending) >= workers * 2:
+                    done_rows, future = pending.popleft()
+                    write(done_rows, future.result())
+            while pending:
+                done_rows, future = pending.popleft()
+                write(done_rows, future.result())
+
+    db.set_meta(CHECKPOINT_KEY, None)
+    stats["seconds"] = round(time.monotonic() - started, 2)
+    return stats
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Recalcula score/tags de todas as vagas")
+    parser.add_argument("--db", default=None, help="Database path (default: config.DB_PATH)")
+    parser.add_argument("--workers", type=int, default=RESCORE_WORKERS)
+    parser.add_argument("--chunk", type=int, default=RESCORE_CHUNK_SIZE)
+    parser.add_argument("--restart", action="store_true", help="Ignora o checkpoint salvo")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    db = JobDatabase(args.db)
+    print(f"Rescoring: {rescore(db, workers=args.workers, chunk_size=args.chunk, restart=args.restart)}")
+    db.close()
@@ -0,0 +1,224 @@
+# -*- coding: utf-8 -*-
+"""
+Scheduler de Scrapers - Executa todas as fontes em paralelo.
+
+Cada fonte roda na sua própria thread com um deadline individual, e o ciclo
+inteiro tem um orçamento de tempo. Fontes que estouram o prazo (ou um ciclo
+cancelado) são abandonadas e o ciclo devolve os resultados das fontes que
+já terminaram.
+
+Com `sink`, as vagas são repassadas uma a uma (ex.: para o JobPipeline)
+assim que cada scraper as produz, em vez de acumuladas até o fim do ciclo.
+Só scrapers generators (hoje o JobSpy.iter_jobs) entregam durante a coleta;
+os que devolvem lista são repassados quando terminam.
+
+O sink recebe `timeout` (o que resta do deadline da fonte) e pode descartar
+a vaga: uma fonte abandonada nunca fica presa num sink que não consome mais.
+"""
+
+import logging
+import queue
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+from config import SCRAPER_TIMEOUT_DEFAULT, CYCLE_BUDGET_SECONDS
+
+try:
+    import metrics
+except ImportError:
+    metrics = None
+
+logger = logging.getLogger("ScraperScheduler")
+
+# Intervalo máximo entre checagens de cancelamento/deadline (segundos)
+_POLL_INTERVAL = 1.0
+
+
+class ScraperScheduler:
+    """
+    Executa fontes de vagas concorrentemente com deadline por fonte.
+
+    Cada fonte é um dict no mesmo formato usado pelo async_hunter:
+        {"name": str, "scraper": callable, "args": tuple, "timeout": float}
+    ("args" e "timeout" são opcionais).
+
+    As threads são daemon: uma fonte travada nunca impede o processo de
+    encerrar, e enquanto ela não terminar não é disparada de novo nos
+    próximos ciclos (status "skipped").
+    """
+
+    def __init__(self, default_timeout: float = None, cycle_budget: float = None):
+        self.default_timeout = default_timeout or SCRAPER_TIMEOUT_DEFAULT
+        self.cycle_budget = cycle_budget or CYCLE_BUDGET_SECONDS
+        self._cancel = threading.Event()
+        self._threads: Dict[str, threading.Thread] = {}
+
+    def cancel(self):
+        """Cancela o ciclo em andamento; run() retorna o que já terminou."""
+        self._cancel.set()
+
+    def is_running(self, name: str) -> bool:
+        """Indica se uma fonte (possivelmente de um ciclo anterior) ainda está rodando."""
+        thread = self._threads.get(name)
+        return thread is not None and thread.is_alive()
+
+    def run(self, sources: List[Dict], sink: Optional[Callable[..., object]] = None) -> Dict:
+        """
+        Executa as fontes e espera até todas terminarem, estourarem o
+        deadline ou o orçamento do ciclo acabar.
+
+        Args:
+            sources: Fontes a executar
+            sink: Se informado, recebe (fonte, vaga, timeout=segundos restantes)
+                  em streaming e as vagas não são acumuladas no resultado.
+                  Vagas produzidas depois do deadline da fonte são descartadas.
+
+        Returns:
+            Dict com:
+                - jobs: vagas de todas as fontes concluídas (vazio com sink)
+                - sources: {nome: {"status", "jobs", "count", "duration", "error"}}
+                - duration: duração total do ciclo em segundos
+        """
+        self._cancel.clear()
+        cycle_start = time.monotonic()
+        budget_deadline = cycle_start + self.cycle_budget
+
+        # Cada ciclo tem sua própria fila: resultados atrasados de fontes
+        # abandonadas em ciclos anteriores nunca vazam para este.
+        results = queue.Queue()
+        deadlines = {}
+        report = {}
+
+        for source in sources:
+            name = source["name"]
+            if self.is_running(name):
+                logger.warning(f"⏭️ {name}: execução anterior ainda em andamento, pulando")
+                report[name] = self._entry("skipped")
+                continue
+
+            timeout = source.get("timeout") or self.default_timeout
+            thread = threading.Thread(
+                target=self._worker,
+                args=(source, results, sink, lambda name=name: self._remaining(deadlines, name)),
+                name=f"scraper-{name}",
+                daemon=True
+            )
+            self._threads[name] = thread
+            deadlines[name] = time.monotonic() + timeout
+            thread.start()
+
+        while deadlines:
+            now = time.monotonic()
+
+            if self._cancel.is_set():
+                self._abandon(deadlines, report, "cancelled")
+                break
+
+            if now >= budget_deadline:
+                logger.warning(f"⏱️ Orçamento do ciclo ({self.cycle_budget}s) esgotado")
+                self._abandon(deadlines, report, "timeout")
+                break
+
+            for name, deadline in list(deadlines.items()):
+                if now >= deadline:
+                    logger.warning(f"⏱️ {name}: deadline estourado, resultado descartado")
+                    report[name] = self._entry("timeout", duration=now - cycle_start)
+                    del deadlines[name]
+
+            if not deadlines:
+                break
+
+            wait_for = min(min(deadlines.values()), budget_deadline) - now
+            try:
+                name, jobs, count, error, duration = results.get(timeout=max(0.0, min(wait_for, _POLL_INTERVAL)))
+            except queue.Empty:
+                continue
+
+            if name not in deadlines:
+                continue  # Chegou depois do deadline
+            del deadlines[name]
+
+            if error is not None:
+                logger.error(f"Erro {name}: {error}")
+                report[name] = self._entry("error", jobs=jobs, count=count, duration=duration, error=str(error))
+            else:
+                logger.info(f"✅ {name}: {count} vagas em {duration:.1f}s")
+                report[name] = self._entry("ok", jobs=jobs, count=count, duration=duration)
+
+        all_jobs = []
+        for entry in report.values():
+            all_jobs.extend(entry["jobs"])
+
+        return {
+            "jobs": all_jobs,
+            "sources": report,
+            "duration": time.monotonic() - cycle_start
+        }
+
+    @staticmethod
+    def _remaining(deadlines: Dict, name: str) -> Optional[float]:
+        """Segundos até o deadline da fonte (None se ela já foi abandonada)."""
+        deadline = deadlines.get(name)
+        return None if deadline is None else deadline - time.monotonic()
+
+    def _worker(self, source: Dict, results: queue.Queue, sink=None, remaining=None):
+        """Executa uma fonte e publica (nome, vagas, contagem, erro, duração) na fila do ciclo."""
+        name = source["name"]
+        scraper = source["scraper"]
+        args = source.get("args", ())
+        start = time.monotonic()
+        jobs, error = [], None
+        count = 0
+
+        try:
+            if metrics:
+                with metrics.MetricsTracker(name):
+                    for job in scraper(*args) or []:
+                        count += 1
+                        self._emit(name, job, jobs, sink, remaining)
+                metrics.jobs_scraped_total.labels(source=name).inc(count)
+            else:
+                for job in scraper(*args) or []:
+                    count += 1
+                    self._emit(name, job, jobs, sink, remaining)
+        except Exception as e:
+            error = e
+            if sink is None:
+                jobs, count = [], 0  # Sem streaming, erro descarta a fonte inteira
+        finally:
+            results.put((name, jobs, count, error, time.monotonic() - start))
+            # Libera a fonte para os próximos ciclos, mesmo se ela foi abandonada
+            if self._threads.get(name) is threading.current_thread():
+                del self._threads[name]
+
+    @staticmethod
+    def _emit(name: str, job: Dict, jobs: List[Dict], sink, remaining):
+        """Repassa a vaga ao sink (se a fonte ainda está no prazo) ou acumula."""
+        if sink is None:
+            jobs.append(job)
+        elif remaining is None:
+            sink(name, job)
+        else:
+            left = remaining()
+            if left is not None and left > 0:
+                sink(name, job, timeout=left)
+
+    @staticmethod
+    def _abandon(deadlines: Dict, report: Dict, status: str):
+        """Marca todas as fontes ainda pendentes com o status dado."""
+        for name in deadlines:
+            report[name] = ScraperScheduler._entry(status)
+        deadlines.clear()
+
+    @staticmethod
+    def _entry(status: str, jobs: List[Dict] = None, count: int = None,
+               duration: float = 0.0, error: str = None) -> Dict:
+        jobs = jobs or []
+        return {
+            "status": status,
+            "jobs": jobs,
+            "count": len(jobs) if count is None else count,
+            "duration": duration,
+            "error": error
+        }
@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+"""
+Score Cache - Memoização do scoring por texto normalizado da vaga.
+
+A mesma dupla título+empresa ("Estágio TI" num banco grande) aparece em várias
+fontes e ciclos. O resultado do scoring (score, tags, salário) é guardado por
+(versão do código + versão das regras, hash do texto normalizado):
+    - LRU em memória limitada (SCORE_CACHE_SIZE entradas)
+    - SQLite em disco (SCORE_CACHE_PATH), que sobrevive a reinícios do hunter
+
+As versões fazem parte da chave: mudar o arquivo de regras (ou os pesos em
+runtime) ou o código de scoring (SCORING_CODE_VERSION) nunca devolve um score
+antigo. Entradas gravadas há mais
+de SCORE_CACHE_MAX_AGE_DAYS são removidas ao abrir o cache.
+
+Contadores de acerto/erro vão para o Prometheus (metrics.py) e para `stats()`.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional, Tuple
+
+from config import SCORE_CACHE_PATH, SCORE_CACHE_SIZE, SCORE_CACHE_MAX_AGE_DAYS
+
+try:
+    import metrics
+except ImportError:
+    metrics = None
+
+# (score, tags, salário)
+Entry = Tuple[int, Tuple[str, ...], Optional[str]]
+
+_SQL_CHUNK = 500  # Chaves por SELECT ... IN (...)
+
+
+def text_key(titulo, empresa, descricao) -> str:
+    """Hash dos campos que decidem score/tags/salário, normalizados (minúsculas)."""
+    text = "\x00".join(str(value or "").lower() for value in (titulo, empresa, descricao))
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class ScoreCache:
+    """LRU em memória + tabela SQLite opcional (path=None: só memória)."""
+
+    def __init__(self, path: Optional[str] = SCORE_CACHE_PATH, size: int = None):
+        self.size = size or SCORE_CACHE_SIZE
+        self._memory: "OrderedDict[Tuple[str, str], Entry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0}
+        self._conn = None
+        if path:
+            if os.path.dirname(path):
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+            self._conn = sqlite3.connect(path, check_same_thread=False, timeout=5)
+            with self._lock:
+                self._conn.execute("""
+                    CREATE TABLE IF NOT EXISTS score_cache (
+                        rules TEXT,
+                        text_hash TEXT,
+                        score INTEGER,
+                        tags TEXT,
+                        salario TEXT,
+                        stored_at REAL,
+                        PRIMARY KEY (rules, text_hash)
+                    ) WITHOUT ROWID
+                """)
+                self._conn.commit()
+            self.prune(SCORE_CACHE_MAX_AGE_DAYS)
+
+    def __len__(self) -> int:
+        return len(self._memory)
+
+    def get_many(self, rules: str, keys: Iterable[str]) -> Dict[str, Entry]:
+        """Entradas encontradas (memória, depois disco) para as chaves pedidas."""
+        found: Dict[str, Entry] = {}
+        pending = []
+        with self._lock:
+            for key in dict.fromkeys(keys):
+                entry = self._memory.get((rules, key))
+                if entry is None:
+                    pending.append(key)
+                    continue
+                self._memory.move_to_end((rules, key))
+                found[key] = entry
+            memory_hits = len(found)
+
+            if pending and self._conn is not None:
+                for start in range(0, len(pending), _SQL_CHUNK):
+                    chunk = pending[start:start + _SQL_CHUNK]
+                    rows = self._conn.execute(f"""
+                        SELECT text_hash, score, tags, salario FROM score_cache
+                        WHERE rules = ? AND text_hash IN ({", ".join("?" * len(chunk))})
+                    """, [rules, *chunk]).fetchall()
+                    for key, score, tags, salario in rows:
+                        entry = (score, tuple(json.loads(tags)), salario)
+                        found[key] = entry
+                        self._remember((rules, key), entry)
+        self._count(memory_hits, len(found) - memory_hits, len(pending) - (len(found) - memory_hits))
+        return found
+
+    def put_many(self, rules: str, entries: Dict[str, Entry]) -> None:
+        if not entries:
+            return
+        with self._lock:
+            for key, entry in entries.items():
+                self._remember((rules, key), entry)
+            if self._conn is not None:
+                now = time.time()
+                self._conn.executemany("""
+                    INSERT OR REPLACE INTO score_cache (rules, text_hash, score, tags, salario, stored_at)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                """, [(rules, key, score, json.dumps(list(tags)), salario, now)
+                      for key, (score, tags, salario) in entries.items()])
+                self._conn.commit()
+
+    def prune(self, max_age_days: float) -> int:
+        """Remove entradas gravadas há mais de max_age_days (ex.: versões antigas das regras)."""
+        if self._conn is None:
+            return 0
+        cutoff = time.time() - max_age_days * 86400
+        with self._lock:
+            cursor = self._conn.execute("DELETE FROM score_cache WHERE stored_at < ?", (cutoff,))
+            self._conn.commit()
+            return cursor.rowcount
+
+    def stats(self) -> Dict:
+        with self._lock:
+            snapshot = dict(self._stats)
+        lookups = snapshot["memory_hits"] + snapshot["disk_hits"] + snapshot["misses"]
+        snapshot["hit_rate"] = round((lookups - snapshot["misses"]) / lookups, 3) if lookups else 0.0
+        return snapshot
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    # ==================== HELPERS ====================
+
+    def _remember(self, key: Tuple[str, str], entry: Entry):
+        """Insere no LRU (chamado com o lock)."""
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.size:
+            self._memory.popitem(last=False)
+
+    def _count(self, memory_hits: int, disk_hits: int, misses: int):
+        with self._lock:
+            self._stats["memory_hits"] += memory_hits
+            self._stats["disk_hits"] += disk_hits
+            self._stats["misses"] += misses
+        if metrics:
+            if memory_hits:
+                metrics.score_cache_hits_total.labels(tier="memory").inc(memory_hits)
+            if disk_hits:
+                metrics.score_cache_hits_total.labels(tier="disk").inc(disk_hits)
+            if misses:
+                metrics.score_cache_misses_total.inc(misses)
@@ -0,0 +1,278 @@
+# -*- coding: utf-8 -*-
+"""
+Regras de Scoring - Arquivo externo, compilado uma vez por versão.
+
+Todas as listas de palavras que decidem o destino de uma vaga ficam em
+scoring_rules.json (config.SCORING_RULES_PATH):
+    - weights / block_list / penalty_list / spam_keywords → Intelligence
+    - title_blacklist     → descarte imediato no pipeline
+    - blacklisted_domains → filters.filter_blacklisted_domains
+    - gold_keywords       → "VAGA PERFEITA" no Discord e no dashboard
+
+O RulesWatcher confere o arquivo a cada SCORING_RULES_POLL_SECONDS numa
+thread própria. Um arquivo novo é validado e compilado fora do caminho
+quente e entra com uma única troca de referência; arquivo inválido é
+ignorado (as regras anteriores continuam valendo). Regras compiladas ficam em
+cache pelo hash do conteúdo: voltar a uma versão anterior não recompila nada.
+"""
+
+import copy
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+from config import SCORING_RULES_PATH, SCORING_RULES_POLL_SECONDS
+from keyword_matcher import KeywordMatcher
+
+logger = logging.getLogger("ScoringRules")
+
+REQUIRED_KEYS = ("weights", "block_list", "penalty_list", "spam_keywords",
+                 "title_blacklist", "blacklisted_domains", "gold_keywords")
+
+# Keywords curtas (< 4 chars) ou perigosas exigem fronteira de palavra \bWORD\b
+BOUNDARY_KEYWORDS = ["ti", "go", "r", "c", "net", "ia", "bio", "agro", "dev", "mec", "rh", "law", "qa", "ux", "ui"]
+# ...exceto no início destas (o '.' já separa: "asp.net", "vue + node.js")
+_OPEN_START = {".net", "node.js"}
+
+# Bônus de nível (substring)
+INTERN_KEYWORDS = ["estágio", "estagiário", "intern"]
+JUNIOR_KEYWORDS = ["junior", "júnior", "trainee"]
+
+_CACHE_SIZE = 8  # Versões compiladas mantidas em memória
+
+
+def content_hash(data) -> str:
+    """Hash do conteúdo (JSON canônico): espaços e ordem das chaves não mudam a versão."""
+    return hashlib.blake2b(
+        json.dumps(data, ensure_ascii=False, sort_keys=True).encode("utf-8"), digest_size=8
+    ).hexdigest()
+
+
+def keyword_boundaries(keyword: str) -> Optional[Tuple[bool, bool]]:
+    """(\\b no início, \\b no fim) para termos curtos/perigosos; None = substring."""
+    if len(keyword) < 4 or keyword in BOUNDARY_KEYWORDS:
+        return keyword not in _OPEN_START, True
+    return None
+
+
+class ScoringRules:
+    """Listas de keywords compiladas num único KeywordMatcher (uma passada por vaga)."""
+
+    def __init__(self, weights: Dict, block_list: List[str], penalty_list: List[str],
+                 spam_keywords: List[str]):
+        patterns = []
+
+        def add(keywords, safe=False):
+            ids = []
+            for kw in keywords:
+                if safe:
+                    kw = kw.lower().strip()
+                    start, end = keyword_boundaries(kw) or (False, False)
+                else:
+                    start = end = False
+                ids.append(len(patterns))
+                patterns.append((kw, start, end))
+            return frozenset(ids)
+
+        # Versão = hash das listas: identifica scores calculados com estas regras
+        self.version = content_hash(
+            [spam_keywords, block_list, penalty_list, weights, INTERN_KEYWORDS, JUNIOR_KEYWORDS]
+        )
+
+        self.spam = add(spam_keywords)
+        self.block = add(block_list)
+        self.penalty = add(penalty_list)
+        self.categories = [(add(data["keywords"], safe=True), data["points"])
+                           for data in weights.values()]
+        self.intern = add(INTERN_KEYWORDS)
+        self.junior = add(JUNIOR_KEYWORDS)
+        self.matcher = KeywordMatcher(patterns)
+
+    def first_spam(self, text: str) -> Optional[str]:
+        """Primeiro gatilho de spam (na ordem da lista) presente no texto."""
+        hits = self.matcher.find(text) & self.spam
+        return self.matcher.patterns[min(hits)][0] if hits else None
+
+    def score(self, text: str) -> int:
+        """Score de um texto já em minúsculas (mesmas regras de calculate_match_score)."""
+        hits = self.matcher.find(text)
+        if not hits:
+            return 0
+
+        # 0. Spam (Kill Switch) / 1. Bloqueio Hard
+        if not hits.isdisjoint(self.spam):
+            return -999
+        if not hits.isdisjoint(self.block):
+            return -1
+
+        # 2. Penalidade Soft (cada termo da lista conta)
+        score = -10 * len(hits & self.penalty)
+
+        # 3. Categorias: pontua apenas uma vez cada
+        topic_hits = 0
+        for ids, points in self.categories:
+            if not hits.isdisjoint(ids):
+                score += points
+                topic_hits += 1
+
+        # 4. Sem nenhum tópico técnico ou de vendas é lixo
+        if topic_hits == 0:
+            return 0
+
+        if not hits.isdisjoint(self.intern):
+            score += 20
+        if not hits.isdisjoint(self.junior):
+            score += 10
+
+        return min(max(score, 0), 100)
+
+
+class RuleSet:
+    """Uma versão do arquivo de regras, já compilada (imutável depois de criada)."""
+
+    def __init__(self, data: Dict, version: str):
+        missing = [key for key in REQUIRED_KEYS if key not in data]
+        if missing:
+            raise ValueError(f"Regras sem as chaves: {', '.join(missing)}")
+        for name, category in data["weights"].items():
+            if not isinstance(category.get("keywords"), list) or not isinstance(category.get("points"), int):
+                raise ValueError(f"Categoria '{name}' precisa de 'keywords' (lista) e 'points' (inteiro)")
+
+        self.version = version
+        self.weights: Dict = data["weights"]
+        self.block_list: List[str] = data["block_list"]
+        self.penalty_list: List[str] = data["penalty_list"]
+        self.spam_keywords: List[str] = data["spam_keywords"]
+        self.title_blacklist: List[str] = data["title_blacklist"]
+        self.blacklisted_domains: List[str] = data["blacklisted_domains"]
+        self.gold_keywords: List[str] = data["gold_keywords"]
+
+        self.scoring = compile_scoring(self.weights, self.block_list, self.penalty_list, self.spam_keywords)
+        self._titles = KeywordMatcher((kw, False, False) for kw in self.title_blacklist)
+        self._domains = KeywordMatcher((kw, False, False) for kw in self.blacklisted_domains)
+        self._gold = KeywordMatcher((kw.lower(), False, False) for kw in self.gold_keywords)
+
+    def is_blacklisted_title(self, titulo: str) -> bool:
+        return bool(self._titles.find(str(titulo or "").lower()))
+
+    def is_blacklisted_link(self, link: str) -> bool:
+        return bool(self._domains.find(str(link or "").lower()))
+
+    def gold_score(self, text: str) -> int:
+        """10 pontos por gold keyword presente no texto."""
+        return 10 * len(self._gold.find(str(text or "").lower()))
+
+
+_scoring_cache: "OrderedDict[str, ScoringRules]" = OrderedDict()
+_ruleset_cache: "OrderedDict[str, RuleSet]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def _cached(cache: OrderedDict, key: str, build):
+    with _cache_lock:
+        if key in cache:
+            cache.move_to_end(key)
+            return cache[key]
+    value = build()
+    with _cache_lock:
+        cache[key] = value
+        while len(cache) > _CACHE_SIZE:
+            cache.popitem(last=False)
+    return value
+
+
+def compile_scoring(weights: Dict, block_list: List[str], penalty_list: List[str],
+                    spam_keywords: List[str]) -> ScoringRules:
+    """ScoringRules das listas, reaproveitado se o mesmo conteúdo já foi compilado."""
+    key = content_hash([spam_keywords, block_list, penalty_list, weights])
+    return _cached(_scoring_cache, key, lambda: ScoringRules(
+        copy.deepcopy(weights), list(block_list), list(penalty_list), list(spam_keywords)
+    ))
+
+
+def compile_ruleset(data: Dict) -> RuleSet:
+    """RuleSet do conteúdo já lido (cache pelo hash do conteúdo)."""
+    version = content_hash(data)
+    return _cached(_ruleset_cache, version, lambda: RuleSet(data, version))
+
+
+def load_ruleset(path: str = None) -> RuleSet:
+    with open(path or SCORING_RULES_PATH, encoding="utf-8") as f:
+        return compile_ruleset(json.load(f))
+
+
+class RulesWatcher:
+    """Mantém `current` em dia com o arquivo de regras (recarga atômica)."""
+
+    def __init__(self, path: str = None, interval: float = None):
+        self.path = path or SCORING_RULES_PATH
+        self.interval = SCORING_RULES_POLL_SECONDS if interval is None else interval
+        self._stamp = self._file_stamp()
+        self.current: RuleSet = load_ruleset(self.path)
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _file_stamp(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def check(self) -> bool:
+        """Recarrega se o arquivo mudou. Retorna True se a versão ativa mudou."""
+        stamp = self._file_stamp()
+        if stamp is None or stamp == self._stamp:
+            return False
+        self._stamp = stamp
+        try:
+            rules = load_ruleset(self.path)
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            logger.error(f"Regras inválidas em {self.path}, mantendo a versão {self.current.version}: {e}")
+            return False
+        if rules is self.current:
+            return False
+        self.current = rules
+        logger.info(f"🔄 Regras de scoring recarregadas (versão {rules.version})")
+        return True
+
+    def start(self) -> "RulesWatcher":
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="rules-watcher", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.check()
+
+
+_watchers: Dict[str, RulesWatcher] = {}
+
+
+def get_watcher(path: str = None) -> RulesWatcher:
+    """Watcher compartilhado pelo processo para o arquivo (sem thread até start())."""
+    path = os.path.abspath(path or SCORING_RULES_PATH)
+    with _cache_lock:
+        watcher = _watchers.get(path)
+    if watcher is None:
+        watcher = RulesWatcher(path)
+        with _cache_lock:
+            watcher = _watchers.setdefault(path, watcher)
+    return watcher
+
+
+def current_rules(path: str = None) -> RuleSet:
+    """Versão ativa das regras (leitura de um atributo no caminho quente)."""
+    return get_watcher(path).current
@@ -5,7 +5,7 @@ Adzuna é um agregador de vagas com API gratuita.
 Registre em: https://developer.adzuna.com/
 """
 
-import requests
+import http_client
 from datetime import datetime
 from typing import List, Dict
 import os
@@ -80,7 +80,7 @@ class AdzunaScraper:
                         params["where"] = location
                     
                     try:
-                        response = requests.get(
+                        response = http_client.get(
                             f"{self.base_url}/{page}",
                             params=params,
                             timeout=15
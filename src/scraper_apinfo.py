@@ -4,7 +4,7 @@ Scraper para Apinfo.com (HTML Legado) - ATUALIZADO
 Site antigo de vagas de TI no Brasil.
 """
 
-import requests
+import http_client
 from bs4 import BeautifulSoup
 from datetime import datetime
 from typing import List, Dict
@@ -25,7 +25,7 @@ class ApinfoScraper:
         print(f"\n[*] Consultando Apinfo...")
 
         try:
-            response = requests.get(self.url, headers=self.headers, timeout=20)
+            response = http_client.get(self.url, headers=self.headers, timeout=20)
             response.encoding = 'latin-1' 
             
             if response.status_code != 200:
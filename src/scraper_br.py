@@ -5,7 +5,7 @@ Usa BeautifulSoup para parsing leve (sem Selenium).
 Fontes: Programathor, APINFO.
 """
 
-import requests
+import http_client
 from bs4 import BeautifulSoup
 from datetime import datetime
 from typing import List, Dict
@@ -32,7 +32,7 @@ class BRScraper:
         url = "https://programathor.com.br/jobs-city/estagio"
         
         try:
-            response = requests.get(url, headers=self.headers, timeout=15)
+            response = http_client.get(url, headers=self.headers, timeout=15)
             if response.status_code != 200:
                 print(f"  [!] Programathor retornou {response.status_code}")
                 return []
@@ -4,7 +4,7 @@ Scraper para BuscoJobs (https://br.buscojobs.com/)
 Site de vagas da América Latina
 """
 
-import requests
+import http_client
 from bs4 import BeautifulSoup
 from datetime import datetime
 from typing import List, Dict
@@ -32,7 +32,7 @@ class BuscoJobsScraper:
                 search_url = f"{self.base_url}/pesquisa?q={term.replace(' ', '+')}"
                 
                 try:
-                    response = requests.get(search_url, headers=self.headers, timeout=15)
+                    response = http_client.get(search_url, headers=self.headers, timeout=15)
                     
                     if response.status_code != 200:
                         continue
@@ -4,7 +4,7 @@ Scraper para Catho.com.br
 Site brasileiro de empregos - BeautifulSoup
 """
 
-import requests
+import http_client
 from bs4 import BeautifulSoup  
 from datetime import datetime
 from typing import List, Dict
@@ -31,7 +31,7 @@ class CathoScraper:
         for term in search_terms[:2]:  # Limitar a 2
             try:
                 url = f"{self.base_url}/{term}/"
-                response = requests.get(url, headers=self.headers, timeout=15)
+                response = http_client.get(url, headers=self.headers, timeout=15)
                 
                 if response.status_code != 200:
                     continue
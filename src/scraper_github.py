@@ -2,14 +2,26 @@
 """
 Scraper para Vagas no GitHub (Issues).
 Foca em repositórios da comunidade brasileira.
+
+Em vez de uma busca por repositório, as buscas são agrupadas: vários
+qualificadores `repo:` cabem numa mesma query (até GITHUB_QUERY_MAX_LENGTH
+caracteres), o resultado é paginado com per_page=100 e separado de volta por
+repositório via `repository_url`. Com `updated:>last_seen` só voltam issues
+atualizadas desde a última coleta bem-sucedida.
 """
 
+import json
+import os
 import requests
-import time
-from datetime import datetime
-from typing import List, Dict
+import http_client
+from datetime import datetime, timedelta, timezone
+from typing import List, Dict, Optional, Tuple
 
-from config import REQUEST_HEADERS, REQUEST_TIMEOUT, SEARCH_TERMS
+from config import (
+    REQUEST_HEADERS, REQUEST_TIMEOUT,
+    GITHUB_QUERY_MAX_LENGTH, GITHUB_PER_PAGE, GITHUB_MAX_PAGES,
+    GITHUB_INITIAL_LOOKBACK_DAYS, GITHUB_STATE_PATH
+)
 
 # Repositórios mais ativos (reduzido para evitar rate limit)
 # GitHub Search API: 10 req/min sem auth, 30 req/min com token
@@ -23,143 +35,218 @@ GITHUB_REPOS = [
     "datascience-br/vagas",
 ]
 
+# Query simplificada SEM aspas e SEM acentos (evita 422)
+BASE_QUERY = "state:open type:issue estagio OR junior OR trainee"
+SIMPLE_QUERY = "state:open estagio"
+
+
+def build_queries(repos: List[str], since: Optional[str] = None,
+                  base: str = BASE_QUERY,
+                  max_length: int = GITHUB_QUERY_MAX_LENGTH) -> List[Tuple[str, List[str]]]:
+    """
+    Agrupa os repositórios no menor número de queries que caibam em max_length.
+
+    Returns:
+        Lista de (query, repositórios cobertos pela query)
+    """
+    suffix = f" {base}" + (f" updated:>{since}" if since else "")
+    batches = []
+    current: List[str] = []
+
+    for repo in repos:
+        candidate = current + [repo]
+        query = " ".join(f"repo:{r}" for r in candidate) + suffix
+        if current and len(query) > max_length:
+            batches.append(current)
+            current = [repo]
+        else:
+            current = candidate
+
+    if current:
+        batches.append(current)
+
+    return [(" ".join(f"repo:{r}" for r in batch) + suffix, batch) for batch in batches]
+
+
+def repo_of(item: Dict) -> str:
+    """'https://api.github.com/repos/owner/name' -> 'owner/name'"""
+    url = item.get("repository_url", "")
+    return url.split("/repos/", 1)[1].lower() if "/repos/" in url else ""
+
+
 class GithubScraper:
     """Coleta vagas de Issues no GitHub."""
 
-    def __init__(self):
+    def __init__(self, state_path: str = None):
         self.platform_base = "GitHub"
         self.api_url = "https://api.github.com/search/issues"
-        self._request_count = 0
-        self._last_request = 0
-
-    def _rate_limit_wait(self):
-        """Espera adequada para não bater rate limit (10 req/min sem auth)."""
-        self._request_count += 1
-        
-        # A cada 8 requests, pausa mais longa
-        if self._request_count >= 8:
-            print(f"      [~] Pausa preventiva de rate limit (40s)...")
-            time.sleep(40)
-            self._request_count = 0
-        else:
-            # Delay base: 7s entre requests (10 req/min = 6s, +1s margem)
-            elapsed = time.time() - self._last_request
-            if elapsed < 7:
-                time.sleep(7 - elapsed)
-        
-        self._last_request = time.time()
+        self.state_path = state_path or GITHUB_STATE_PATH
+        self.headers = {
+            "Accept": "application/vnd.github.v3+json",
+            "User-Agent": REQUEST_HEADERS["User-Agent"]
+        }
 
     def fetch_jobs(self) -> List[Dict]:
         """
         Busca issues abertas com termos de estágio nos repositórios selecionados.
-        Usa a API de Search do GitHub para otimizar requisições.
+        Usa a API de Search do GitHub com queries agrupadas (1-2 requisições).
         """
         all_jobs = []
         print(f"\n[*] Consultando GitHub Vagas (Brasil)...")
 
-        headers = {
-            "Accept": "application/vnd.github.v3+json",
-            "User-Agent": REQUEST_HEADERS["User-Agent"]
-        }
+        started_at = datetime.now(timezone.utc)
+        since = self._load_last_seen()
+        queries = build_queries(GITHUB_REPOS, since)
+        print(f"  [>] {len(GITHUB_REPOS)} repositórios em {len(queries)} busca(s) desde {since}")
 
-        target_labels = ["estagio", "estágio", "junior", "júnior", "trainee", "intern"]
-        
-        for repo in GITHUB_REPOS:
-            print(f"  [>] Verificando {repo}...")
-            
-            # Query simplificada SEM aspas e SEM acentos (evita 422)
-            # Busca issues abertas no repo com termos simples
-            query = f'repo:{repo} state:open type:issue estagio OR junior OR trainee'
-            
+        complete = True
+        for query, repos in queries:
+            items, ok = self._search(query, repos, since)
+            complete = complete and ok
+
+            # Separa os resultados de volta por repositório
+            by_repo: Dict[str, List[Dict]] = {repo.lower(): [] for repo in repos}
+            for item in items:
+                by_repo.setdefault(repo_of(item), []).append(item)
+
+            for repo in repos:
+                jobs = [
+                    job for job in (self._parse_item(item, repo) for item in by_repo[repo.lower()])
+                    if job
+                ]
+                all_jobs.extend(jobs)
+                if jobs:
+                    print(f"      [+] {repo}: {len(jobs)} vagas encontradas")
+
+        # Só avança o marcador se todas as buscas foram completas
+        if complete:
+            self._save_last_seen(started_at)
+
+        print(f"  [*] GitHub finalizado: {len(all_jobs)} vagas coletadas")
+        return all_jobs
+
+    # ==================== BUSCA ====================
+
+    def _search(self, query: str, repos: List[str], since: Optional[str]) -> Tuple[List[Dict], bool]:
+        """Pagina uma query agrupada. Retorna (itens, busca completa?)."""
+        items: List[Dict] = []
+        page = 1
+
+        while page <= GITHUB_MAX_PAGES:
             params = {
                 "q": query,
-                "sort": "created",
+                "sort": "updated",
                 "order": "desc",
-                "per_page": 15  # Reduzido para ser mais rápido
+                "per_page": GITHUB_PER_PAGE,
+                "page": page
             }
-            
+
             try:
-                self._rate_limit_wait()
-                
-                response = requests.get(
-                    self.api_url, 
-                    params=params, 
-                    headers=headers, 
-                    timeout=REQUEST_TIMEOUT
-                )
-                
-                if response.status_code == 403 or response.status_code == 429:
-                    retry_after = int(response.headers.get('Retry-After', 60))
-                    print(f"      [!] Rate limit (403/429). Esperando {retry_after}s...")
-                    time.sleep(retry_after)
-                    continue
-                
-                if response.status_code == 422:
+                response = self._get(params)
+
+                if response.status_code == 422 and page == 1:
                     # Tenta query ainda mais simples
-                    simple_query = f'repo:{repo} state:open estagio'
-                    params["q"] = simple_query
-                    response = requests.get(
-                        self.api_url, 
-                        params=params, 
-                        headers=headers, 
-                        timeout=REQUEST_TIMEOUT
-                    )
-                    if response.status_code != 200:
-                        print(f"      [!] Repo {repo} indisponível, pulando...")
-                        continue
-
-                response.raise_for_status()
-                data = response.json()
-                
-                items = data.get("items", [])
-                
-                count = 0
-                for item in items:
-                    title = item.get("title", "").strip()
-                    body = (item.get("body") or "").strip()
-                    html_url = item.get("html_url")
-                    created_at = item.get("created_at", "")
-                    
-                    # Verificação de validade
-                    text_content = (title + " " + body).lower()
-                    
-                    is_valid = any(term in text_content for term in target_labels)
-                    
-                    if is_valid:
-                        local = "Não informado"
-                        # Extração de local entre colchetes [Local]
-                        if "[" in title and "]" in title:
-                            try:
-                                start = title.find("[")
-                                end = title.find("]")
-                                if end > start:
-                                    local = title[start+1:end]
-                            except:
-                                pass
-
-                        job = {
-                            "titulo": title,
-                            "empresa": f"Via {repo}",
-                            "localizacao": local,
-                            "link": html_url,
-                            "data_publicacao": created_at[:10],
-                            "data_coleta": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                            "plataforma": f"GitHub ({repo.split('/')[0]})",
-                        }
-                        
-                        all_jobs.append(job)
-                        count += 1
-                
-                if count > 0:
-                    print(f"      [+] {count} vagas encontradas")
-                else:
-                    print(f"      [.] Nenhuma vaga recente")
+                    simple = build_queries(repos, since, base=SIMPLE_QUERY, max_length=10**6)[0][0]
+                    query = params["q"] = simple
+                    response = self._get(params)
+
+                if response.status_code != 200:
+                    print(f"      [!] Busca indisponível ({response.status_code}): {', '.join(repos)}")
+                    return items, False
 
+                data = response.json()
             except requests.exceptions.RequestException as e:
-                print(f"      [!] Erro em {repo}: {type(e).__name__}")
+                print(f"      [!] Erro na busca ({', '.join(repos)}): {type(e).__name__}")
+                return items, False
             except Exception as e:
                 print(f"      [!] Erro genérico: {e}")
+                return items, False
 
-        print(f"  [*] GitHub finalizado: {len(all_jobs)} vagas coletadas")
-        return all_jobs
+            page_items = data.get("items", [])
+            items.extend(page_items)
+
+            if len(page_items) < GITHUB_PER_PAGE or len(items) >= data.get("total_count", 0):
+                return items, True
+            page += 1
+
+        # Limite de páginas atingido: o resto fica para o próximo ciclo
+        return items, False
+
+    def _get(self, params: Dict) -> requests.Response:
+        """GET na Search API; a cota é controlada pelo rate_limiter compartilhado."""
+        response = http_client.get(
+            self.api_url,
+            params=params,
+            headers=self.headers,
+            timeout=REQUEST_TIMEOUT
+        )
+
+        if response.status_code in (403, 429):
+            # O limitador já bloqueou o host até o reset; tenta mais uma vez
+            print(f"      [!] Rate limit (403/429). Aguardando liberação da cota...")
+            response = http_client.get(
+                self.api_url,
+                params=params,
+                headers=self.headers,
+                timeout=REQUEST_TIMEOUT
+            )
+
+        return response
+
+    # ==================== PARSING ====================
+
+    def _parse_item(self, item: Dict, repo: str) -> Optional[Dict]:
+        """Converte uma issue em vaga (None se não tiver termos de estágio/junior)."""
+        target_labels = ["estagio", "estágio", "junior", "júnior", "trainee", "intern"]
+
+        title = item.get("title", "").strip()
+        body = (item.get("body") or "").strip()
+
+        # Verificação de validade
+        text_content = (title + " " + body).lower()
+        if not any(term in text_content for term in target_labels):
+            return None
+
+        local = "Não informado"
+        # Extração de local entre colchetes [Local]
+        if "[" in title and "]" in title:
+            start = title.find("[")
+            end = title.find("]")
+            if end > start:
+                local = title[start+1:end]
+
+        return {
+            "titulo": title,
+            "empresa": f"Via {repo}",
+            "localizacao": local,
+            "link": item.get("html_url"),
+            "data_publicacao": item.get("created_at", "")[:10],
+            "data_coleta": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "plataforma": f"GitHub ({repo.split('/')[0]})",
+        }
+
+    # ==================== ESTADO ====================
+
+    def _load_last_seen(self) -> str:
+        """Marcador `updated:>` da última coleta completa (ISO 8601, UTC)."""
+        try:
+            with open(self.state_path, "r", encoding="utf-8") as f:
+                last_seen = json.load(f).get("last_seen")
+            if last_seen:
+                return last_seen
+        except (OSError, ValueError, AttributeError):
+            pass
+        start = datetime.now(timezone.utc) - timedelta(days=GITHUB_INITIAL_LOOKBACK_DAYS)
+        return start.strftime("%Y-%m-%dT%H:%M:%SZ")
 
+    def _save_last_seen(self, started_at: datetime) -> None:
+        """Grava o início da coleta (não o fim) para não perder issues do meio."""
+        try:
+            if os.path.dirname(self.state_path):
+                os.makedirs(os.path.dirname(self.state_path), exist_ok=True)
+            tmp_path = f"{self.state_path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"last_seen": started_at.strftime("%Y-%m-%dT%H:%M:%SZ")}, f)
+            os.replace(tmp_path, self.state_path)
+        except OSError as e:
+            print(f"  [!] Não foi possível salvar estado do GitHub: {e}")
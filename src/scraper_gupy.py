@@ -4,7 +4,7 @@ Scraper para Gupy (Maior Plataforma de Recrutamento do Brasil)
 Usa busca pública via HTML parsing (API é Enterprise-only)
 """
 
-import requests
+import http_client
 from datetime import datetime
 from typing import List, Dict
 from bs4 import BeautifulSoup
@@ -51,7 +51,7 @@ class GupyScraper:
                 company = page_url.split("//")[1].split(".")[0].title()
                 print(f"  [>] Consultando {company}...")
                 
-                response = requests.get(page_url, headers=self.headers, timeout=10)
+                response = http_client.get(page_url, headers=self.headers, timeout=10)
                 
                 if response.status_code != 200:
                     continue
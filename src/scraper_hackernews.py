@@ -2,87 +2,139 @@
 """
 Scraper para Hacker News - "Who is Hiring" threads mensais.
 100% grátis - usa API pública do HN.
+
+Os itens são buscados em paralelo (concorrência limitada) e ficam num cache
+persistente por ID: um item já visto não é baixado de novo nos ciclos seguintes.
 """
 
-import requests
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Dict
+from typing import List, Dict, Optional
+
+import http_client
+from config import HN_MAX_WORKERS, HN_ITEMS_CACHE_PATH
 
 class HackerNewsScraper:
     """Coleta vagas dos threads 'Who is Hiring' do HN."""
 
-    def __init__(self):
+    def __init__(self, max_workers: int = None, cache_path: str = None):
         self.platform = "HackerNews"
         self.api_base = "https://hacker-news.firebaseio.com/v0"
+        self.max_workers = max_workers or HN_MAX_WORKERS
+        self.cache_path = cache_path or HN_ITEMS_CACHE_PATH
 
     def fetch_jobs(self, terms: List[str] = None) -> List[Dict]:
         """Busca vagas no HN Jobs e Who is Hiring."""
-        all_jobs = []
-        
         print(f"\n[*] Consultando Hacker News Jobs...")
 
         try:
             # HN tem endpoint de jobs direto
-            response = requests.get(
+            response = http_client.get(
                 f"{self.api_base}/jobstories.json",
                 timeout=15
             )
-            
+
             if response.status_code != 200:
                 print(f"  [!] HN retornou {response.status_code}")
                 return []
-            
+
             job_ids = response.json()[:30]  # Pegar 30 mais recentes
-            
-            for job_id in job_ids:
-                try:
-                    # Buscar detalhes de cada job
-                    item_resp = requests.get(
-                        f"{self.api_base}/item/{job_id}.json",
-                        timeout=10
-                    )
-                    
-                    if item_resp.status_code != 200:
-                        continue
-                    
-                    item = item_resp.json()
-                    if not item:
-                        continue
-                    
-                    title = item.get("title", "")
-                    title_lower = title.lower()
-                    text = item.get("text", "").lower() if item.get("text") else ""
-                    
-                    # Filtrar junior/intern/remote
-                    search_text = f"{title_lower} {text}"
-                    is_relevant = any(term in search_text for term in 
-                        ["junior", "jr", "intern", "entry", "remote", "trainee", 
-                         "graduate", "early career", "new grad"])
-                    
-                    if is_relevant:
-                        # Extrair empresa do título (formato: "Company is hiring...")
-                        company = title.split(" is ")[0] if " is " in title else "Startup"
-                        company = company.split(" (")[0]  # Remover parênteses
-                        
-                        job_data = {
-                            "titulo": f"🔶 {title[:100]}",
-                            "empresa": company[:50],
-                            "localizacao": "🌍 Remote/Global" if "remote" in search_text else "USA",
-                            "link": item.get("url", f"https://news.ycombinator.com/item?id={job_id}"),
-                            "data_publicacao": datetime.fromtimestamp(
-                                item.get("time", 0)
-                            ).strftime("%Y-%m-%d"),
-                            "data_coleta": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                            "plataforma": self.platform
-                        }
-                        all_jobs.append(job_data)
-                        
-                except Exception:
-                    continue
-                    
+
+            # Cache: {id: vaga já processada, ou None se o item não era relevante}
+            seen = self._load_seen()
+            missing = [job_id for job_id in job_ids if str(job_id) not in seen]
+
+            if missing:
+                with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                    items = list(executor.map(self._fetch_item, missing))
+
+                for job_id, item in zip(missing, items):
+                    if item is None:
+                        continue  # Falha de rede: tenta de novo no próximo ciclo
+                    seen[str(job_id)] = self._parse_item(job_id, item)
+
+            print(f"  [>] {len(missing)} itens novos baixados, {len(job_ids) - len(missing)} do cache")
+
+            # Mantém no cache só os IDs ainda listados pelo HN
+            current = {str(job_id): seen[str(job_id)] for job_id in job_ids if str(job_id) in seen}
+            self._save_seen(current)
+
+            all_jobs = [job for job in current.values() if job]
+
         except Exception as e:
             print(f"  [!] Erro HN: {e}")
             return []
-        
+
         print(f"  [+] {len(all_jobs)} vagas junior/remote encontradas no HN")
         return all_jobs
+
+    def _fetch_item(self, job_id) -> Optional[Dict]:
+        """Busca detalhes de um item. Retorna None em falha, {} se o item não existe."""
+        try:
+            item_resp = http_client.get(
+                f"{self.api_base}/item/{job_id}.json",
+                timeout=10,
+                use_cache=False  # O cache por ID já evita buscar de novo
+            )
+
+            if item_resp.status_code != 200:
+                return None
+
+            return item_resp.json() or {}
+        except Exception:
+            return None
+
+    def _parse_item(self, job_id, item: Dict) -> Optional[Dict]:
+        """Converte um item do HN em vaga (None se não for relevante)."""
+        if not item:
+            return None
+
+        title = item.get("title", "")
+        title_lower = title.lower()
+        text = item.get("text", "").lower() if item.get("text") else ""
+
+        # Filtrar junior/intern/remote
+        search_text = f"{title_lower} {text}"
+        is_relevant = any(term in search_text for term in
+            ["junior", "jr", "intern", "entry", "remote", "trainee",
+             "graduate", "early career", "new grad"])
+
+        if not is_relevant:
+            return None
+
+        # Extrair empresa do título (formato: "Company is hiring...")
+        company = title.split(" is ")[0] if " is " in title else "Startup"
+        company = company.split(" (")[0]  # Remover parênteses
+
+        return {
+            "titulo": f"🔶 {title[:100]}",
+            "empresa": company[:50],
+            "localizacao": "🌍 Remote/Global" if "remote" in search_text else "USA",
+            "link": item.get("url", f"https://news.ycombinator.com/item?id={job_id}"),
+            "data_publicacao": datetime.fromtimestamp(
+                item.get("time", 0)
+            ).strftime("%Y-%m-%d"),
+            "data_coleta": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "plataforma": self.platform
+        }
+
+    def _load_seen(self) -> Dict:
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_seen(self, seen: Dict) -> None:
+        """Grava o cache de forma atômica (arquivo temporário + rename)."""
+        try:
+            if os.path.dirname(self.cache_path):
+                os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+            tmp_path = f"{self.cache_path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(seen, f, ensure_ascii=False)
+            os.replace(tmp_path, self.cache_path)
+        except OSError as e:
+            print(f"  [!] Não foi possível salvar cache do HN: {e}")
@@ -4,7 +4,7 @@ Scraper para InfoJobs Brasil (API)
 Requer API key gratuita de https://developer.infojobs.net/
 """
 
-import requests
+import http_client
 from datetime import datetime
 from typing import List, Dict
 import os
@@ -50,7 +50,7 @@ class InfoJobsScraper:
                         "pageSize": 50
                     }
                     
-                    response = requests.get(
+                    response = http_client.get(
                         f"{self.api_url}/vacancies",
                         headers=self.headers,
                         params=params,
@@ -9,6 +9,11 @@ from datetime import datetime
 from typing import List, Dict
 import pandas as pd
 
+from scraper_jobspy_real import safe_str_column
+
+# Filtro de qualidade (título)
+TITLE_KEYWORDS = ['junior', 'jr', 'estagio', 'trainee', 'entry']
+
 class JobSpyScraper:
     def __init__(self):
         self.platform = "JobSpy"
@@ -44,37 +49,7 @@ class JobSpyScraper:
                 if jobs_df is None or len(jobs_df) == 0:
                     continue
                 
-                # Converter DataFrame para nosso formato
-                for _, row in jobs_df.iterrows():
-                    # Filtro de qualidade
-                    title = str(row.get('title', '')).lower()
-                    if not any(kw in title for kw in ['junior', 'jr', 'estagio', 'trainee', 'entry']):
-                        continue
-                    
-                    # Determinar localização
-                    location = row.get('location', 'Brasil')
-                    if pd.isna(location):
-                        location = 'Brasil'
-                    
-                    # Remoto?
-                    is_remote = row.get('is_remote', False)
-                    if is_remote:
-                        location = '🏠 REMOTO'
-                    
-                    # Plataforma original
-                    site = row.get('site', 'JobSpy')
-                    
-                    job = {
-                        "titulo": f"🌐 {row.get('title', 'Vaga')}",
-                        "empresa": row.get('company', 'Empresa'),
-                        "localizacao": location,
-                        "link": row.get('job_url', ''),
-                        "data_publicacao": datetime.now().strftime("%Y-%m-%d"),
-                        "data_coleta": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                        "plataforma": f"{site.title()}"
-                    }
-                    
-                    all_jobs.append(job)
+                all_jobs.extend(self._convert(jobs_df))
                 
             except Exception as e:
                 print(f"  [!] Erro com termo '{term}': {e}")
@@ -91,3 +66,32 @@ class JobSpyScraper:
         
         print(f"  [+] {len(unique_jobs)} vagas únicas encontradas via JobSpy")
         return unique_jobs
+    
+    def _convert(self, jobs_df: pd.DataFrame) -> List[Dict]:
+        """Converte o DataFrame para nosso formato com operações por coluna."""
+        index = jobs_df.index
+        
+        # Filtro de qualidade
+        titles = jobs_df['title'] if 'title' in jobs_df.columns else pd.Series('', index=index)
+        keep = titles.astype(str).str.lower().str.contains('|'.join(TITLE_KEYWORDS), regex=True)
+        
+        # Determinar localização (remoto tem prioridade)
+        location = (
+            jobs_df['location'].astype(object).where(jobs_df['location'].notna(), 'Brasil')
+            if 'location' in jobs_df.columns else pd.Series('Brasil', index=index, dtype=object)
+        )
+        if 'is_remote' in jobs_df.columns:
+            is_remote = jobs_df['is_remote'].astype(object).where(jobs_df['is_remote'].notna(), False).astype(bool)
+            location = location.mask(is_remote, '🏠 REMOTO')
+        
+        frame = pd.DataFrame({
+            "titulo": "🌐 " + safe_str_column(jobs_df, 'title', 'Vaga'),
+            "empresa": jobs_df['company'] if 'company' in jobs_df.columns else 'Empresa',
+            "localizacao": location,
+            "link": jobs_df['job_url'] if 'job_url' in jobs_df.columns else '',
+            "data_publicacao": datetime.now().strftime("%Y-%m-%d"),
+            "data_coleta": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "plataforma": safe_str_column(jobs_df, 'site', 'JobSpy').str.title(),
+        }, index=index)
+        
+        return frame[keep].astype(object).to_dict("records")
@@ -3,20 +3,158 @@
 Scraper usando JobSpy - OTIMIZADO para máximo volume BRASIL
 LinkedIn + Indeed + Google (SEM Glassdoor - muito lento)
 Meta: 150+ vagas por ciclo
+
+A matriz termo × local × site roda em paralelo (JOBSPY_MAX_WORKERS), com
+limite de consultas simultâneas por site e cache curto por (site, termo, local)
+para não repetir combinações dentro da janela hours_old.
 """
 
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from jobspy import scrape_jobs
 from datetime import datetime
-from typing import List, Dict
+from typing import Iterator, List, Dict, Optional
 import pandas as pd
 
+from config import JOBSPY_MAX_WORKERS, JOBSPY_SITE_CONCURRENCY, JOBSPY_CACHE_TTL, JOBSPY_HOURS_OLD
+
+# Termos EXPANDIDOS para cobertura nacional
+JOBSPY_SEARCH_TERMS = [
+    # Desenvolvimento
+    "desenvolvedor junior",
+    "desenvolvedor trainee",
+    "programador junior",
+    "desenvolvedor web junior",
+    "front end junior",
+    "back end junior",
+    "full stack junior",
+    # Estágio TI
+    "estagio ti",
+    "estagio tecnologia",
+    "estagio programacao",
+    "estagio desenvolvimento",
+    "estagio sistemas",
+    "estagio informatica",
+    # Trainee
+    "trainee tecnologia",
+    "trainee ti",
+    # Análise
+    "analista junior ti",
+    "analista sistemas junior",
+    "suporte tecnico junior",
+    # Dados
+    "analista dados junior",
+    "estagio dados",
+    "estagio ciencia dados",
+    # SDR / Vendas / Comercial
+    "sdr junior",
+    "sdr estagio",
+    "sales development representative",
+    "pre vendas junior",
+    "closer junior",
+    "inside sales junior",
+    "estagio vendas",
+    "estagio comercial",
+    "vendedor junior",
+    "analista comercial junior",
+    "bdr junior"
+]
+
+# Todas as capitais brasileiras + regiões importantes
+LOCATIONS = [
+    # Sudeste (maior mercado)
+    "São Paulo, Brazil",
+    "Rio de Janeiro, Brazil",
+    "Belo Horizonte, Brazil",
+    "Campinas, Brazil",
+    "Vitória, Brazil",
+    # Sul
+    "Curitiba, Brazil",
+    "Porto Alegre, Brazil",
+    "Florianópolis, Brazil",
+    # Centro-Oeste
+    "Brasília, Brazil",
+    "Goiânia, Brazil",
+    "Campo Grande, Brazil",
+    # Nordeste
+    "Salvador, Brazil",
+    "Recife, Brazil",
+    "Fortaleza, Brazil",
+    "Natal, Brazil",
+    # Norte
+    "Manaus, Brazil",
+    "Belém, Brazil",
+    # Genérico
+    "Brazil",
+    "Remote"
+]
+
+SITE_ICONS = {
+    'linkedin': '🔵',
+    'indeed': '🟢',
+    'google': '�',
+    'zip_recruiter': '�'
+}
+
+def safe_str_column(df: pd.DataFrame, column: str, default: str = "") -> pd.Series:
+    """Versão vetorizada de _safe_str: NaN/None viram default, o resto str().strip()."""
+    if column not in df.columns:
+        return pd.Series(default, index=df.index, dtype=object)
+    values = df[column]
+    return values.astype(str).str.strip().astype(object).where(values.notna(), default)
+
+
+def location_column(df: pd.DataFrame) -> pd.Series:
+    """Versão vetorizada de _parse_location (cidade/estado -> location -> remoto -> Brasil)."""
+    def text(column: str) -> pd.Series:
+        if column not in df.columns:
+            return pd.Series("", index=df.index, dtype=object)
+        values = df[column].astype(object).where(df[column].notna(), "")
+        values = values.astype(str)
+        return values.where(values != "nan", "").astype(object)
+    
+    city, state, location = text('city'), text('state'), text('location')
+    has_city, has_state, has_location = city != "", state != "", location != ""
+    is_remote = (
+        df['is_remote'].astype(object).where(df['is_remote'].notna(), False).astype(bool)
+        if 'is_remote' in df.columns else pd.Series(False, index=df.index)
+    )
+    
+    result = pd.Series("Brasil", index=df.index, dtype=object)
+    result = result.mask(is_remote, "🏠 REMOTO")
+    result = result.mask(has_location, location)
+    result = result.mask(has_state, state)
+    result = result.mask(has_city, city)
+    result = result.mask(has_city & has_state, city + ", " + state)
+    return result
+
+
 class JobSpyRealScraper:
     """Scraper multi-plataforma usando JobSpy - TURBO BRASIL."""
     
-    def __init__(self):
+    def __init__(self, max_workers: int = None, cache_ttl: float = None):
         self.platform = "JobSpy"
         # Removido glassdoor (muito lento e erros de location)
         self.sites = ["indeed", "linkedin", "google"]
+        self.max_workers = max_workers or JOBSPY_MAX_WORKERS
+        self.hours_old = JOBSPY_HOURS_OLD
+        # Resultados valem no máximo a janela hours_old
+        ttl = JOBSPY_CACHE_TTL if cache_ttl is None else cache_ttl
+        self.cache_ttl = min(ttl, self.hours_old * 3600)
+        
+        # Cache (site, termo, local, tipo) -> (timestamp, DataFrame)
+        self._cache: Dict[tuple, tuple] = {}
+        self._cache_lock = threading.Lock()
+        self.cache_hits = 0
+        
+        # Concorrência máxima por site (LinkedIn bloqueia rajadas)
+        self._site_slots = {
+            site: threading.BoundedSemaphore(limit)
+            for site, limit in JOBSPY_SITE_CONCURRENCY.items()
+        }
+        self._default_slot = threading.BoundedSemaphore(1)
     
     def _safe_str(self, value, default: str = "") -> str:
         """Converte valor para string, tratando NaN e None."""
@@ -28,221 +166,159 @@ class JobSpyRealScraper:
     
     def fetch_jobs(self, terms: List[str] = None) -> List[Dict]:
         """Busca vagas em múltiplas plataformas - VOLUME MÁXIMO BRASIL."""
-        all_jobs = []
-        
+        return list(self.iter_jobs(terms))
+    
+    def iter_jobs(self, terms: List[str] = None, chunk_rows: int = 500) -> Iterator[Dict]:
+        """
+        Versão em streaming de fetch_jobs: entrega as vagas conforme as consultas
+        terminam, convertidas em blocos de ~chunk_rows linhas por tipo.
+        """
         print(f"\n[*] 🚀 JobSpy TURBO BRASIL (Indeed + LinkedIn + Google)...")
         
+        seen = set()
+        total = 0
+        
         try:
-            # Termos EXPANDIDOS para cobertura nacional
-            search_terms = [
-                # Desenvolvimento
-                "desenvolvedor junior",
-                "desenvolvedor trainee",
-                "programador junior",
-                "desenvolvedor web junior",
-                "front end junior",
-                "back end junior",
-                "full stack junior",
-                # Estágio TI
-                "estagio ti",
-                "estagio tecnologia",
-                "estagio programacao",
-                "estagio desenvolvimento",
-                "estagio sistemas",
-                "estagio informatica",
-                # Trainee
-                "trainee tecnologia",
-                "trainee ti",
-                # Análise
-                "analista junior ti",
-                "analista sistemas junior",
-                "suporte tecnico junior",
-                # Dados
-                "analista dados junior",
-                "estagio dados",
-                "estagio ciencia dados",
-                # SDR / Vendas / Comercial
-                "sdr junior",
-                "sdr estagio",
-                "sales development representative",
-                "pre vendas junior",
-                "closer junior",
-                "inside sales junior",
-                "estagio vendas",
-                "estagio comercial",
-                "vendedor junior",
-                "analista comercial junior",
-                "bdr junior"
-            ]
-            
-            # Todas as capitais brasileiras + regiões importantes
-            locations = [
-                # Sudeste (maior mercado)
-                "São Paulo, Brazil",
-                "Rio de Janeiro, Brazil",
-                "Belo Horizonte, Brazil",
-                "Campinas, Brazil",
-                "Vitória, Brazil",
-                # Sul
-                "Curitiba, Brazil",
-                "Porto Alegre, Brazil",
-                "Florianópolis, Brazil",
-                # Centro-Oeste
-                "Brasília, Brazil",
-                "Goiânia, Brazil",
-                "Campo Grande, Brazil",
-                # Nordeste
-                "Salvador, Brazil",
-                "Recife, Brazil",
-                "Fortaleza, Brazil",
-                "Natal, Brazil",
-                # Norte
-                "Manaus, Brazil",
-                "Belém, Brazil",
-                # Genérico
-                "Brazil",
-                "Remote"
-            ]
-            
-            # Randomizar e aumentar range de busca para garantir variedade (Junior, Sdr, Estágio)
-            import random
-            random.shuffle(search_terms)
-            terms_to_use = search_terms[:20] # Pega 20 termos aleatórios por execução
-            locs_to_use = locations[:4] # Reduz locations para focar nos termos
+            queries = self._build_queries()
+            hits_before = self.cache_hits
+            pending: Dict[str, List[pd.DataFrame]] = {}
             
-            for term in terms_to_use:
-                for loc in locs_to_use:
-                    try:
-                        print(f"  [*] '{term}' em '{loc}'...")
-                        
-                        jobs_df = scrape_jobs(
-                            site_name=self.sites,
-                            search_term=term,
-                            location=loc,
-                            results_wanted=30,  # 30 por combinação
-                            hours_old=72,  # Últimos 3 dias
-                            country_indeed='Brazil',
-                            linkedin_fetch_description=False,
-                            verbose=0
-                        )
-                    
-                        if jobs_df is None or len(jobs_df) == 0:
-                            continue
-                        
-                        print(f"      [+] {len(jobs_df)} encontradas")
-                        
-                        for _, job in jobs_df.iterrows():
-                            try:
-                                site = job.get('site', 'unknown')
-                                icon = {
-                                    'linkedin': '🔵',
-                                    'indeed': '🟢',
-                                    'google': '�',
-                                    'zip_recruiter': '�'
-                                }.get(site, '⚪')
-                                
-                                job_data = {
-                                    "titulo": f"{icon} {self._safe_str(job.get('title'), 'Vaga')}",
-                                    "empresa": self._safe_str(job.get('company'), 'Empresa'),
-                                    "localizacao": self._parse_location(job),
-                                    "link": self._safe_str(job.get('job_url')),
-                                    "data_publicacao": self._safe_str(job.get('date_posted'), datetime.now().strftime("%Y-%m-%d")),
-                                    "data_coleta": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                                    "plataforma": f"JobSpy ({self._safe_str(site, 'unknown').title()})"
-                                }
-                                
-                                if not job_data['link'] or 'None' in str(job_data['link']):
-                                    continue
-                                
-                                all_jobs.append(job_data)
-                                
-                            except Exception:
-                                continue
+            # Matriz termo × local × site em paralelo (limite global + por site)
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                futures = {executor.submit(self._run_query, query): query for query in queries}
                 
-                    except Exception as e:
-                        # Continua silenciosamente para não travar
+                for future in as_completed(futures):
+                    jobs_df = future.result()
+                    if jobs_df is None or len(jobs_df) == 0:
                         continue
+                    
+                    kind = futures[future]["kind"]
+                    pending.setdefault(kind, []).append(jobs_df)
+                    if sum(len(df) for df in pending[kind]) < chunk_rows:
+                        continue
+                    
+                    # Converte o bloco acumulado de uma vez
+                    for job in self._convert(pd.concat(pending.pop(kind), ignore_index=True), kind):
+                        total += 1
+                        if job['link'] not in seen:
+                            seen.add(job['link'])
+                            yield job
             
-            # Busca EXTRA: Estágios com filtro job_type
-            print(f"  [*] 🎓 Buscando estágios (filtro especial)...")
-            try:
-                internship_df = scrape_jobs(
-                    site_name=["indeed", "linkedin"],
-                    search_term="estagio",
-                    location="Brazil",
-                    job_type="internship",
-                    results_wanted=100,
-                    country_indeed='Brazil',
-                    verbose=0
-                )
-                
-                if internship_df is not None and len(internship_df) > 0:
-                    print(f"      [+] {len(internship_df)} estágios")
-                    for _, job in internship_df.iterrows():
-                        try:
-                            site = job.get('site', 'unknown')
-                            job_data = {
-                                "titulo": f"🎓 {self._safe_str(job.get('title'), 'Estágio')}",
-                                "empresa": self._safe_str(job.get('company'), 'Empresa'),
-                                "localizacao": self._parse_location(job),
-                                "link": self._safe_str(job.get('job_url')),
-                                "data_publicacao": self._safe_str(job.get('date_posted'), datetime.now().strftime("%Y-%m-%d")),
-                                "data_coleta": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                                "plataforma": f"JobSpy ({self._safe_str(site, 'unknown').title()}) Estágio"
-                            }
-                            if job_data['link'] and 'None' not in str(job_data['link']):
-                                all_jobs.append(job_data)
-                        except:
-                            continue
-            except Exception as e:
-                print(f"  [!] Erro estágios: {e}")
+            for kind, frames in pending.items():
+                for job in self._convert(pd.concat(frames, ignore_index=True), kind):
+                    total += 1
+                    if job['link'] not in seen:
+                        seen.add(job['link'])
+                        yield job
             
-            # Busca EXTRA: Remotas
-            print(f"  [*] 🏠 Buscando vagas remotas...")
-            try:
-                remote_df = scrape_jobs(
-                    site_name=["indeed", "linkedin"],
-                    search_term="desenvolvedor",
-                    is_remote=True,
-                    results_wanted=50,
-                    country_indeed='Brazil',
-                    verbose=0
-                )
-                
-                if remote_df is not None and len(remote_df) > 0:
-                    print(f"      [+] {len(remote_df)} remotas")
-                    for _, job in remote_df.iterrows():
-                        try:
-                            site = job.get('site', 'unknown')
-                            job_data = {
-                                "titulo": f"🏠 {self._safe_str(job.get('title'), 'Remoto')}",
-                                "empresa": self._safe_str(job.get('company'), 'Empresa'),
-                                "localizacao": "🏠 REMOTO",
-                                "link": self._safe_str(job.get('job_url')),
-                                "data_publicacao": self._safe_str(job.get('date_posted'), datetime.now().strftime("%Y-%m-%d")),
-                                "data_coleta": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                                "plataforma": f"JobSpy ({self._safe_str(site, 'unknown').title()}) Remoto"
-                            }
-                            if job_data['link'] and 'None' not in str(job_data['link']):
-                                all_jobs.append(job_data)
-                        except:
-                            continue
-            except Exception as e:
-                print(f"  [!] Erro remotas: {e}")
+            print(f"  [*] {len(queries)} consultas ({self.cache_hits - hits_before} do cache)")
         
         except Exception as e:
             print(f"  [!] Erro geral JobSpy: {e}")
         
-        # Dedupe por link
-        seen = set()
-        unique_jobs = []
-        for job in all_jobs:
-            if job['link'] not in seen:
-                seen.add(job['link'])
-                unique_jobs.append(job)
+        print(f"  [+] ✅ {len(seen)} vagas ÚNICAS via JobSpy (de {total} total)")
+    
+    def _build_queries(self) -> List[Dict]:
+        """Monta a matriz de consultas (uma por site, para respeitar os limites por site)."""
+        # Randomizar e aumentar range de busca para garantir variedade (Junior, Sdr, Estágio)
+        search_terms = list(JOBSPY_SEARCH_TERMS)
+        random.shuffle(search_terms)
+        terms_to_use = search_terms[:20] # Pega 20 termos aleatórios por execução
+        locs_to_use = LOCATIONS[:4] # Reduz locations para focar nos termos
+        
+        queries = []
+        for term in terms_to_use:
+            for loc in locs_to_use:
+                for site in self.sites:
+                    queries.append({
+                        "kind": "matrix", "site": site, "term": term, "location": loc,
+                        "kwargs": {
+                            "results_wanted": 30,  # 30 por combinação
+                            "hours_old": self.hours_old,
+                            "linkedin_fetch_description": False
+                        }
+                    })
+        
+        # Busca EXTRA: Estágios com filtro job_type
+        for site in ["indeed", "linkedin"]:
+            queries.append({
+                "kind": "internship", "site": site, "term": "estagio", "location": "Brazil",
+                "kwargs": {"job_type": "internship", "results_wanted": 100}
+            })
+        
+        # Busca EXTRA: Remotas
+        for site in ["indeed", "linkedin"]:
+            queries.append({
+                "kind": "remote", "site": site, "term": "desenvolvedor", "location": None,
+                "kwargs": {"is_remote": True, "results_wanted": 50}
+            })
+        
+        return queries
+    
+    def _run_query(self, query: Dict) -> Optional[pd.DataFrame]:
+        """Executa uma consulta (ou serve do cache). Retorna None em erro."""
+        key = (query["site"], query["term"], query["location"], query["kind"])
+        
+        with self._cache_lock:
+            cached = self._cache.get(key)
+            if cached and time.time() - cached[0] < self.cache_ttl:
+                self.cache_hits += 1
+                return cached[1]
+        
+        params = dict(
+            site_name=[query["site"]],
+            search_term=query["term"],
+            country_indeed='Brazil',
+            verbose=0,
+            **query["kwargs"]
+        )
+        if query["location"]:
+            params["location"] = query["location"]
+        
+        try:
+            with self._site_slots.get(query["site"], self._default_slot):
+                jobs_df = scrape_jobs(**params)
+        except Exception:
+            # Continua silenciosamente para não travar
+            return None
+        
+        with self._cache_lock:
+            self._cache[key] = (time.time(), jobs_df)
+        return jobs_df
+    
+    def _convert(self, jobs_df: pd.DataFrame, kind: str) -> List[Dict]:
+        """
+        Converte o DataFrame do JobSpy para o formato padrão.
+        Operações por coluna (sem iterrows); equivalente a _safe_str/_parse_location.
+        """
+        if jobs_df is None or len(jobs_df) == 0:
+            return []
+        
+        today = datetime.now().strftime("%Y-%m-%d")
+        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        site = safe_str_column(jobs_df, 'site', 'unknown')
+        
+        if kind == "internship":
+            icon, default_title, suffix = '🎓', 'Estágio', ' Estágio'
+        elif kind == "remote":
+            icon, default_title, suffix = '🏠', 'Remoto', ' Remoto'
+        else:
+            icon = site.map(SITE_ICONS).fillna('⚪')
+            default_title, suffix = 'Vaga', ''
+        
+        link = safe_str_column(jobs_df, 'job_url')
+        frame = pd.DataFrame({
+            "titulo": icon + " " + safe_str_column(jobs_df, 'title', default_title),
+            "empresa": safe_str_column(jobs_df, 'company', 'Empresa'),
+            "localizacao": "🏠 REMOTO" if kind == "remote" else location_column(jobs_df),
+            "link": link,
+            "data_publicacao": safe_str_column(jobs_df, 'date_posted', today),
+            "data_coleta": now,
+            "plataforma": "JobSpy (" + site.str.title() + ")" + suffix,
+        }, index=jobs_df.index)
         
-        print(f"  [+] ✅ {len(unique_jobs)} vagas ÚNICAS via JobSpy (de {len(all_jobs)} total)")
-        return unique_jobs
+        valid = (link != "") & ~link.str.contains("None", regex=False)
+        return frame[valid].astype(object).to_dict("records")
     
     def _parse_location(self, job) -> str:
         """Extrai localização do job."""
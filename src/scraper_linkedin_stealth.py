@@ -1,149 +1,141 @@
 # -*- coding: utf-8 -*-
 """
 Scraper STEALTH para LinkedIn
-Usa undetected-chromedriver para evitar detecção
+Usa undetected-chromedriver para evitar detecção (pool 'stealth' do browser_pool).
+O driver fica aquecido entre ciclos, então a sessão (cookie li_at) é reaproveitada
+e o login só acontece quando necessário.
 """
 
-import undetected_chromedriver as uc
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from datetime import datetime
 from typing import List, Dict
-import time
 import os
 
+from browser_pool import get_pool, wait_for_any, scroll_to_load
+from rate_limiter import limiter
+
 class LinkedInStealthScraper:
     def __init__(self):
         self.email = os.getenv("LINKEDIN_EMAIL", "")
         self.password = os.getenv("LINKEDIN_PASSWORD", "")
         self.platform = "LinkedIn"
-        self.driver = None
-    
-    def _init_driver(self):
-        """Inicializa driver stealth."""
-        options = uc.ChromeOptions()
-        options.add_argument('--no-sandbox')
-        options.add_argument('--disable-dev-shm-usage')
-        options.add_argument('--disable-blink-features=AutomationControlled')
-        options.add_argument('--start-maximized')
-        
-        # Headless optional (mais stealth sem headless)
-        # options.add_argument('--headless')
-        
-        self.driver = uc.Chrome(options=options)
-        self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-    
-    def _login(self):
-        """Login no LinkedIn."""
+
+    def _login(self, driver):
+        """Login no LinkedIn (pulado se a sessão do driver ainda é válida)."""
         try:
-            self.driver.get("https://www.linkedin.com/login")
-            time.sleep(2)
-            
+            # A aba do pool começa em about:blank: o cookie só é visível no domínio
+            driver.get("https://www.linkedin.com/")
+            if driver.get_cookie("li_at"):
+                return True
+
+            driver.get("https://www.linkedin.com/login")
+            if "/login" not in driver.current_url:
+                # Sessão ativa: /login redirecionou para o feed
+                return True
+
             # Email
-            email_field = self.driver.find_element(By.ID, "username")
+            email_field = WebDriverWait(driver, 10).until(
+                EC.presence_of_element_located((By.ID, "username"))
+            )
             email_field.send_keys(self.email)
-            
+
             # Password
-            pass_field = self.driver.find_element(By.ID, "password")
+            pass_field = driver.find_element(By.ID, "password")
             pass_field.send_keys(self.password)
-            
+
             # Submit
-            submit_btn = self.driver.find_element(By.CSS_SELECTOR, "button[type='submit']")
+            submit_btn = driver.find_element(By.CSS_SELECTOR, "button[type='submit']")
             submit_btn.click()
-            
-            time.sleep(5)  # Aguardar login
-            
-            # Verificar se logou
-            if "feed" in self.driver.current_url or "jobs" in self.driver.current_url:
+
+            # Aguardar login (redireciona para feed/jobs)
+            try:
+                WebDriverWait(driver, 15).until(
+                    lambda d: "feed" in d.current_url or "jobs" in d.current_url
+                )
                 print("  [+] Login no LinkedIn OK!")
                 return True
-            else:
+            except Exception:
                 print("  [!] Login falhou - pode precisar de verificação manual")
                 return False
-                
+
         except Exception as e:
             print(f"  [!] Erro no login: {e}")
             return False
-    
+
     def fetch_jobs(self, terms: List[str] = None) -> List[Dict]:
         """Busca vagas no LinkedIn."""
-        
+
         if not self.email or not self.password:
             print(f"\n[*] LinkedIn: Credenciais não configuradas no .env")
             return []
-        
+
         all_jobs = []
-        
+
         print(f"\n[*] Consultando LinkedIn (STEALTH MODE)...")
-        
+
         try:
-            self._init_driver()
-            
-            # Login
-            if not self._login():
-                return []
-            
-            # Buscar vagas
-            search_terms = [
-                "estágio tecnologia",
-                "desenvolvedor júnior",
-                "estagiário programação"
-            ]
-            
-            for query in search_terms[:2]:  # Limitar a 2 buscas
-                try:
-                    # URL de busca de vagas
-                    search_url = f"https://www.linkedin.com/jobs/search/?keywords={query}&location=Brasil&f_TPR=r86400&f_E=2"  # r86400 = últimas 24h, f_E=2 = Entry level
-                    
-                    self.driver.get(search_url)
-                    time.sleep(3)
-                    
-                    # Scroll para carregar vagas
-                    for _ in range(3):
-                        self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                        time.sleep(1)
-                    
-                    # Pegar cards de vagas
-                    job_cards = self.driver.find_elements(By.CSS_SELECTOR, ".job-search-card")
-                    
-                    for card in job_cards[:20]:  # Limitar a 20 por busca
-                        try:
-                            title = card.find_element(By.CSS_SELECTOR, ".job-search-card__title").text
-                            company = card.find_element(By.CSS_SELECTOR, ".job-search-card__company-name").text
-                            location = card.find_element(By.CSS_SELECTOR, ".job-search-card__location").text
-                            link = card.find_element(By.CSS_SELECTOR, "a").get_attribute("href")
-                            
-                            # Limpar link (remover tracking)
-                            if "?" in link:
-                                link = link.split("?")[0]
-                            
-                            job = {
-                                "titulo": f"🔗 {title}",
-                                "empresa": company,
-                                "localizacao": location,
-                                "link": link,
-                                "data_publicacao": datetime.now().strftime("%Y-%m-%d"),
-                                "data_coleta": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                                "plataforma": self.platform
-                            }
-                            
-                            all_jobs.append(job)
-                            
-                        except Exception:
-                            continue
-                    
-                    time.sleep(2)  # Delay entre buscas
-                    
-                except Exception as e:
-                    print(f"  [!] Erro na busca '{query}': {e}")
-                    continue
-            
+            # isolate=False: mantém os cookies da sessão logada no driver
+            with get_pool("stealth").page(isolate=False) as driver:
+                # Login
+                if not self._login(driver):
+                    return []
+
+                # Buscar vagas
+                search_terms = [
+                    "estágio tecnologia",
+                    "desenvolvedor júnior",
+                    "estagiário programação"
+                ]
+
+                for query in search_terms[:2]:  # Limitar a 2 buscas
+                    try:
+                        # Delay entre buscas via rate limiter do host
+                        limiter.acquire("www.linkedin.com")
+
+                        # URL de busca de vagas
+                        search_url = f"https://www.linkedin.com/jobs/search/?keywords={query}&location=Brasil&f_TPR=r86400&f_E=2"  # r86400 = últimas 24h, f_E=2 = Entry level
+
+                        driver.get(search_url)
+
+                        # Aguardar cards + scroll para carregar vagas
+                        wait_for_any(driver, ".job-search-card")
+                        scroll_to_load(driver, rounds=3)
+                        job_cards = driver.find_elements(By.CSS_SELECTOR, ".job-search-card")
+
+                        for card in job_cards[:20]:  # Limitar a 20 por busca
+                            try:
+                                title = card.find_element(By.CSS_SELECTOR, ".job-search-card__title").text
+                                company = card.find_element(By.CSS_SELECTOR, ".job-search-card__company-name").text
+                                location = card.find_element(By.CSS_SELECTOR, ".job-search-card__location").text
+                                link = card.find_element(By.CSS_SELECTOR, "a").get_attribute("href")
+
+                                # Limpar link (remover tracking)
+                                if "?" in link:
+                                    link = link.split("?")[0]
+
+                                job = {
+                                    "titulo": f"🔗 {title}",
+                                    "empresa": company,
+                                    "localizacao": location,
+                                    "link": link,
+                                    "data_publicacao": datetime.now().strftime("%Y-%m-%d"),
+                                    "data_coleta": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                                    "plataforma": self.platform
+                                }
+
+                                all_jobs.append(job)
+
+                            except Exception:
+                                continue
+
+                    except Exception as e:
+                        print(f"  [!] Erro na busca '{query}': {e}")
+                        continue
+
         except Exception as e:
             print(f"  [!] Erro LinkedIn: {e}")
-        finally:
-            if self.driver:
-                self.driver.quit()
-        
+
         print(f"  [+] {len(all_jobs)} vagas encontradas no LinkedIn")
         return all_jobs
@@ -4,7 +4,7 @@ Scraper para Reddit - Vagas de subreddits de emprego.
 100% grátis - usa endpoint .json público.
 """
 
-import requests
+import http_client
 from datetime import datetime
 from typing import List, Dict
 
@@ -36,7 +36,7 @@ class RedditScraper:
                 # Reddit expõe JSON público sem auth
                 url = f"https://www.reddit.com/r/{sub}/new.json?limit=25"
                 
-                response = requests.get(url, headers=self.headers, timeout=15)
+                response = http_client.get(url, headers=self.headers, timeout=15)
                 
                 if response.status_code != 200:
                     continue
@@ -4,7 +4,7 @@ Scraper para RemoteOK API - Vagas remotas internacionais.
 API pública e gratuita.
 """
 
-import requests
+import http_client
 from datetime import datetime
 from typing import List, Dict
 
@@ -22,7 +22,7 @@ class RemoteOKScraper:
         print(f"\n[*] Consultando RemoteOK API...")
 
         try:
-            response = requests.get(
+            response = http_client.get(
                 self.api_url,
                 timeout=15,
                 headers={"User-Agent": "Mozilla/5.0 JobBot/1.0"}
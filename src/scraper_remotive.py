@@ -4,7 +4,7 @@ Scraper para Remotive.com (Via API Pública)
 Remote jobs de alta qualidade
 """
 
-import requests
+import http_client
 from datetime import datetime
 from typing import List, Dict
 
@@ -25,7 +25,7 @@ class RemotiveScraper:
                 # "category": "software-dev" # Opcional: filtrar categoria
             }
             
-            response = requests.get(self.api_url, params=params, timeout=10)
+            response = http_client.get(self.api_url, params=params, timeout=10)
             
             if response.status_code != 200:
                 print(f"  [!] Remotive API retornou {response.status_code}")
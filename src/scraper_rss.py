@@ -4,10 +4,11 @@ Scraper para Feeds RSS.
 """
 
 import feedparser
+import http_client
 from datetime import datetime
 from typing import List, Dict
 
-from config import RSS_FEEDS
+from config import RSS_FEEDS, REQUEST_HEADERS
 
 
 class RssScraper:
@@ -26,7 +27,9 @@ class RssScraper:
         for name, url in self.feeds.items():
             print(f"  [>] Lendo feed: {name}...")
             try:
-                feed = feedparser.parse(url)
+                response = http_client.get(url, headers={"User-Agent": REQUEST_HEADERS["User-Agent"]}, timeout=15)
+                response.raise_for_status()
+                feed = feedparser.parse(response.content)
                 
                 if feed.bozo:
                     print(f"      [!] Aviso: XML do feed pode estar mal formatado.")
@@ -4,7 +4,7 @@ Scraper para TabNews.com.br (Via API)
 Comunidade de TI com vagas de alta qualidade.
 """
 
-import requests
+import http_client
 from datetime import datetime
 from typing import List, Dict
 
@@ -24,7 +24,7 @@ class TabNewsScraper:
         try:
             for page in range(1, 3):
                 params = {"strategy": "new", "page": page, "per_page": 50}
-                response = requests.get(self.url, params=params, timeout=10)
+                response = http_client.get(self.url, params=params, timeout=10)
                 
                 if response.status_code != 200:
                     continue
@@ -4,7 +4,7 @@ Scraper para Trampo.co
 Site BR de vagas para startups e tech
 """
 
-import requests
+import http_client
 from datetime import datetime
 from typing import List, Dict
 
@@ -36,7 +36,7 @@ class TrampoCoScraper:
             }
             
             try:
-                response = requests.get(api_url, headers=self.headers, params=params, timeout=10)
+                response = http_client.get(api_url, headers=self.headers, params=params, timeout=10)
                 
                 if response.status_code == 200:
                     data = response.json()
@@ -82,7 +82,7 @@ class TrampoCoScraper:
         
         try:
             url = f"{self.base_url}/oportunidades?q=junior"
-            response = requests.get(url, headers=self.headers, timeout=10)
+            response = http_client.get(url, headers=self.headers, timeout=10)
             
             if response.status_code != 200:
                 return []
@@ -1,116 +1,108 @@
 # -*- coding: utf-8 -*-
 """
 Scraper SELENIUM para Trampos.co
-Usa Selenium para lidar com JavaScript
+Usa Selenium para lidar com JavaScript (Chrome do browser_pool)
 """
 
-from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
 from datetime import datetime
 from typing import List, Dict
-import time
+
+from browser_pool import get_pool, wait_for_any, scroll_to_load
+
+CARD_SELECTOR = ".opportunity-card, .job-card, article"
+FALLBACK_SELECTOR = "a[href*='/oportunidade/']"
 
 class TramposSeleniumScraper:
     def __init__(self):
         self.base_url = "https://trampos.co/oportunidades"
         self.platform = "Trampos.co"
-        self.driver = None
-    
-    def _init_driver(self):
-        """Inicializa driver Selenium headless."""
-        options = Options()
-        options.add_argument('--headless')
-        options.add_argument('--no-sandbox')
-        options.add_argument('--disable-dev-shm-usage')
-        options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36')
-        
-        self.driver = webdriver.Chrome(options=options)
-    
+
     def fetch_jobs(self, terms: List[str] = None) -> List[Dict]:
         """Busca vagas no Trampos.co via Selenium."""
         all_jobs = []
-        
+
         print(f"\n[*] Consultando Trampos.co (Selenium)...")
-        
+
+        # Buscar por categoria tecnologia
+        urls = [
+            f"{self.base_url}?category=tecnologia",
+            f"{self.base_url}?q=desenvolvedor+junior"
+        ]
+
         try:
-            self._init_driver()
-            
-            # Buscar por categoria tecnologia
-            urls = [
-                f"{self.base_url}?category=tecnologia",
-                f"{self.base_url}?q=desenvolvedor+junior"
-            ]
-            
             for url in urls[:1]:  # Apenas 1 URL
                 try:
-                    self.driver.get(url)
-                    time.sleep(3)
-                    
-                    # Scroll
-                    for _ in range(2):
-                        self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                        time.sleep(1)
-                    
-                    # Buscar vagas
-                    job_cards = self.driver.find_elements(By.CSS_SELECTOR,
-                        ".opportunity-card, .job-card, article")
-                    
-                    if not job_cards:
-                        job_cards = self.driver.find_elements(By.CSS_SELECTOR, "a[href*='/oportunidade/']")
-                    
-                    for card in job_cards[:20]:
-                        try:
-                            title = card.find_element(By.CSS_SELECTOR, "h2, h3, .title").text
-                            
-                            link_elem = card.find_element(By.TAG_NAME, "a")
-                            link = link_elem.get_attribute("href")
-                            
-                            if not link or "trampos.co" not in link:
-                                continue
-                            
-                            # Filtro tech
-                            title_lower = title.lower()
-                            tech_keywords = ['dev', 'programador', 'tech', 'ti', 'software', 
-                                           'júnior', 'junior', 'estágio', 'estagio']
-                            
-                            if not any(kw in title_lower for kw in tech_keywords):
-                                continue
-                            
-                            try:
-                                company = card.find_element(By.CSS_SELECTOR, ".company").text
-                            except:
-                                company = "Startup"
-                            
-                            try:
-                                location = card.find_element(By.CSS_SELECTOR, ".location").text
-                            except:
-                                location = "Brasil"
-                            
-                            job = {
-                                "titulo": f"🚀 {title[:100]}",
-                                "empresa": company,
-                                "localizacao": location,
-                                "link": link,
-                                "data_publicacao": datetime.now().strftime("%Y-%m-%d"),
-                                "data_coleta": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                                "plataforma": self.platform
-                            }
-                            
-                            all_jobs.append(job)
-                            
-                        except Exception:
-                            continue
-                
+                    with get_pool().page() as driver:
+                        driver.get(url)
+
+                        # Aguardar vagas + scroll (lazy loading)
+                        wait_for_any(driver, f"{CARD_SELECTOR}, {FALLBACK_SELECTOR}")
+                        scroll_to_load(driver, rounds=2)
+
+                        # Buscar vagas
+                        job_cards = driver.find_elements(By.CSS_SELECTOR, CARD_SELECTOR)
+
+                        if not job_cards:
+                            job_cards = driver.find_elements(By.CSS_SELECTOR, FALLBACK_SELECTOR)
+
+                        all_jobs.extend(self._parse_cards(job_cards))
+
                 except Exception as e:
                     print(f"  [!] Erro: {e}")
                     continue
-        
+
         except Exception as e:
             print(f"  [!] Erro Trampos Selenium: {e}")
-        finally:
-            if self.driver:
-                self.driver.quit()
-        
+
         print(f"  [+] {len(all_jobs)} vagas encontradas no Trampos.co")
         return all_jobs
+
+    def _parse_cards(self, job_cards) -> List[Dict]:
+        """Extrai vagas dos cards (antes de devolver a aba ao pool)."""
+        all_jobs = []
+
+        for card in job_cards[:20]:
+            try:
+                title = card.find_element(By.CSS_SELECTOR, "h2, h3, .title").text
+
+                link_elem = card.find_element(By.TAG_NAME, "a")
+                link = link_elem.get_attribute("href")
+
+                if not link or "trampos.co" not in link:
+                    continue
+
+                # Filtro tech
+                title_lower = title.lower()
+                tech_keywords = ['dev', 'programador', 'tech', 'ti', 'software',
+                               'júnior', 'junior', 'estágio', 'estagio']
+
+                if not any(kw in title_lower for kw in tech_keywords):
+                    continue
+
+                try:
+                    company = card.find_element(By.CSS_SELECTOR, ".company").text
+                except:
+                    company = "Startup"
+
+                try:
+                    location = card.find_element(By.CSS_SELECTOR, ".location").text
+                except:
+                    location = "Brasil"
+
+                job = {
+                    "titulo": f"🚀 {title[:100]}",
+                    "empresa": company,
+                    "localizacao": location,
+                    "link": link,
+                    "data_publicacao": datetime.now().strftime("%Y-%m-%d"),
+                    "data_coleta": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                    "plataforma": self.platform
+                }
+
+                all_jobs.append(job)
+
+            except Exception:
+                continue
+
+        return all_jobs
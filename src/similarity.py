@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+"""
+Similaridade de Vagas - MinHash + LSH para achar repostagens.
+
+Cada vaga vira uma assinatura normalizada (título + empresa, sem acentos,
+emojis e pontuação) quebrada em shingles de caracteres. O MinHash resume os
+shingles em SIMILARITY_NUM_PERM inteiros e o LSH corta esse resumo em
+SIMILARITY_BANDS faixas: duas vagas viram candidatas se colidirem em pelo
+menos uma faixa.
+
+Ajuste recall x precisão:
+    linhas por faixa r = NUM_PERM / BANDS
+    limiar aproximado de Jaccard = (1 / BANDS) ** (1 / r)
+    mais faixas → mais recall (mais candidatos); menos faixas → mais precisão.
+
+A confirmação final (token_set_ratio / Jaccard) é de quem consulta o índice.
+"""
+
+import hashlib
+import random
+import re
+import unicodedata
+import zlib
+from typing import Dict, Hashable, List, Set, Tuple
+
+from config import SIMILARITY_NUM_PERM, SIMILARITY_BANDS, SIMILARITY_SHINGLE_SIZE
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Primo de Mersenne 2^31 - 1: a*x + b (x < 2^32) cabe em uint64 no numpy
+_PRIME = (1 << 31) - 1
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+
+
+def normalize_signature(titulo: str, empresa: str) -> str:
+    """'🟣 Desenvolvedor(a) Júnior', 'ACME S.A.' → 'desenvolvedor a junior acme s a'."""
+    text = unicodedata.normalize("NFKD", f"{titulo or ''} {empresa or ''}".lower())
+    text = "".join(ch for ch in text if not unicodedata.combining(ch))
+    return _NON_ALNUM.sub(" ", text).strip()
+
+
+def shingles(text: str, size: int = None) -> Set[int]:
+    """Shingles de caracteres (hash crc32) do texto normalizado."""
+    size = size or SIMILARITY_SHINGLE_SIZE
+    if not text:
+        return set()
+    if len(text) <= size:
+        grams = {text}
+    else:
+        grams = {text[i:i + size] for i in range(len(text) - size + 1)}
+    return {zlib.crc32(gram.encode("utf-8")) for gram in grams}
+
+
+def jaccard(a: Set[int], b: Set[int]) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+class MinHasher:
+    """Família de NUM_PERM permutações (a*x + b) mod p, determinística pela seed."""
+
+    def __init__(self, num_perm: int = None, bands: int = None, seed: int = 1):
+        self.num_perm = num_perm or SIMILARITY_NUM_PERM
+        self.bands = bands or SIMILARITY_BANDS
+        if self.num_perm % self.bands:
+            raise ValueError("num_perm deve ser múltiplo de bands")
+        self.rows = self.num_perm // self.bands
+        self.seed = seed
+        rng = random.Random(seed)
+        self._params = [(rng.randrange(1, _PRIME), rng.randrange(0, _PRIME))
+                        for _ in range(self.num_perm)]
+        if np is not None:
+            self._a = np.array([a for a, _ in self._params], dtype=np.uint64)[:, None]
+            self._b = np.array([b for _, b in self._params], dtype=np.uint64)[:, None]
+
+    @property
+    def fingerprint(self) -> str:
+        """Identifica os parâmetros (um índice persistido só vale para os mesmos)."""
+        return f"minhash:{self.num_perm}:{self.bands}:{self.seed}:{SIMILARITY_SHINGLE_SIZE}"
+
+    def signature(self, shingle_set: Set[int]) -> Tuple[int, ...]:
+        if not shingle_set:
+            return ()
+        if np is not None:
+            x = np.fromiter(shingle_set, dtype=np.uint64, count=len(shingle_set))
+            return tuple(((self._a * x + self._b) % _PRIME).min(axis=1).tolist())
+        return tuple(
+            min((a * x + b) % _PRIME for x in shingle_set)
+            for a, b in self._params
+        )
+
+    def band_keys(self, signature: Tuple[int, ...]) -> List[Tuple[int, int]]:
+        """(faixa, bucket) de cada faixa; o bucket cabe num INTEGER do SQLite."""
+        if not signature:
+            return []
+        keys = []
+        for band in range(self.bands):
+            chunk = signature[band * self.rows:(band + 1) * self.rows]
+            digest = hashlib.blake2b(repr(chunk).encode("ascii"), digest_size=8).digest()
+            keys.append((band, int.from_bytes(digest, "big", signed=True)))
+        return keys
+
+    def keys_for(self, titulo: str, empresa: str) -> List[Tuple[int, int]]:
+        return self.band_keys(self.signature(shingles(normalize_signature(titulo, empresa))))
+
+
+_default_hasher = None
+
+
+def get_hasher() -> MinHasher:
+    """MinHasher com os parâmetros do config (compartilhado pelo processo)."""
+    global _default_hasher
+    if _default_hasher is None:
+        _default_hasher = MinHasher()
+    return _default_hasher
+
+
+class LSHIndex:
+    """Índice LSH em memória: (faixa, bucket) → ids."""
+
+    def __init__(self, hasher: MinHasher = None):
+        self.hasher = hasher or get_hasher()
+        self._buckets: Dict[Tuple[int, int], Set[Hashable]] = {}
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, item_id: Hashable, titulo: str, empresa: str) -> None:
+        for key in self.hasher.keys_for(titulo, empresa):
+            self._buckets.setdefault(key, set()).add(item_id)
+        self._size += 1
+
+    def candidates(self, titulo: str, empresa: str) -> Set[Hashable]:
+        found: Set[Hashable] = set()
+        for key in self.hasher.keys_for(titulo, empresa):
+            found |= self._buckets.get(key, set())
+        return found
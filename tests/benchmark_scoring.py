@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark do scoring: matcher compilado x loop de keywords original.
+
+Gera N vagas sintéticas (títulos reais de TI, vendas, bloqueadas e spam),
+confere que os dois caminhos dão o mesmo resultado e mede o tempo de cada um:
+    - calculate_match_score x loop original de keywords
+    - enhance_jobs (lote) x enhance_job_data original (str(job) por tag)
+    - enhance_jobs com ScoreCache aquecido (vagas repetidas de outro ciclo)
+
+Uso:
+    python tests/benchmark_scoring.py [N]
+"""
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from intelligence import Intelligence
+from score_cache import ScoreCache
+from scoring_rules import INTERN_KEYWORDS, JUNIOR_KEYWORDS
+
+LEVELS = ["Estágio", "Estagiário", "Júnior", "Junior", "Trainee", "Pleno", "Sênior", "Intern", ""]
+ROLES = ["Desenvolvedor Python", "Analista de Suporte", "Analista de Segurança", "Dev Go",
+         "Engenheiro de Software", "Analista de TI", "Técnico de Redes", "SDR", "Customer Success",
+         "Frontend React", "Backend Node", "C# .NET Developer", "Cientista de Dados (IA)",
+         "Help Desk N1", "Motorista", "Atendente de Loja", "Estágio em Direito", "Pentest Red Team",
+         "Operador de Caixa", "Renda extra trabalhe em casa digitando", "Looking for work - Python",
+         "DevOps AWS/Docker", "Golang Engineer", "QA Tester", "Analista Comercial", "UX/UI Designer"]
+DESCRIPTIONS = ["", "Bolsa auxílio de R$ 1.800,00 + VR", "Salário: 4.500", "Vaga híbrida em SP",
+                "Atuação com segurança da informação e Python", "Remuneração a combinar"]
+COMPANIES = ["Itaú Unibanco", "Nubank", "Stone", "Globo", "Ti Solutions", "ACME Tecnologia",
+             "Banco do Brasil", "Go Ahead", "Fintech X", "Cyber Corp", "Agro Inc", ""]
+
+
+def synthetic_jobs(n, seed=42):
+    rng = random.Random(seed)
+    return [{
+        "titulo": " ".join(filter(None, [rng.choice(LEVELS), rng.choice(ROLES)])),
+        "empresa": rng.choice(COMPANIES),
+        "descricao": rng.choice(DESCRIPTIONS),
+        "link": f"https://example.com/job/{i}",
+    } for i in range(n)]
+
+
+def legacy_score(brain, job):
+    """Loop original: substring por keyword e um re.search por termo curto."""
+    dangerous = ["ti", "go", "r", "c", "net", "ia", "bio", "agro", "dev", "mec", "rh", "law", "qa", "ux", "ui"]
+
+    def safe_match(keyword, text):
+        keyword = keyword.lower().strip()
+        if len(keyword) < 4 or keyword in dangerous:
+            if keyword == "c++": pattern = r'\bc\+\+\b'
+            elif keyword == "c#": pattern = r'\bc#\b'
+            elif keyword == ".net": pattern = r'\.net\b'
+            elif keyword == "node.js": pattern = r'node\.js\b'
+            else: pattern = f'\\b{re.escape(keyword)}\\b'
+            return bool(re.search(pattern, text))
+        return keyword in text
+
+    score = 0
+    topic_hits = 0
+    text = (str(job.get('titulo', '') or '') + " " + str(job.get('empresa', '') or '')).lower()
+
+    for kw in brain.spam_keywords:
+        if kw in text:
+            return -999
+    for block in brain.block_list:
+        if block in text:
+            return -1
+    for penalty in brain.penalty_list:
+        if penalty in text:
+            score -= 10
+    for data in brain.weights.values():
+        for kw in data["keywords"]:
+            if safe_match(kw, text):
+                score += data["points"]
+                topic_hits += 1
+                break
+    if topic_hits == 0:
+        return 0
+    if any(kw in text for kw in INTERN_KEYWORDS):
+        score += 20
+    if any(kw in text for kw in JUNIOR_KEYWORDS):
+        score += 10
+    return min(max(score, 0), 100)
+
+
+def legacy_enhance(brain, job):
+    """enhance_job_data original: um score por vaga e str(job) três vezes nas tags."""
+    job['score'] = legacy_score(brain, job)
+    job['is_relevant'] = job['score'] > 0
+    job['tags'] = []
+    if job['score'] >= 80: job['tags'].append("🔥 HOT")
+    if "segurança" in str(job).lower() or "cyber" in str(job).lower(): job['tags'].append("🛡️ CYBER")
+    if "python" in str(job).lower(): job['tags'].append("🐍 PYTHON")
+    job['salario'] = brain.extract_salary(str(job.get('descricao', '') or '') + " " + str(job.get('titulo', '') or ''))
+    return job
+
+
+def run(n=10000):
+    brain = Intelligence()
+    jobs = synthetic_jobs(n)
+
+    start = time.perf_counter()
+    legacy = [legacy_score(brain, job) for job in jobs]
+    legacy_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    compiled = [brain.calculate_match_score(job) for job in jobs]
+    compiled_time = time.perf_counter() - start
+
+    mismatches = sum(1 for a, b in zip(legacy, compiled) if a != b)
+    print(f"score  | {n} vagas | original: {legacy_time:.3f}s | compilado: {compiled_time:.3f}s "
+          f"| speedup: {legacy_time / compiled_time:.1f}x | divergências: {mismatches}")
+
+    legacy_jobs = [dict(job) for job in jobs]
+    start = time.perf_counter()
+    for job in legacy_jobs:
+        legacy_enhance(brain, job)
+    legacy_time = time.perf_counter() - start
+
+    batch_jobs = [dict(job) for job in jobs]
+    start = time.perf_counter()
+    brain.enhance_jobs(batch_jobs)
+    batch_time = time.perf_counter() - start
+
+    enhance_mismatches = sum(1 for a, b in zip(legacy_jobs, batch_jobs) if a != b)
+    print(f"enrich | {n} vagas | original: {legacy_time:.3f}s | lote: {batch_time:.3f}s "
+          f"| speedup: {legacy_time / batch_time:.1f}x | divergências: {enhance_mismatches}")
+
+    cached_brain = Intelligence(score_cache=ScoreCache(path=None, size=2 * n))
+    cached_brain.enhance_jobs([dict(job) for job in jobs])
+    cached_jobs = [dict(job) for job in jobs]
+    start = time.perf_counter()
+    cached_brain.enhance_jobs(cached_jobs)
+    cached_time = time.perf_counter() - start
+
+    cache_mismatches = sum(1 for a, b in zip(legacy_jobs, cached_jobs) if a != b)
+    print(f"cache  | {n} vagas | original: {legacy_time:.3f}s | cache: {cached_time:.3f}s "
+          f"| speedup: {legacy_time / cached_time:.1f}x | divergências: {cache_mismatches} "
+          f"| {cached_brain.score_cache.stats()}")
+    return mismatches + enhance_mismatches + cache_mismatches
+
+
+if __name__ == "__main__":
+    sys.exit(1 if run(int(sys.argv[1]) if len(sys.argv) > 1 else 10000) else 0)
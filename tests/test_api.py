@@ -0,0 +1,286 @@
+"""
+Unit tests for the FastAPI backend (api/main.py)
+"""
+import importlib.util
+import pytest
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from database import JobDatabase
+
+pytest.importorskip("fastapi")
+pytest.importorskip("httpx")
+from fastapi.testclient import TestClient
+
+
+def _load_api():
+    spec = importlib.util.spec_from_file_location(
+        "booj_api", Path(__file__).parent.parent / "api" / "main.py"
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _job(i, titulo, empresa="Acme"):
+    return {
+        "titulo": titulo,
+        "empresa": empresa,
+        "localizacao": "Remoto",
+        "link": f"https://example.com/job/{i}",
+        "data_publicacao": "2024-01-01",
+        "data_coleta": "2024-01-01 10:00:00",
+        "plataforma": "Test",
+        "score": i,
+    }
+
+
+@pytest.fixture
+def db(tmp_path):
+    database = JobDatabase(str(tmp_path / "jobs.db"))
+    yield database
+    database.close()
+
+
+@pytest.fixture
+def api(db, tmp_path, monkeypatch):
+    monkeypatch.setenv("DATABASE_PATH", db.db_path)
+    monkeypatch.setenv("API_CACHE_PATH", str(tmp_path / "api_cache.db"))
+    return _load_api()
+
+
+@pytest.fixture
+def client(api):
+    return TestClient(api.app)
+
+
+class TestJobsEndpoint:
+    """Test suite for /api/v1/jobs"""
+
+    def test_search_uses_full_text_index(self, db, client):
+        db.add_jobs_batch([_job(1, "Estágio em Análise de Dados"),
+                           _job(2, "Desenvolvedor Java"),
+                           _job(3, "Suporte Técnico", empresa="Dados SA")])
+
+        body = client.get("/api/v1/jobs", params={"search": "analise"}).json()
+        assert [job["titulo"] for job in body["jobs"]] == ["Estágio em Análise de Dados"]
+        assert body["total"] == 1
+
+        body = client.get("/api/v1/jobs", params={"search": "dado"}).json()
+        assert [job["id"] for job in body["jobs"]] == [1, 3]  # title match ranks first
+
+    def test_listing_without_search(self, db, client):
+        db.add_jobs_batch([_job(i, f"Vaga {name}") for i, name in enumerate(["A", "B", "C"])])
+
+        body = client.get("/api/v1/jobs", params={"limit": 2}).json()
+
+        assert body["total"] == 3
+        assert len(body["jobs"]) == 2
+
+
+class TestCursorPagination:
+    """Test suite for keyset pagination of /api/v1/jobs"""
+
+    def _walk(self, client, **params):
+        seen, cursor = [], None
+        while True:
+            query = dict(params, limit=2)
+            if cursor:
+                query["cursor"] = cursor
+            body = client.get("/api/v1/jobs", params=query).json()
+            seen.extend(job["id"] for job in body["jobs"])
+            cursor = body["next_cursor"]
+            if not cursor:
+                return seen
+
+    def test_cursor_walks_every_job_once(self, db, client):
+        db.add_jobs_batch([_job(i, f"Vaga {i}") for i in range(7)])
+
+        ids = self._walk(client)
+
+        # Same created_at second: score DESC, then id DESC breaks the tie
+        assert ids == [7, 6, 5, 4, 3, 2, 1]
+
+    def test_cursor_with_search_follows_rank(self, db, client):
+        db.add_jobs_batch([_job(i, f"Desenvolvedor Python {i}") for i in range(5)])
+
+        ids = self._walk(client, search="python")
+
+        assert sorted(ids) == [1, 2, 3, 4, 5]
+        assert len(ids) == 5
+
+    def test_invalid_cursor_rejected(self, client):
+        response = client.get("/api/v1/jobs", params={"cursor": "not-a-cursor"})
+        assert response.status_code == 400
+
+    def test_total_modes(self, db, client):
+        db.add_jobs_batch([_job(i, f"Vaga {i}") for i in range(3)])
+
+        assert client.get("/api/v1/jobs", params={"count": "none"}).json()["total"] is None
+        assert client.get("/api/v1/jobs", params={"count": "exact"}).json()["total"] == 3
+        assert client.get("/api/v1/jobs", params={"count": "bogus"}).status_code == 422
+
+    def test_cached_total_follows_new_rows(self, db, client):
+        db.add_job(_job(1, "Vaga 1"))
+        assert client.get("/api/v1/jobs").json()["total"] == 1
+
+        db.add_jobs_batch([_job(i, f"Vaga {i}") for i in range(2, 4)])
+        body = client.get("/api/v1/jobs").json()
+
+        assert body["total"] == len(body["jobs"]) == 3
+
+    def test_cached_totals_are_bounded(self, api, monkeypatch):
+        monkeypatch.setattr(api, "TOTALS_CACHE_SIZE", 2)
+
+        for search in ["python", "java", "go"]:
+            api.cached_total(("db", None, search, False), lambda: 1)
+        api.cached_total(("db", None, "java", False), lambda: pytest.fail("cache miss"))
+
+        assert list(api._totals_cache) == [("db", None, "go", False), ("db", None, "java", False)]
+
+
+class TestResponseCache:
+    """Test suite for generation-based caching and ETag/304"""
+
+    def test_etag_revalidation(self, db, client):
+        db.add_job(_job(1, "Vaga A"))
+        first = client.get("/api/v1/stats")
+        etag = first.headers["etag"]
+
+        again = client.get("/api/v1/stats", headers={"If-None-Match": etag})
+
+        assert again.status_code == 304
+        assert again.content == b""
+
+    def test_hunter_commit_invalidates(self, db, client):
+        db.add_job(_job(1, "Vaga A"))
+        before = client.get("/api/v1/stats")
+
+        db.add_job(_job(2, "Vaga B"))
+        after = client.get("/api/v1/stats", headers={"If-None-Match": before.headers["etag"]})
+
+        assert after.status_code == 200
+        assert after.json()["total_jobs"] == 2
+        assert after.headers["etag"] != before.headers["etag"]
+
+    def test_cache_served_without_querying(self, db, api, client):
+        db.add_job(_job(1, "Vaga A"))
+        assert client.get("/api/v1/jobs").json()["total"] == 1
+
+        api.query_jobs = lambda *args: pytest.fail("cache miss")
+        assert client.get("/api/v1/jobs").json()["total"] == 1
+
+    def test_file_cache_shared_between_workers(self, db, api, client):
+        db.add_job(_job(1, "Vaga A"))
+        client.get("/api/v1/stats")
+
+        other_worker = _load_api()
+        other_worker.query_stats = lambda *args: pytest.fail("cache miss")
+
+        assert TestClient(other_worker.app).get("/api/v1/stats").json()["total_jobs"] == 1
+
+
+class TestOptionalTables:
+    """Test suite for has_table()"""
+
+    def test_missing_table_is_checked_again(self, api):
+        import sqlite3
+        conn = sqlite3.connect(":memory:")
+
+        assert not api.has_table(conn, "stats_daily_platform")
+        conn.execute("CREATE TABLE stats_daily_platform (day TEXT)")
+
+        assert api.has_table(conn, "stats_daily_platform")
+        assert "stats_daily_platform" in api._known_tables
+
+
+class TestStatsEndpoint:
+    """Test suite for /api/v1/stats"""
+
+    def test_stats_from_rollups(self, db, client):
+        jobs = [_job(i, f"Vaga {i}", empresa="Acme" if i < 3 else "Globex") for i in range(5)]
+        db.add_jobs_batch(jobs)
+
+        body = client.get("/api/v1/stats").json()
+
+        assert body["total_jobs"] == 5
+        assert body["jobs_today"] == 5
+        assert body["top_companies"][0] == {"name": "Acme", "count": 3}
+        assert body["top_platforms"] == [{"name": "Test", "count": 5}]
+
+
+class TestAsyncDataLayer:
+    """Test suite for the pooled async database access"""
+
+    def test_stream_json_is_valid_json(self, api):
+        import json
+        rows = [{"n": i} for i in range(5)]
+
+        body = b"".join(api.stream_json({"total": 5}, "jobs", rows, dict, chunk_rows=2))
+
+        assert json.loads(body) == {"total": 5, "jobs": rows}
+        assert json.loads(b"".join(api.stream_json({}, "jobs", [], dict))) == {"jobs": []}
+
+    def test_concurrent_requests_share_bounded_pool(self, db, api):
+        import asyncio
+        import httpx
+        db.add_jobs_batch([_job(i, f"Vaga {i}") for i in range(20)])
+        api.database = api.AsyncDatabase(size=3)
+
+        async def burst():
+            transport = httpx.ASGITransport(app=api.app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                return await asyncio.gather(*[
+                    client.get("/api/v1/jobs", params={"limit": 5, "skip": i % 4, "count": "exact"})
+                    for i in range(30)
+                ])
+
+        responses = asyncio.run(burst())
+
+        assert all(r.status_code == 200 for r in responses)
+        assert api.database.opened <= 3
+
+    def test_connection_returned_after_error(self, api):
+        import asyncio
+
+        async def scenario():
+            db = api.AsyncDatabase(size=1)
+
+            def boom(conn):
+                raise RuntimeError("query failed")
+
+            for _ in range(3):
+                try:
+                    await db.run(boom)
+                except RuntimeError:
+                    pass
+            count = await db.run(lambda conn: conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0])
+            await db.close()
+            return count
+
+        assert asyncio.run(scenario()) == 0
+
+    def test_connection_closed_when_returned_after_shutdown(self, api):
+        import asyncio
+        import sqlite3
+
+        async def scenario():
+            db = api.AsyncDatabase(size=1)
+            async with db.connection() as conn:
+                await db.close()  # shutdown while a request still holds the connection
+            return conn
+
+        conn = asyncio.run(scenario())
+
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+
+    def test_lifespan_opens_and_closes_pool(self, db, api):
+        with TestClient(api.app) as client:
+            assert client.get("/health").json()["database"] == "healthy"
+            assert api.database._pool is not None
+
+        assert api.database._pool is None
@@ -45,3 +45,98 @@ class TestIntelligenceBasic:
         assert 'is_relevant' in enhanced
         assert 'tags' in enhanced
         assert isinstance(enhanced['score'], int)
+
+
+class TestCompiledMatcher:
+    """Single-pass keyword matcher used by calculate_match_score"""
+
+    def test_overlapping_and_boundary_patterns(self):
+        """Overlapping keywords are all found; short ones need word boundaries"""
+        from keyword_matcher import KeywordMatcher
+
+        matcher = KeywordMatcher([("segurança", False, False),
+                                  ("segurança patrimonial", False, False),
+                                  ("ti", True, True), ("c#", True, True)])
+
+        assert matcher.find("vigia de segurança patrimonial") == {0, 1}
+        assert matcher.find("analista de ti") == {2}
+        assert matcher.find("gestão de estoque em tintas") == set()
+        assert matcher.find("c# developer") == set()  # mesmo comportamento do r'\bc#\b'
+
+    def test_same_scores_as_keyword_loop(self):
+        """Compiled rules return exactly the scores of the original loop"""
+        from intelligence import Intelligence
+        from benchmark_scoring import legacy_score, synthetic_jobs
+
+        brain = Intelligence()
+        jobs = synthetic_jobs(2000) + [
+            {"titulo": "Analista de TI", "empresa": "Tintas SA"},
+            {"titulo": "Estágio Go", "empresa": "Golang Labs"},
+            {"titulo": "Dev Pleno Python", "empresa": None},
+            {"titulo": "Renda extra", "empresa": "Python"},
+        ]
+
+        for job in jobs:
+            assert brain.calculate_match_score(job) == legacy_score(brain, job), job
+
+    def test_verify_spam_returns_first_keyword(self):
+        """verify_spam keeps the list order of the spam triggers"""
+        from intelligence import Intelligence
+
+        brain = Intelligence()
+        assert brain.verify_spam("[FOR HIRE] Python dev") == (True, "for hire")
+        assert brain.verify_spam("Desenvolvedor Python") == (False, None)
+
+    def test_compile_rules_after_tuning(self):
+        """Weights changed at runtime take effect after compile_rules()"""
+        from intelligence import Intelligence
+
+        brain = Intelligence()
+        job = {"titulo": "Estágio em Kotlin", "empresa": "Acme"}
+        assert brain.calculate_match_score(job) == 0
+
+        brain.weights["secondary"]["keywords"].append("kotlin")
+        brain.compile_rules()
+        assert brain.calculate_match_score(job) == 30
+
+
+class TestBatchScoring:
+    """Batch API used by the pipeline and rescoring"""
+
+    def test_batch_matches_single_job_path(self):
+        """enhance_jobs annotates a batch exactly like the original per-job code"""
+        from intelligence import Intelligence
+        from benchmark_scoring import legacy_enhance, synthetic_jobs
+
+        brain = Intelligence()
+        jobs = synthetic_jobs(500)
+        expected = [legacy_enhance(brain, dict(job)) for job in jobs]
+
+        assert brain.enhance_jobs(jobs) == expected
+
+    def test_old_tags_are_replaced(self):
+        """Rescoring a stored row does not keep tags from the previous rules"""
+        from intelligence import Intelligence
+
+        brain = Intelligence()
+        job = {"titulo": "Estágio Python", "empresa": "Acme", "tags": ["🛡️ CYBER"]}
+        brain.enhance_jobs([job])
+
+        assert job["tags"] == ["🐍 PYTHON"]
+
+    def test_dataframe_batch(self):
+        """A DataFrame comes back with the annotated columns"""
+        pd = pytest.importorskip("pandas")
+        from intelligence import Intelligence
+
+        frame = pd.DataFrame([
+            {"titulo": "Estágio em Segurança da Informação", "empresa": "Cyber Corp",
+             "descricao": "Bolsa auxílio R$ 1.500"},
+            {"titulo": "Motorista", "empresa": "Acme", "descricao": ""},
+        ])
+        result = Intelligence().enhance_jobs(frame)
+
+        assert list(result["score"]) == [50, -1]
+        assert list(result["is_relevant"]) == [True, False]
+        assert result["salario"][0] == "R$ 1.500"
+        assert "score" not in frame.columns
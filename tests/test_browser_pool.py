@@ -0,0 +1,126 @@
+"""
+Unit tests for the Selenium browser pool (no real Chrome needed)
+"""
+import threading
+import pytest
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from browser_pool import BrowserPool
+
+
+class FakeSwitchTo:
+    def __init__(self, driver):
+        self.driver = driver
+
+    def new_window(self, kind):
+        handle = f"tab-{len(self.driver.window_handles)}"
+        self.driver.window_handles.append(handle)
+        self.driver.current_window_handle = handle
+
+    def window(self, handle):
+        self.driver.current_window_handle = handle
+
+
+class FakeDriver:
+    """Minimal stand-in for a Selenium WebDriver"""
+
+    def __init__(self):
+        self.window_handles = ["base"]
+        self.current_window_handle = "base"
+        self.switch_to = FakeSwitchTo(self)
+        self.cookies_cleared = 0
+        self.cdp_commands = []
+        self.quit_called = False
+
+    def close(self):
+        self.window_handles.remove(self.current_window_handle)
+
+    def delete_all_cookies(self):
+        self.cookies_cleared += 1
+
+    def execute_cdp_cmd(self, cmd, params):
+        self.cdp_commands.append(cmd)
+        if cmd == "Network.clearBrowserCookies":
+            self.cookies_cleared += 1
+
+    def quit(self):
+        self.quit_called = True
+
+
+@pytest.fixture
+def drivers():
+    return []
+
+
+@pytest.fixture
+def pool(drivers):
+    def factory():
+        driver = FakeDriver()
+        drivers.append(driver)
+        return driver
+    pool = BrowserPool(factory=factory, size=2, max_pages=3)
+    yield pool
+    pool.close()
+
+
+class TestBrowserPool:
+    """Test suite for BrowserPool"""
+
+    def test_driver_is_reused_with_fresh_tab(self, pool, drivers):
+        """Sequential leases share one warm driver, each in its own tab"""
+        with pool.page() as first:
+            assert first.current_window_handle != "base"
+        with pool.page() as second:
+            pass
+
+        assert len(drivers) == 1
+        assert first is second
+        assert first.window_handles == ["base"]
+        assert first.cookies_cleared == 2
+
+    def test_recycles_after_max_pages(self, pool, drivers):
+        """A driver is quit and replaced after max_pages uses"""
+        for _ in range(4):
+            with pool.page():
+                pass
+
+        assert len(drivers) == 2
+        assert drivers[0].quit_called
+        assert pool.stats["recycled"] == 1
+
+    def test_concurrent_leases_capped_by_size(self, pool, drivers):
+        """No more drivers than the pool size, extra callers wait"""
+        barrier = threading.Barrier(2)
+        seen = []
+
+        def worker():
+            with pool.page() as driver:
+                seen.append(driver)
+                barrier.wait(timeout=2)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(timeout=5)
+
+        assert len(seen) == 4
+        assert len(drivers) == 2
+
+    def test_isolate_false_keeps_session(self, pool, drivers):
+        """Stealth leases keep cookies (logged-in session)"""
+        with pool.page(isolate=False):
+            pass
+
+        assert drivers[0].cookies_cleared == 0
+
+    def test_isolation_clears_every_domain(self, pool, drivers):
+        """Cookies are cleared through CDP, not only for the current tab's domain"""
+        with pool.page():
+            pass
+
+        assert drivers[0].cdp_commands == ["Network.clearBrowserCookies"]
@@ -0,0 +1,117 @@
+"""
+Unit tests for job canonicalization
+"""
+import pytest
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from canonical import (canonical_key, canonical_url, canonicalize_job,
+                       normalize_company, strip_decoration)
+from database import JobDatabase
+
+
+class TestCanonical:
+    """Test suite for canonical keys and URLs"""
+
+    def test_strip_decoration(self):
+        assert strip_decoration("🟣  Desenvolvedor  Jr 🚀") == "Desenvolvedor Jr"
+
+    def test_normalize_company_drops_legal_suffix(self):
+        assert normalize_company("Itaú Unibanco S.A.") == "itau unibanco"
+        assert normalize_company("ACME Tecnologia Ltda.") == "acme tecnologia"
+        assert normalize_company("Empresa A") == "empresa a"
+
+    def test_canonical_url_drops_tracking(self):
+        url = "https://www.linkedin.com/jobs/view/123/?refId=abc&trackingId=x&utm_source=y#top"
+        assert canonical_url(url) == "https://linkedin.com/jobs/view/123"
+
+    def test_canonical_url_keeps_identifying_params(self):
+        url = "https://br.indeed.com/viewjob?jk=abc123&gclid=1&utm_medium=cpc"
+        assert canonical_url(url) == "https://br.indeed.com/viewjob?jk=abc123"
+
+    def test_canonical_url_keeps_generic_params(self):
+        url = "https://jobs.example.com/vaga?id=7&ref=42&src=board&position=3&from=home"
+        assert canonical_url(url) == "https://jobs.example.com/vaga?from=home&id=7&position=3&ref=42&src=board"
+
+    def test_canonical_url_keeps_route_fragments(self):
+        assert canonical_url("https://vagas.example.com/#/vaga/123") == "https://vagas.example.com/#/vaga/123"
+        assert canonical_url("https://vagas.example.com/app#!/vaga/9") == "https://vagas.example.com/app#!/vaga/9"
+        assert canonical_url("https://vagas.example.com/vaga/1#descricao") == "https://vagas.example.com/vaga/1"
+
+    def test_same_job_same_key(self):
+        a = {"titulo": "🎓 Estágio em TI", "empresa": "Itaú Unibanco S.A."}
+        b = {"titulo": "Estagio em TI", "empresa": "ITAU UNIBANCO"}
+        c = {"titulo": "Estágio em Dados", "empresa": "Itaú Unibanco"}
+
+        assert canonical_key(a) == canonical_key(b)
+        assert canonical_key(a) != canonical_key(c)
+
+    def test_no_title_no_key(self):
+        assert canonical_key({"titulo": "🚀", "empresa": "Acme"}) == ""
+
+    def test_placeholder_company_falls_back_to_link(self):
+        a = {"titulo": "Estágio em TI", "empresa": "Confidencial", "link": "https://a.com/vaga/1"}
+        b = {"titulo": "Estágio em TI", "empresa": "N/A", "link": "https://a.com/vaga/2"}
+        repost = dict(a, empresa="", link="https://www.a.com/vaga/1/?utm_source=x")
+
+        assert canonical_key(a) != canonical_key(b)
+        assert canonical_key(a) == canonical_key(repost)
+        assert canonical_key({"titulo": "Estágio em TI", "empresa": "Confidencial"}) == ""
+
+
+class TestCanonicalDedupe:
+    """Test suite for canonical-key dedupe in JobDatabase"""
+
+    def test_cross_platform_repost_is_duplicate(self, tmp_path):
+        db = JobDatabase(str(tmp_path / "jobs.db"))
+        db.add_job(canonicalize_job({
+            "titulo": "🟣 Desenvolvedor Backend Pleno", "empresa": "Globex S/A",
+            "link": "https://www.linkedin.com/jobs/view/1?trackingId=a",
+        }))
+        repost = canonicalize_job({
+            "titulo": "🔵 Desenvolvedor Backend Pleno", "empresa": "Globex",
+            "link": "https://globex.gupy.io/jobs/77",
+        })
+
+        assert db.canonical_exists(repost["canonical_key"])
+        assert db.filter_new_jobs([repost]) == []
+        db.close()
+
+    def test_original_link_is_kept(self, tmp_path):
+        """Only the key is canonical: the stored link is the one the source sent"""
+        link = "https://www.linkedin.com/jobs/view/1/?trackingId=a"
+        db = JobDatabase(str(tmp_path / "jobs.db"))
+        db.add_job(canonicalize_job({"titulo": "Analista de Dados", "empresa": "Hooli", "link": link}))
+
+        assert db.get_job(link) is not None
+        assert db.filter_new_jobs([canonicalize_job({"titulo": "Outra vaga", "empresa": "Initech",
+                                                     "link": link})]) == []
+        db.close()
+
+    def test_old_rows_backfilled(self, tmp_path):
+        """Databases from before the column are migrated and keyed on open"""
+        import sqlite3
+        path = str(tmp_path / "jobs.db")
+        conn = sqlite3.connect(path)
+        conn.execute("""
+            CREATE TABLE jobs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT, link TEXT UNIQUE NOT NULL,
+                titulo TEXT, empresa TEXT, localizacao TEXT, plataforma TEXT,
+                data_publicacao TEXT, data_coleta TEXT, score INTEGER DEFAULT 0,
+                is_relevant BOOLEAN DEFAULT 1, tags TEXT DEFAULT '[]',
+                sent_discord BOOLEAN DEFAULT 0, sent_telegram BOOLEAN DEFAULT 0,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        conn.execute("INSERT INTO jobs (link, titulo, empresa) VALUES (?, ?, ?)",
+                     ("https://x/1", "Analista de Dados", "Hooli"))
+        conn.commit()
+        conn.close()
+
+        db = JobDatabase(path)
+        assert db.canonical_exists(canonical_key({"titulo": "Analista de Dados",
+                                                  "empresa": "Hooli"}))
+        db.close()
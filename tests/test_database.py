@@ -27,3 +27,289 @@ class TestDatabaseBasic:
         # Just verify the class exists and can be referenced
         assert JobDatabase is not None
         assert callable(JobDatabase)
+
+
+ROLES = ["Backend", "Frontend", "Dados", "Suporte", "Cloud", "Mobile", "QA", "DevOps"]
+
+
+def _job(i):
+    # Distinct titles/companies, or the fuzzy dedupe treats them as reposts
+    return {
+        "titulo": f"{ROLES[i % len(ROLES)]} {i}",
+        "empresa": f"Empresa{i}",
+        "localizacao": "Remoto",
+        "link": f"https://example.com/job/{i}",
+        "data_publicacao": "2024-01-01",
+        "data_coleta": "2024-01-01 10:00:00",
+        "plataforma": "Test",
+    }
+
+
+@pytest.fixture
+def db(tmp_path):
+    from database import JobDatabase
+    database = JobDatabase(str(tmp_path / "jobs.db"))
+    yield database
+    database.close()
+
+
+class TestConnectionManager:
+    """Test suite for the pooled connections behind JobDatabase"""
+
+    def test_connections_are_reused(self, db):
+        """Calls share the writer and the pooled readers instead of reconnecting"""
+        with db._write() as first:
+            pass
+        with db._write() as second:
+            pass
+        with db._read() as reader_a:
+            pass
+        with db._read() as reader_b:
+            pass
+
+        assert first is second
+        assert reader_a is reader_b
+
+    def test_write_rolls_back_on_error(self, db):
+        """A failed block leaves no partial writes behind"""
+        with pytest.raises(RuntimeError):
+            with db._write() as conn:
+                conn.execute(
+                    "INSERT INTO jobs (titulo, link) VALUES (?, ?)", ("X", "https://x")
+                )
+                raise RuntimeError("boom")
+
+        assert db.count_jobs() == 0
+
+    def test_mark_sent_reports_only_real_updates(self, db):
+        """rowcount, not the connection-wide total_changes, decides the result"""
+        db.add_job(_job(1))
+
+        assert db.mark_sent("https://example.com/job/1") is True
+        assert db.mark_sent("https://example.com/missing") is False
+
+    def test_concurrent_reads_and_writes(self, db):
+        """Threads can share one JobDatabase"""
+        import threading
+
+        errors = []
+
+        def worker(offset):
+            try:
+                for i in range(offset, offset + 20):
+                    db.add_job(_job(i))
+                    db.job_exists(f"https://example.com/job/{i}")
+            except Exception as e:  # pragma: no cover - reported below
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker, args=(n * 100,)) for n in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert errors == []
+        assert db.count_jobs() == 80
+
+
+class TestMigrations:
+    """Test suite for the schema migrations run on open"""
+
+    def test_null_scores_migrated_once(self, tmp_path):
+        """NULL scores are zeroed on the first open only (no full scan on every start)"""
+        import sqlite3
+        from database import JobDatabase
+        path = str(tmp_path / "jobs.db")
+        with sqlite3.connect(path) as conn:
+            conn.execute("""
+                CREATE TABLE jobs (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT, link TEXT UNIQUE NOT NULL,
+                    titulo TEXT, empresa TEXT, localizacao TEXT, plataforma TEXT,
+                    data_publicacao TEXT, data_coleta TEXT, score INTEGER,
+                    is_relevant BOOLEAN DEFAULT 1, tags TEXT DEFAULT '[]',
+                    sent_discord BOOLEAN DEFAULT 0, sent_telegram BOOLEAN DEFAULT 0,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+            conn.execute("INSERT INTO jobs (link, titulo) VALUES ('https://x/1', 'Vaga')")
+
+        db = JobDatabase(path)
+        assert db.get_job("https://x/1")["score"] == 0
+        assert db.get_meta("migrated_null_scores") == "1"
+        with db._write() as conn:
+            conn.execute("UPDATE jobs SET score = NULL")
+        db.close()
+
+        db = JobDatabase(path)
+        assert db.get_job("https://x/1")["score"] is None
+        db.close()
+
+
+class TestReadOnly:
+    """Test suite for JobDatabase(read_only=True)"""
+
+    def test_reads_without_touching_the_schema(self, tmp_path):
+        """Search and stats work; no migrations run and writes are refused"""
+        import sqlite3
+        from database import JobDatabase
+        path = str(tmp_path / "jobs.db")
+        writer = JobDatabase(path)
+        writer.add_job(dict(_job(1), titulo="Estágio Python"))
+        writer.close()
+        with sqlite3.connect(path) as conn:
+            conn.execute("DROP INDEX idx_jobs_feed")
+
+        db = JobDatabase(path, read_only=True)
+        assert [job["link"] for job in db.search_jobs("python")] == ["https://example.com/job/1"]
+        assert db.get_stats()["total_jobs"] == 1
+        with pytest.raises(sqlite3.OperationalError):
+            with db._write() as conn:
+                conn.execute("DELETE FROM jobs")
+        db.close()
+
+        with sqlite3.connect(path) as conn:
+            indexes = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+        assert "idx_jobs_feed" not in indexes
+
+
+class TestStorageProfile:
+    """Test suite for the WAL/pragma profile and maintenance"""
+
+    def test_profile_applied_to_connections(self, db):
+        """Every pooled connection runs in WAL with the configured pragmas"""
+        with db._read() as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 5000
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+
+    def test_readers_not_blocked_by_open_write(self, db):
+        """A read sees the last committed state while a write transaction is open"""
+        db.add_job(_job(1))
+
+        with db._write() as conn:
+            conn.execute(
+                "INSERT INTO jobs (titulo, link) VALUES (?, ?)", ("X", "https://x")
+            )
+            assert db.count_jobs() == 1
+
+        assert db.count_jobs() == 2
+
+    def test_maintenance_checkpoints_wal(self, db):
+        """maintenance() truncates the WAL and resets the interval"""
+        db.add_jobs_batch([_job(i) for i in range(10)])
+        assert db.maintenance_due()
+
+        result = db.maintenance()
+
+        assert result["busy"] is False
+        assert result["wal_pages"] == 0
+        assert not db.maintenance_due()
+
+
+class TestBulkDedupe:
+    """Test suite for JobDatabase.filter_new_jobs"""
+
+    def test_exact_links_removed(self, db):
+        """Known links are dropped, order of the rest is kept"""
+        db.add_job(_job(1))
+        batch = [_job(2), _job(1), _job(3)]
+
+        novel = db.filter_new_jobs(batch)
+
+        assert [job["link"] for job in novel] == [
+            "https://example.com/job/2", "https://example.com/job/3"
+        ]
+
+    def test_fuzzy_duplicates_removed(self, db):
+        """A reposted job with another link is a duplicate"""
+        existing = _job(1)
+        existing.update(titulo="Desenvolvedor Python Junior", empresa="Acme Tecnologia")
+        db.add_job(existing)
+
+        repost = _job(2)
+        repost.update(titulo="Desenvolvedor Python Junior", empresa="Acme Tecnologia")
+        other = _job(3)
+        other.update(titulo="Analista de Dados", empresa="Globex")
+
+        assert db.filter_new_jobs([repost, other]) == [other]
+
+    def test_duplicates_inside_batch(self, db):
+        """The second copy inside the same batch is dropped"""
+        first = _job(1)
+        second = _job(2)
+        second.update(titulo=first["titulo"], empresa=first["empresa"])
+
+        assert db.filter_new_jobs([first, second, first]) == [first]
+
+
+class TestFullTextSearch:
+    """Test suite for the FTS5 search index"""
+
+    def test_prefix_and_accent_insensitive(self, db):
+        job = _job(1)
+        job.update(titulo="Estágio em Análise de Dados", empresa="Globex")
+        db.add_job(job)
+
+        assert db.search_jobs("estag analise")[0]["link"] == job["link"]
+        assert db.search_jobs("globe")[0]["link"] == job["link"]
+        assert db.search_jobs("python") == []
+
+    def test_title_matches_rank_first(self, db):
+        in_title = _job(1)
+        in_title.update(titulo="Desenvolvedor Python", empresa="Acme")
+        in_company = _job(2)
+        in_company.update(titulo="Analista de Suporte", empresa="Python Software")
+        db.add_jobs_batch([in_company, in_title])
+
+        links = [job["link"] for job in db.search_jobs("python")]
+
+        assert links == [in_title["link"], in_company["link"]]
+
+    def test_index_follows_updates(self, db):
+        db.add_job(_job(1))
+        with db._write() as conn:
+            conn.execute("UPDATE jobs SET titulo = 'Engenheiro Kotlin' WHERE link = ?",
+                         (_job(1)["link"],))
+
+        assert len(db.search_jobs("kotlin")) == 1
+        assert db.search_jobs("frontend") == []
+
+    def test_operators_in_input_are_escaped(self, db):
+        """FTS syntax typed by the user is searched as plain words, never parsed"""
+        db.add_job(_job(1))
+        assert db.search_jobs('frontend" (') != []
+        assert db.search_jobs('"*') == []
+
+
+class TestStatsRollups:
+    """Test suite for the stats_daily_* rollup tables"""
+
+    def _raw_top(self, db, column):
+        with db._read() as conn:
+            return {row[0]: row[1] for row in conn.execute(
+                f"SELECT {column}, COUNT(*) FROM jobs GROUP BY {column}"
+            )}
+
+    def test_batch_updates_rollups(self, db):
+        jobs = [_job(i) for i in range(6)]
+        for i, job in enumerate(jobs):
+            job["plataforma"] = "LinkedIn" if i % 2 else "Gupy"
+            job["empresa"] = "Acme" if i < 4 else "Globex"
+        db.add_jobs_batch(jobs)
+        db.add_jobs_batch(jobs[:2])  # duplicates are not counted twice
+
+        stats = db.get_stats()
+
+        assert stats["total_jobs"] == 6
+        assert stats["jobs_last_24h"] == 6
+        assert {p["name"]: p["count"] for p in stats["top_platforms"]} == self._raw_top(db, "plataforma")
+        assert stats["top_companies"][0] == {"name": "Acme", "count": 4}
+
+    def test_rebuild_matches_raw_rows(self, db):
+        db.add_jobs_batch([_job(i) for i in range(3)])
+        with db._write() as conn:
+            conn.execute("DELETE FROM stats_daily_company")
+
+        assert db.rebuild_stats_rollups() > 0
+        assert {c["name"]: c["count"] for c in db.get_stats(top=10)["top_companies"]} == \
+            self._raw_top(db, "empresa")
@@ -0,0 +1,132 @@
+"""
+Unit tests for the shared HTTP client (pooling, cache, conditional GET)
+"""
+import pytest
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from http_client import HttpClient
+
+
+def _response(status=200, body=b'{"jobs": []}', headers=None, url="https://api.example.com/jobs"):
+    response = requests.Response()
+    response.status_code = status
+    response._content = body
+    response.headers = CaseInsensitiveDict(headers or {})
+    response.url = url
+    return response
+
+
+@pytest.fixture
+def client(tmp_path):
+    """Client with an isolated on-disk cache"""
+    return HttpClient(cache_path=str(tmp_path / "http_cache.db"), default_ttl=0)
+
+
+class TestHttpClient:
+    """Test suite for HttpClient"""
+
+    def test_one_session_per_host(self, client):
+        """Sessions are pooled per host"""
+        a = client.session_for("https://api.example.com/a")
+        b = client.session_for("https://api.example.com/b?x=1")
+        c = client.session_for("https://other.example.com/")
+
+        assert a is b
+        assert a is not c
+
+    def test_conditional_get_uses_cached_body(self, client):
+        """A 304 revalidation returns the cached body and counts savings"""
+        first = _response(headers={"ETag": '"v1"', "Last-Modified": "Mon, 02 Feb 2026 10:00:00 GMT"})
+        not_modified = _response(status=304, body=b"")
+
+        with patch.object(requests.Session, "get", side_effect=[first, not_modified]) as mock_get:
+            client.get("https://api.example.com/jobs", params={"page": 1})
+            second = client.get("https://api.example.com/jobs", params={"page": 1})
+
+        sent_headers = mock_get.call_args_list[1].kwargs["headers"]
+        assert sent_headers["If-None-Match"] == '"v1"'
+        assert sent_headers["If-Modified-Since"] == "Mon, 02 Feb 2026 10:00:00 GMT"
+        assert second.status_code == 200
+        assert second.json() == {"jobs": []}
+        assert second.from_cache is True
+
+        stats = client.stats()
+        assert stats["network_requests"] == 2
+        assert stats["not_modified"] == 1
+        assert stats["bytes_saved"] == len(b'{"jobs": []}')
+
+    def test_fresh_entry_skips_network(self, tmp_path):
+        """Within the TTL no request is sent at all"""
+        client = HttpClient(cache_path=str(tmp_path / "http_cache.db"), default_ttl=300)
+
+        with patch.object(requests.Session, "get", return_value=_response()) as mock_get:
+            client.get("https://api.example.com/jobs")
+            cached = client.get("https://api.example.com/jobs")
+
+        assert mock_get.call_count == 1
+        assert cached.from_cache is True
+        assert client.stats()["requests_saved"] == 1
+
+    def test_no_store_is_not_cached(self, client):
+        """Responses marked no-store never get validators sent back"""
+        first = _response(headers={"ETag": '"v1"', "Cache-Control": "no-store"})
+
+        with patch.object(requests.Session, "get", side_effect=[first, _response()]) as mock_get:
+            client.get("https://api.example.com/jobs")
+            client.get("https://api.example.com/jobs")
+
+        assert "If-None-Match" not in mock_get.call_args_list[1].kwargs["headers"]
+
+    def test_varying_request_headers_are_part_of_the_key(self, tmp_path):
+        """Another Authorization never gets a response cached for other credentials"""
+        client = HttpClient(cache_path=str(tmp_path / "http_cache.db"), default_ttl=300)
+
+        with patch.object(requests.Session, "get", side_effect=[_response(body=b"a"), _response(body=b"b")]) as mock_get:
+            first = client.get("https://api.example.com/jobs", headers={"Authorization": "Bearer a"})
+            second = client.get("https://api.example.com/jobs", headers={"Authorization": "Bearer b"})
+            again = client.get("https://api.example.com/jobs", headers={"Authorization": "Bearer a"})
+
+        assert mock_get.call_count == 2
+        assert (first.content, second.content, again.content) == (b"a", b"b", b"a")
+
+    def test_vary_outside_the_key_is_not_cached(self, tmp_path):
+        """A response that varies on a header the key ignores is not stored"""
+        client = HttpClient(cache_path=str(tmp_path / "http_cache.db"), default_ttl=300)
+        varying = _response(headers={"Vary": "Accept-Encoding, X-Region"})
+
+        with patch.object(requests.Session, "get", side_effect=[varying, _response()]) as mock_get:
+            client.get("https://api.example.com/jobs")
+            client.get("https://api.example.com/jobs")
+
+        assert mock_get.call_count == 2
+
+    @pytest.mark.parametrize("cache_control", ["no-cache", "max-age=0"])
+    def test_no_cache_always_revalidates(self, tmp_path, cache_control):
+        """no-cache / max-age=0 keep the validators but never skip the network"""
+        client = HttpClient(cache_path=str(tmp_path / "http_cache.db"), default_ttl=300)
+        first = _response(headers={"ETag": '"v1"', "Cache-Control": cache_control})
+        not_modified = _response(status=304, body=b"")
+
+        with patch.object(requests.Session, "get", side_effect=[first, not_modified]) as mock_get:
+            client.get("https://api.example.com/jobs")
+            second = client.get("https://api.example.com/jobs")
+
+        assert mock_get.call_count == 2
+        assert mock_get.call_args_list[1].kwargs["headers"]["If-None-Match"] == '"v1"'
+        assert second.from_cache is True
+
+    def test_accept_encoding_is_supported_set(self, client):
+        """Accept-Encoding only advertises codecs requests can decode"""
+        with patch.object(requests.Session, "get", return_value=_response()) as mock_get:
+            client.get("https://api.example.com/jobs", headers={"Accept-Encoding": "gzip, deflate, br"})
+
+        sent = mock_get.call_args.kwargs["headers"]["Accept-Encoding"]
+        assert sent == requests.utils.DEFAULT_ACCEPT_ENCODING
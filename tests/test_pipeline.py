@@ -0,0 +1,122 @@
+"""
+Unit tests for the streaming job pipeline
+"""
+from datetime import datetime
+import pytest
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from database import JobDatabase
+from pipeline import JobPipeline
+
+
+class FakeBrain:
+    """Scores by title: 'lixo' jobs are negative"""
+
+    def enhance_job_data(self, job):
+        job["score"] = -10 if "lixo" in job["titulo"].lower() else 50
+        job["tags"] = []
+        return job
+
+    def enhance_jobs(self, jobs):
+        return [self.enhance_job_data(job) for job in jobs]
+
+
+TITLES = ["Desenvolvedor Python Junior", "Estágio em Dados", "Analista de Suporte Jr",
+          "Trainee Cloud", "Frontend React Pleno", "QA Tester Estagiário"]
+COMPANIES = ["Acme", "Globex", "Initech", "Umbrella", "Hooli", "Stark"]
+
+
+def _job(i, titulo=None):
+    return {
+        "titulo": titulo or TITLES[i],
+        "empresa": COMPANIES[i],
+        "localizacao": "Remoto",
+        "link": f"https://example.com/job/{i}",
+        "data_publicacao": datetime.now().strftime("%Y-%m-%d"),
+        "data_coleta": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "plataforma": "Test",
+    }
+
+
+@pytest.fixture
+def db(tmp_path):
+    return JobDatabase(str(tmp_path / "jobs.db"))
+
+
+class TestJobPipeline:
+    """Test suite for JobPipeline"""
+
+    def test_micro_batches_reach_database(self, db):
+        """Jobs are filtered, scored and inserted in small batches"""
+        notified = []
+        pipeline = JobPipeline(db, FakeBrain(), notify=lambda job: notified.append(job) or True,
+                               batch_size=2, flush_interval=60).start()
+
+        pipeline.put("A", _job(1))
+        pipeline.put("A", _job(2, titulo="Motorista de entrega"))
+        pipeline.put("B", _job(3, titulo="Vaga lixo"))
+        pipeline.put("B", _job(4))
+        pipeline.put("B", _job(5))
+        summary = pipeline.close()
+
+        assert db.count_jobs() == 3
+        assert summary["inserted"] == 3
+        assert summary["blacklisted"] == 1
+        assert summary["discarded"] == 1
+        assert summary["batches"] == 3
+        assert summary["new_by_source"] == {"A": 1, "B": 3}
+        assert len(notified) == 3
+        assert summary["notified"] == 3
+
+    def test_duplicates_across_batches(self, db):
+        """A job already inserted by an earlier batch is a duplicate"""
+        pipeline = JobPipeline(db, FakeBrain(), batch_size=1).start()
+
+        pipeline.put("A", _job(1))
+        pipeline.put("B", _job(1))
+        summary = pipeline.close()
+
+        assert summary["inserted"] == 1
+        assert summary["duplicates"] == 1
+        assert summary["new_by_source"] == {"A": 1}
+
+    def test_partial_batch_flushed_after_interval(self, db):
+        """A small batch is written without waiting for close()"""
+        import time
+        pipeline = JobPipeline(db, FakeBrain(), batch_size=100, flush_interval=0.05).start()
+
+        pipeline.put("A", _job(1))
+        deadline = time.monotonic() + 2
+        while db.count_jobs() == 0 and time.monotonic() < deadline:
+            time.sleep(0.02)
+
+        assert db.count_jobs() == 1
+        pipeline.close()
+
+    def test_top_jobs_for_summary(self, db):
+        """Only the best notified jobs are kept for the summary"""
+        pipeline = JobPipeline(db, FakeBrain(), notify=lambda job: True, top_size=2).start()
+        for i in range(5):
+            pipeline.put("A", _job(i))
+        pipeline.close()
+
+        assert len(pipeline.top_jobs()) == 2
+
+    def test_put_after_close_is_dropped(self, db):
+        """A late producer never blocks on a pipeline nobody drains anymore"""
+        pipeline = JobPipeline(db, FakeBrain(), max_queue=1).start()
+        pipeline.close()
+
+        assert pipeline.put("Late", _job(0)) is False
+        assert pipeline.stats["dropped"] == 1
+
+    def test_put_gives_up_after_timeout(self, db):
+        """With a full queue, put(timeout=...) drops the job instead of waiting forever"""
+        pipeline = JobPipeline(db, FakeBrain(), max_queue=1)  # not started: nothing consumes
+
+        assert pipeline.put("Src", _job(0), timeout=0.1) is True
+        assert pipeline.put("Src", _job(1), timeout=0.1) is False
@@ -0,0 +1,87 @@
+"""
+Unit tests for the per-source adaptive polling planner
+"""
+import pytest
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from database import JobDatabase
+from polling_planner import PollingPlanner
+
+
+@pytest.fixture
+def db(tmp_path):
+    """Fresh SQLite database per test"""
+    return JobDatabase(str(tmp_path / "jobs.db"))
+
+
+def _feed_history(db, source, new_per_fetch, every_minutes=30, fetches=6):
+    start = datetime(2026, 2, 1, 8, 0)
+    for i in range(fetches):
+        db.record_source_fetch(source, jobs_found=20, jobs_new=new_per_fetch,
+                               fetched_at=start + timedelta(minutes=every_minutes * i))
+
+
+class TestPollingPlanner:
+    """Test suite for PollingPlanner"""
+
+    def test_new_source_is_due(self, db):
+        """A source without history is polled right away"""
+        planner = PollingPlanner(db)
+        sources = [{"name": "Remotive"}]
+
+        assert planner.due_sources(sources) == sources
+        assert planner.seconds_until_next(sources) == 0
+
+    def test_rate_estimate(self, db):
+        """Yield is new jobs per hour between fetches"""
+        _feed_history(db, "Remotive", new_per_fetch=10, every_minutes=30)
+        planner = PollingPlanner(db)
+
+        rate = planner.estimate_rate(db.get_source_history("Remotive"))
+        assert rate == pytest.approx(20.0)
+
+    def test_failed_fetch_hours_stay_in_the_window(self, db):
+        """A timed-out fetch does not shrink the window (and inflate the rate)"""
+        start = datetime(2026, 2, 1, 8, 0)
+        db.record_source_fetch("Remotive", jobs_found=20, jobs_new=0, fetched_at=start)
+        db.record_source_fetch("Remotive", jobs_found=0, jobs_new=0, status="timeout",
+                               fetched_at=start + timedelta(hours=1))
+        db.record_source_fetch("Remotive", jobs_found=20, jobs_new=10,
+                               fetched_at=start + timedelta(hours=2))
+        planner = PollingPlanner(db)
+
+        rate = planner.estimate_rate(db.get_source_history("Remotive"))
+        assert rate == pytest.approx(5.0)
+
+    def test_busy_source_polled_more_often(self, db):
+        """Busy sources get shorter intervals than quiet ones"""
+        _feed_history(db, "Remotive", new_per_fetch=10)
+        _feed_history(db, "Gupy", new_per_fetch=1)
+        planner = PollingPlanner(db, min_interval=1, max_interval=1000, target_new=5)
+
+        assert planner.interval_for("Remotive") < planner.interval_for("Gupy")
+
+    def test_dead_source_gets_max_interval(self, db):
+        """A source with no new jobs falls back to the max interval"""
+        _feed_history(db, "Apinfo", new_per_fetch=0)
+        planner = PollingPlanner(db, min_interval=10, max_interval=360)
+
+        assert planner.interval_for("Apinfo") == 360
+
+    def test_record_schedules_next_run(self, db):
+        """After a fetch the source is not due until its interval passes"""
+        _feed_history(db, "Apinfo", new_per_fetch=0)
+        planner = PollingPlanner(db, min_interval=10, max_interval=360)
+        now = datetime(2026, 2, 2, 12, 0)
+        sources = [{"name": "Apinfo"}]
+
+        planner.record("Apinfo", jobs_found=5, jobs_new=0, now=now)
+
+        assert planner.due_sources(sources, now=now + timedelta(minutes=30)) == []
+        assert planner.due_sources(sources, now=now + timedelta(minutes=361)) == sources
+        assert planner.seconds_until_next(sources, now=now) == pytest.approx(360 * 60)
@@ -0,0 +1,101 @@
+"""
+Unit tests for the per-host token-bucket rate limiter
+"""
+import asyncio
+import time
+import pytest
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from rate_limiter import RateLimiter, RateLimitExceeded, TokenBucket
+
+
+@pytest.fixture
+def limiter():
+    """Limiter with a small bucket for a fake host"""
+    return RateLimiter(limits={"api.example.com": {"capacity": 2, "per_second": 1}}, max_wait=5)
+
+
+class TestTokenBucket:
+    """Test suite for TokenBucket"""
+
+    def test_burst_then_wait(self):
+        """Capacity allows a burst, then the refill rate dictates the wait"""
+        bucket = TokenBucket(capacity=2, rate=0.5)
+        now = bucket.updated
+
+        assert bucket.reserve(now) == 0
+        assert bucket.reserve(now) == 0
+        assert bucket.reserve(now) == pytest.approx(2.0)
+        assert bucket.reserve(now + 2.0) == 0
+
+    def test_server_remaining_caps_tokens(self):
+        """Remaining=0 from the server blocks until the reset"""
+        bucket = TokenBucket(capacity=10, rate=1)
+        now = bucket.updated
+
+        bucket.apply_server_state(remaining=0, reset_after=30, now=now)
+
+        assert bucket.reserve(now) == pytest.approx(30)
+
+    def test_unlimited_only_blocks_when_told(self):
+        """Hosts without configured limits never wait unless penalized"""
+        bucket = TokenBucket()
+        now = bucket.updated
+
+        assert all(bucket.reserve(now) == 0 for _ in range(100))
+        bucket.block_for(3, now)
+        assert bucket.reserve(now) == pytest.approx(3)
+
+
+class TestRateLimiter:
+    """Test suite for RateLimiter"""
+
+    def test_acquire_sleeps_only_when_empty(self, limiter, monkeypatch):
+        """The third call in a burst waits for a token"""
+        sleeps = []
+        monkeypatch.setattr("rate_limiter.time.sleep", lambda s: sleeps.append(s) or _advance(limiter, s))
+
+        for _ in range(3):
+            limiter.acquire("api.example.com")
+
+        assert len(sleeps) == 1
+        assert limiter.state()["api.example.com"]["throttled"] == 1
+
+    def test_headers_update_bucket(self, limiter):
+        """X-RateLimit-* headers drive the bucket"""
+        reset = time.time() + 40
+        limiter.update_from_headers(
+            "api.example.com",
+            {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(reset)},
+        )
+
+        assert limiter.state()["api.example.com"]["blocked_for"] == pytest.approx(40, abs=1)
+
+    def test_retry_after_on_429(self, limiter):
+        """Retry-After on a 429 blocks an otherwise unlimited host"""
+        limiter.update_from_headers("discord.example", {"Retry-After": "12"}, status_code=429)
+
+        assert limiter.state()["discord.example"]["blocked_for"] == pytest.approx(12, abs=0.5)
+
+    def test_gives_up_past_max_wait(self, limiter):
+        """Waits longer than max_wait raise instead of hanging the thread"""
+        limiter.penalize("api.example.com", 3600)
+
+        with pytest.raises(RateLimitExceeded):
+            limiter.acquire("api.example.com")
+
+    def test_acquire_async(self, limiter):
+        """The asyncio variant consumes tokens from the same bucket"""
+        asyncio.run(limiter.acquire_async("api.example.com"))
+
+        assert limiter.state()["api.example.com"]["acquired"] == 1
+
+
+def _advance(limiter, seconds):
+    """Simulate elapsed time by rewinding the bucket clocks"""
+    for bucket in limiter._buckets.values():
+        bucket.updated -= seconds
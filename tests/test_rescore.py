@@ -0,0 +1,125 @@
+"""
+Unit tests for the whole-table rescoring command
+"""
+import json
+import pytest
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from database import JobDatabase
+from intelligence import Intelligence
+import rescore as rescore_module
+from rescore import CHECKPOINT_KEY, rescore
+
+TITLES = ["Estágio Python", "Analista de Segurança Jr", "Motorista", "Suporte TI",
+          "Desenvolvedor Go", "SDR Trainee", "Gerente de Loja", "Estágio em Direito"]
+
+
+def _job(i):
+    # Stored with the defaults of an old scoring run (score 0, no tags)
+    return {
+        "titulo": f"{TITLES[i % len(TITLES)]} {i}",
+        "empresa": f"Empresa{i}",
+        "localizacao": "Remoto",
+        "link": f"https://example.com/job/{i}",
+        "data_publicacao": "2024-01-01",
+        "data_coleta": "2024-01-01 10:00:00",
+        "plataforma": "Test",
+    }
+
+
+@pytest.fixture
+def db(tmp_path):
+    db = JobDatabase(str(tmp_path / "jobs.db"))
+    db.add_jobs_batch([_job(i) for i in range(16)])
+    yield db
+    db.close()
+
+
+def _scores(db):
+    return {job["link"]: (job["score"], bool(job["is_relevant"]), json.loads(job["tags"]))
+            for job in db.get_all_jobs()}
+
+
+def _expected(brain):
+    jobs = brain.enhance_jobs([_job(i) for i in range(16)])
+    return {job["link"]: (job["score"], job["is_relevant"], job["tags"]) for job in jobs}
+
+
+class TestRescore:
+    """Test suite for rescore()"""
+
+    def test_rescore_updates_stale_rows(self, db):
+        """Every row gets the scores of the current rules, in chunks"""
+        brain = Intelligence()
+        generation = db.generation()
+
+        stats = rescore(db, brain, workers=1, chunk_size=5)
+
+        assert _scores(db) == _expected(brain)
+        assert stats["scanned"] == 16
+        assert stats["chunks"] == 4
+        assert stats["updated"] > 0
+        assert db.generation() > generation
+        assert db.get_meta(CHECKPOINT_KEY) is None
+
+    def test_unchanged_rows_are_not_rewritten(self, db):
+        """A second run with the same rules updates nothing"""
+        rescore(db, workers=1)
+        generation = db.generation()
+
+        assert rescore(db, workers=1)["updated"] == 0
+        assert db.generation() == generation
+
+    def test_resume_from_checkpoint(self, db):
+        """An interrupted run continues after the last written chunk"""
+        brain = Intelligence()
+        last_id = db.get_job(_job(7)["link"])["id"]
+        db.set_meta(CHECKPOINT_KEY, json.dumps({"rules": brain.rules.version, "last_id": last_id}))
+
+        stats = rescore(db, brain, workers=1, chunk_size=4)
+
+        assert stats["resumed_from"] == last_id
+        assert stats["scanned"] == 8
+        assert db.get_job(_job(0)["link"])["score"] == 0  # before the checkpoint: untouched
+
+    def test_checkpoint_of_other_rules_is_ignored(self, db):
+        """A checkpoint from different weights restarts from the beginning"""
+        db.set_meta(CHECKPOINT_KEY, json.dumps({"rules": "old", "last_id": 10}))
+
+        stats = rescore(db, workers=1)
+
+        assert stats["resumed_from"] == 0
+        assert stats["scanned"] == 16
+
+    def test_process_pool_uses_tuned_rules(self, db):
+        """Workers score with the caller's (tuned) weights"""
+        brain = Intelligence()
+        brain.block_list.append("empresa3")
+        brain.compile_rules()
+
+        rescore(db, brain, workers=2, chunk_size=3)
+
+        assert _scores(db) == _expected(brain)
+        assert db.get_job(_job(3)["link"])["score"] == -1
+
+    def test_process_pool_uses_tuned_spam_keywords(self, db):
+        """Workers also get the caller's spam list"""
+        brain = Intelligence()
+        brain.spam_keywords.append("empresa5")
+        brain.compile_rules()
+
+        rescore(db, brain, workers=2, chunk_size=3)
+
+        assert db.get_job(_job(5)["link"])["score"] == -999
+
+    def test_worker_checks_rules_version(self):
+        """A worker that compiles different rules refuses to start"""
+        brain = Intelligence()
+
+        with pytest.raises(RuntimeError):
+            rescore_module._init_worker(brain.weights, brain.block_list, brain.penalty_list,
+                                        brain.spam_keywords, "other-version")
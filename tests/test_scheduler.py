@@ -0,0 +1,161 @@
+"""
+Unit tests for the parallel scraper scheduler
+"""
+import threading
+import time
+import pytest
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from scheduler import ScraperScheduler
+
+
+def _jobs(n, prefix="job"):
+    return [{"titulo": f"{prefix} {i}", "link": f"https://example.com/{prefix}/{i}"} for i in range(n)]
+
+
+class TestScraperScheduler:
+    """Test suite for ScraperScheduler"""
+
+    def test_collects_all_sources(self):
+        """Jobs from every finished source are merged"""
+        scheduler = ScraperScheduler(default_timeout=5, cycle_budget=10)
+        result = scheduler.run([
+            {"name": "A", "scraper": lambda: _jobs(2, "a")},
+            {"name": "B", "scraper": lambda n: _jobs(n, "b"), "args": (3,)},
+        ])
+
+        assert len(result["jobs"]) == 5
+        assert result["sources"]["A"]["status"] == "ok"
+        assert result["sources"]["B"]["count"] == 3
+
+    def test_sources_run_concurrently(self):
+        """Two slow sources take roughly the time of one"""
+        scheduler = ScraperScheduler(default_timeout=5, cycle_budget=10)
+
+        def slow():
+            time.sleep(0.3)
+            return _jobs(1)
+
+        result = scheduler.run([
+            {"name": "A", "scraper": slow},
+            {"name": "B", "scraper": slow},
+        ])
+
+        assert result["duration"] < 0.55
+        assert len(result["jobs"]) == 2
+
+    def test_source_deadline_returns_partial_results(self):
+        """A source past its deadline is dropped, the others are kept"""
+        scheduler = ScraperScheduler(default_timeout=5, cycle_budget=10)
+        release = threading.Event()
+
+        result = scheduler.run([
+            {"name": "Fast", "scraper": lambda: _jobs(2)},
+            {"name": "Stuck", "scraper": lambda: release.wait(5) and _jobs(9), "timeout": 0.2},
+        ])
+        release.set()
+
+        assert result["sources"]["Fast"]["status"] == "ok"
+        assert result["sources"]["Stuck"]["status"] == "timeout"
+        assert len(result["jobs"]) == 2
+
+    def test_cycle_budget(self):
+        """The cycle stops waiting once the total budget is spent"""
+        scheduler = ScraperScheduler(default_timeout=5, cycle_budget=0.2)
+        release = threading.Event()
+
+        start = time.monotonic()
+        result = scheduler.run([{"name": "Stuck", "scraper": lambda: release.wait(5) and []}])
+        release.set()
+
+        assert time.monotonic() - start < 2
+        assert result["sources"]["Stuck"]["status"] == "timeout"
+
+    def test_errors_are_isolated(self):
+        """A failing source does not affect the others"""
+        def boom():
+            raise RuntimeError("API Error")
+
+        scheduler = ScraperScheduler(default_timeout=5, cycle_budget=10)
+        result = scheduler.run([
+            {"name": "Bad", "scraper": boom},
+            {"name": "Good", "scraper": lambda: _jobs(1)},
+        ])
+
+        assert result["sources"]["Bad"]["status"] == "error"
+        assert "API Error" in result["sources"]["Bad"]["error"]
+        assert len(result["jobs"]) == 1
+
+    def test_cancel(self):
+        """cancel() makes run() return with what already finished"""
+        scheduler = ScraperScheduler(default_timeout=5, cycle_budget=10)
+        release = threading.Event()
+        threading.Timer(0.2, scheduler.cancel).start()
+
+        result = scheduler.run([
+            {"name": "Fast", "scraper": lambda: _jobs(1)},
+            {"name": "Stuck", "scraper": lambda: release.wait(5) and []},
+        ])
+        release.set()
+
+        assert result["sources"]["Fast"]["status"] == "ok"
+        assert result["sources"]["Stuck"]["status"] == "cancelled"
+
+    def test_still_running_source_is_skipped(self):
+        """A source left running by a previous cycle is not started twice"""
+        scheduler = ScraperScheduler(default_timeout=5, cycle_budget=10)
+        release = threading.Event()
+        stuck = {"name": "Stuck", "scraper": lambda: release.wait(5) and [], "timeout": 0.1}
+
+        scheduler.run([stuck])
+        result = scheduler.run([stuck])
+        release.set()
+
+        assert result["sources"]["Stuck"]["status"] == "skipped"
+
+    def test_sink_streams_generator_jobs(self):
+        """With a sink, jobs are handed over as produced and not accumulated"""
+        scheduler = ScraperScheduler(default_timeout=5, cycle_budget=10)
+        received = []
+
+        def generator():
+            for job in _jobs(3, "g"):
+                yield job
+
+        result = scheduler.run(
+            [{"name": "Gen", "scraper": generator}, {"name": "List", "scraper": lambda: _jobs(2)}],
+            sink=lambda name, job, timeout=None: received.append((name, job["link"])),
+        )
+
+        assert len(received) == 5
+        assert ("Gen", "https://example.com/g/0") in received
+        assert result["jobs"] == []
+        assert result["sources"]["Gen"]["count"] == 3
+
+    def test_abandoned_source_never_blocks_on_sink(self):
+        """A source stuck on a full sink gives up at its deadline and is freed"""
+        import queue
+        scheduler = ScraperScheduler(default_timeout=5, cycle_budget=10)
+        full = queue.Queue(maxsize=1)
+
+        def sink(name, job, timeout=None):
+            try:
+                full.put(job, timeout=timeout)  # nobody drains it
+            except queue.Full:
+                pass  # dropped, like JobPipeline.put
+
+        def generator():
+            for job in _jobs(3, "s"):
+                yield job
+
+        source = {"name": "Slow", "scraper": generator, "timeout": 0.2}
+        scheduler.run([source], sink=sink)
+        time.sleep(0.3)
+
+        assert not scheduler.is_running("Slow")
+        assert full.qsize() == 1
+        assert scheduler.run([source], sink=sink)["sources"]["Slow"]["status"] != "skipped"
@@ -0,0 +1,103 @@
+"""
+Unit tests for the memoized score cache
+"""
+import pytest
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from intelligence import Intelligence
+from score_cache import ScoreCache, text_key
+
+ENTRY = (45, ("🐍 PYTHON",), "R$ 1.500")
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return str(tmp_path / "score_cache.db")
+
+
+class TestScoreCache:
+    """Test suite for ScoreCache"""
+
+    def test_memory_then_disk(self, cache_path):
+        """Entries survive a restart through the SQLite file"""
+        key = text_key("Estágio TI", "Itaú", "")
+        cache = ScoreCache(cache_path)
+        cache.put_many("v1", {key: ENTRY})
+        assert cache.get_many("v1", [key]) == {key: ENTRY}
+        cache.close()
+
+        reopened = ScoreCache(cache_path)
+        assert reopened.get_many("v1", [key, "missing"]) == {key: ENTRY}
+        assert reopened.stats()["disk_hits"] == 1
+        assert reopened.stats()["misses"] == 1
+        reopened.close()
+
+    def test_rules_version_is_part_of_the_key(self, cache_path):
+        """Scores from other rules are never returned"""
+        cache = ScoreCache(cache_path)
+        cache.put_many("v1", {"k": ENTRY})
+
+        assert cache.get_many("v2", ["k"]) == {}
+        cache.close()
+
+    def test_memory_is_bounded(self):
+        """The in-memory LRU keeps only the most recent entries"""
+        cache = ScoreCache(path=None, size=2)
+        cache.put_many("v1", {"a": ENTRY, "b": ENTRY})
+        cache.get_many("v1", ["a"])
+        cache.put_many("v1", {"c": ENTRY})
+
+        assert len(cache) == 2
+        assert set(cache.get_many("v1", ["a", "b", "c"])) == {"a", "c"}
+
+    def test_key_normalizes_case(self):
+        """Same text in other case shares the entry"""
+        assert text_key("Estágio TI", "ITAÚ", None) == text_key("estágio ti", "itaú", "")
+
+
+class TestCachedScoring:
+    """Intelligence with a score cache"""
+
+    def test_repeat_postings_skip_scoring(self, cache_path):
+        """A repost from another source is served from the cache, same result"""
+        brain = Intelligence(score_cache=ScoreCache(cache_path))
+        first = {"titulo": "Estágio Python", "empresa": "Itaú", "descricao": "Bolsa R$ 1.800",
+                 "link": "https://a.com/1"}
+        repost = dict(first, link="https://b.com/vaga-cyber")
+
+        brain.enhance_jobs([first])
+        brain.enhance_jobs([repost])
+
+        assert brain.score_cache.stats()["memory_hits"] == 1
+        assert (repost["score"], repost["salario"]) == (first["score"], first["salario"])
+        # Fields outside the cache key still add their tags
+        assert repost["tags"] == ["🛡️ CYBER", "🐍 PYTHON"]
+        assert repost == Intelligence().enhance_job_data(dict(repost))
+
+    def test_tuned_rules_miss_the_cache(self):
+        """Changing weights at runtime changes the rules version in the key"""
+        brain = Intelligence(score_cache=ScoreCache(path=None))
+        job = {"titulo": "Estágio em Kotlin", "empresa": "Acme"}
+        brain.enhance_jobs([dict(job)])
+
+        brain.weights["secondary"]["keywords"].append("kotlin")
+        brain.compile_rules()
+
+        assert brain.enhance_jobs([dict(job)])[0]["score"] == 30
+
+    def test_scoring_code_version_misses_the_cache(self, monkeypatch):
+        """Bumping SCORING_CODE_VERSION invalidates scores cached by older code"""
+        import intelligence
+        brain = Intelligence(score_cache=ScoreCache(path=None))
+        job = {"titulo": "Estágio Python", "empresa": "Itaú", "descricao": "Bolsa R$ 1.800"}
+        brain.enhance_jobs([dict(job)])
+
+        monkeypatch.setattr(intelligence, "SCORING_CODE_VERSION", intelligence.SCORING_CODE_VERSION + 1)
+        brain.enhance_jobs([dict(job)])
+
+        assert brain.score_cache.stats()["misses"] == 2
+        assert brain.score_cache.stats()["memory_hits"] == 0
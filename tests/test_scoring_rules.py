@@ -0,0 +1,100 @@
+"""
+Unit tests for the external scoring rules file and its hot reload
+"""
+import json
+import os
+import pytest
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from config import SCORING_RULES_PATH
+from scoring_rules import RulesWatcher, compile_ruleset, load_ruleset
+
+
+def _write(path, data, mtime):
+    path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+    os.utime(path, ns=(mtime, mtime))
+
+
+@pytest.fixture
+def rules_data():
+    with open(SCORING_RULES_PATH, encoding="utf-8") as f:
+        return json.load(f)
+
+
+@pytest.fixture
+def rules_file(tmp_path, rules_data):
+    path = tmp_path / "scoring_rules.json"
+    _write(path, rules_data, 1_000_000_000)
+    return path
+
+
+class TestRuleSet:
+    """Test suite for compiled rule sets"""
+
+    def test_default_file_is_valid(self):
+        """The shipped rules file compiles"""
+        rules = load_ruleset()
+
+        assert "dream_job" in rules.weights
+        assert rules.is_blacklisted_title("Motorista Entregador")
+        assert rules.is_blacklisted_link("https://www.net-empregos.com/vaga/1")
+        assert rules.gold_score("Estágio Python Linux") == 20
+
+    def test_compiled_once_per_content(self, rules_data):
+        """Same content (any formatting/key order) reuses the compiled rules"""
+        reordered = json.loads(json.dumps(rules_data, sort_keys=True, indent=4))
+
+        assert compile_ruleset(rules_data) is compile_ruleset(reordered)
+
+    def test_missing_keys_are_rejected(self, rules_data):
+        """A rules file without a required list is an error"""
+        del rules_data["block_list"]
+
+        with pytest.raises(ValueError):
+            compile_ruleset(rules_data)
+
+
+class TestRulesWatcher:
+    """Test suite for RulesWatcher hot reload"""
+
+    def test_reload_on_change(self, rules_file, rules_data):
+        """Edited rules become current after check(), Intelligence picks them up"""
+        from intelligence import Intelligence
+
+        brain = Intelligence(rules_path=str(rules_file))
+        watcher = brain.watcher
+        job = {"titulo": "Estágio em Kotlin", "empresa": "Acme"}
+        assert brain.calculate_match_score(job) == 0
+        old_version = watcher.current.version
+
+        rules_data["weights"]["secondary"]["keywords"].append("kotlin")
+        _write(rules_file, rules_data, 2_000_000_000)
+
+        assert watcher.check()
+        assert watcher.current.version != old_version
+        assert brain.calculate_match_score(job) == 30
+
+    def test_unchanged_file_is_not_reloaded(self, rules_file, rules_data):
+        """Touching the file with the same content keeps the same rules object"""
+        watcher = RulesWatcher(str(rules_file))
+        current = watcher.current
+
+        _write(rules_file, rules_data, 3_000_000_000)
+
+        assert not watcher.check()
+        assert watcher.current is current
+
+    def test_invalid_file_keeps_previous_rules(self, rules_file):
+        """A broken edit is logged and ignored"""
+        watcher = RulesWatcher(str(rules_file))
+        current = watcher.current
+
+        rules_file.write_text("{ not json", encoding="utf-8")
+        os.utime(rules_file, ns=(4_000_000_000, 4_000_000_000))
+
+        assert not watcher.check()
+        assert watcher.current is current
@@ -0,0 +1,86 @@
+"""
+Unit tests for GitHub scraper (batched repo queries + incremental state)
+"""
+import json
+import pytest
+from unittest.mock import Mock, patch
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from scraper_github import GithubScraper, GITHUB_REPOS, build_queries, repo_of
+
+
+def _issue(repo, number, title="[Remoto] Desenvolvedor Junior Python"):
+    return {
+        "title": title,
+        "body": "",
+        "html_url": f"https://github.com/{repo}/issues/{number}",
+        "repository_url": f"https://api.github.com/repos/{repo}",
+        "created_at": "2026-10-01T12:00:00Z",
+    }
+
+
+class TestBuildQueries:
+    """Test suite for the query planner"""
+
+    def test_all_repos_fit_in_one_query(self):
+        """The default repo list packs into a single search"""
+        queries = build_queries(GITHUB_REPOS, since="2026-10-01T00:00:00Z")
+
+        assert len(queries) == 1
+        query, repos = queries[0]
+        assert repos == GITHUB_REPOS
+        assert len(query) <= 256
+        assert query.endswith("updated:>2026-10-01T00:00:00Z")
+
+    def test_splits_when_too_long(self):
+        """Repos that do not fit spill into another query, none lost"""
+        repos = [f"owner{i}/some-long-repository-name" for i in range(12)]
+        queries = build_queries(repos, max_length=200)
+
+        assert len(queries) > 1
+        assert all(len(q) <= 200 for q, _ in queries)
+        assert [r for _, batch in queries for r in batch] == repos
+
+    def test_repo_of(self):
+        """repository_url maps back to owner/name"""
+        assert repo_of({"repository_url": "https://api.github.com/repos/Backend-BR/vagas"}) == "backend-br/vagas"
+
+
+class TestGithubScraper:
+    """Test suite for GithubScraper"""
+
+    @patch("scraper_github.http_client.get")
+    def test_single_request_split_by_repo(self, mock_get, tmp_path):
+        """One search call covers every repo and results are split back"""
+        mock_get.return_value = Mock(status_code=200, json=Mock(return_value={
+            "total_count": 3,
+            "items": [
+                _issue("backend-br/vagas", 1),
+                _issue("pythonbrasil/vagas", 2),
+                _issue("pythonbrasil/vagas", 3, title="Senior Staff Engineer"),
+            ],
+        }))
+        state_path = tmp_path / "github_state.json"
+
+        jobs = GithubScraper(state_path=str(state_path)).fetch_jobs()
+
+        assert mock_get.call_count == 1
+        assert [job["empresa"] for job in jobs] == ["Via backend-br/vagas", "Via pythonbrasil/vagas"]
+        assert jobs[0]["localizacao"] == "Remoto"
+        assert "last_seen" in json.loads(state_path.read_text())
+
+    @patch("scraper_github.http_client.get")
+    def test_uses_last_seen_and_keeps_it_on_failure(self, mock_get, tmp_path):
+        """The saved marker goes into updated:> and is not advanced on errors"""
+        state_path = tmp_path / "github_state.json"
+        state_path.write_text(json.dumps({"last_seen": "2026-10-10T08:00:00Z"}))
+        mock_get.return_value = Mock(status_code=503)
+
+        assert GithubScraper(state_path=str(state_path)).fetch_jobs() == []
+
+        assert "updated:>2026-10-10T08:00:00Z" in mock_get.call_args.kwargs["params"]["q"]
+        assert json.loads(state_path.read_text())["last_seen"] == "2026-10-10T08:00:00Z"
@@ -0,0 +1,72 @@
+"""
+Unit tests for Hacker News scraper (parallel item fetch + seen-item cache)
+"""
+import pytest
+from unittest.mock import Mock, patch
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from scraper_hackernews import HackerNewsScraper
+
+
+ITEMS = {
+    1: {"title": "Acme (YC S21) is hiring junior engineers", "url": "https://acme.dev/jobs", "time": 1769900000},
+    2: {"title": "Globex is hiring a Staff Engineer", "time": 1769900000},
+    3: {"title": "Initech is hiring remote interns", "time": 1769900000},
+}
+
+
+def _fake_get(url, **kwargs):
+    response = Mock(status_code=200)
+    if url.endswith("jobstories.json"):
+        response.json.return_value = list(ITEMS)
+    else:
+        item_id = int(url.rsplit("/", 1)[1].split(".")[0])
+        response.json.return_value = ITEMS[item_id]
+    return response
+
+
+class TestHackerNewsScraper:
+    """Test suite for HackerNewsScraper"""
+
+    @patch("scraper_hackernews.http_client.get", side_effect=_fake_get)
+    def test_fetch_jobs_filters_relevant(self, mock_get, tmp_path):
+        """Only junior/intern/remote items become jobs"""
+        scraper = HackerNewsScraper(cache_path=str(tmp_path / "hn.json"))
+        jobs = scraper.fetch_jobs()
+
+        assert len(jobs) == 2
+        assert jobs[0]["empresa"] == "Acme"
+        assert jobs[0]["link"] == "https://acme.dev/jobs"
+        assert jobs[1]["link"] == "https://news.ycombinator.com/item?id=3"
+        assert jobs[1]["localizacao"] == "🌍 Remote/Global"
+
+    @patch("scraper_hackernews.http_client.get", side_effect=_fake_get)
+    def test_seen_items_not_fetched_again(self, mock_get, tmp_path):
+        """A second run only downloads the story list"""
+        cache_path = str(tmp_path / "hn.json")
+        HackerNewsScraper(cache_path=cache_path).fetch_jobs()
+        mock_get.reset_mock()
+
+        jobs = HackerNewsScraper(cache_path=cache_path).fetch_jobs()
+
+        assert mock_get.call_count == 1
+        assert len(jobs) == 2
+
+    @patch("scraper_hackernews.http_client.get")
+    def test_failed_items_are_retried(self, mock_get, tmp_path):
+        """Items that failed to download are not cached as irrelevant"""
+        def flaky_get(url, **kwargs):
+            if url.endswith("/item/1.json"):
+                return Mock(status_code=503)
+            return _fake_get(url)
+
+        mock_get.side_effect = flaky_get
+        cache_path = str(tmp_path / "hn.json")
+        assert len(HackerNewsScraper(cache_path=cache_path).fetch_jobs()) == 1
+
+        mock_get.side_effect = _fake_get
+        assert len(HackerNewsScraper(cache_path=cache_path).fetch_jobs()) == 2
@@ -10,7 +10,7 @@ from pathlib import Path
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from scraper_jobspy_real import JobSpyRealScraper
+from scraper_jobspy_real import JobSpyRealScraper, location_column, safe_str_column
 
 
 class TestJobSpyScraper:
@@ -163,3 +163,84 @@ class TestJobSpyScraper:
         # Should return empty list on error
         assert isinstance(jobs, list)
         assert len(jobs) == 0
+    
+    @patch('scraper_jobspy_real.scrape_jobs')
+    def test_queries_cached_between_runs(self, mock_scrape):
+        """A second run within the TTL does not hit JobSpy again"""
+        mock_scrape.return_value = pd.DataFrame([{
+            'site': 'indeed',
+            'title': 'Desenvolvedor Junior',
+            'company': 'Tech Co',
+            'job_url': 'https://indeed.com/job/1',
+        }])
+        
+        scraper = JobSpyRealScraper()
+        first = scraper.fetch_jobs()
+        calls = mock_scrape.call_count
+        second = scraper.fetch_jobs()
+        
+        # Termos são sorteados a cada execução: só combinações novas vão à rede
+        assert calls > 0
+        assert scraper.cache_hits > 0
+        assert mock_scrape.call_count - calls < calls
+        assert first and second
+    
+    @patch('scraper_jobspy_real.scrape_jobs')
+    def test_site_concurrency_is_capped(self, mock_scrape):
+        """Never more concurrent calls per site than configured"""
+        import threading
+        import time
+        from config import JOBSPY_SITE_CONCURRENCY
+        
+        active = {}
+        peak = {}
+        lock = threading.Lock()
+        
+        def slow_scrape(site_name, **kwargs):
+            site = site_name[0]
+            with lock:
+                active[site] = active.get(site, 0) + 1
+                peak[site] = max(peak.get(site, 0), active[site])
+            time.sleep(0.01)
+            with lock:
+                active[site] -= 1
+            return None
+        
+        mock_scrape.side_effect = slow_scrape
+        JobSpyRealScraper(max_workers=12).fetch_jobs()
+        
+        for site, limit in JOBSPY_SITE_CONCURRENCY.items():
+            assert peak.get(site, 0) <= limit
+
+    
+    def test_vectorized_conversion_matches_row_helpers(self):
+        """Columnar conversion gives the same values as _safe_str/_parse_location"""
+        import numpy as np
+        scraper = JobSpyRealScraper()
+        df = pd.DataFrame([
+            {'site': 'linkedin', 'title': ' Dev Junior ', 'company': 'A', 'city': 'São Paulo', 'state': 'SP',
+             'location': None, 'is_remote': False, 'job_url': 'https://a/1', 'date_posted': '2026-02-01'},
+            {'site': 'indeed', 'title': np.nan, 'company': None, 'city': 'Campinas', 'state': np.nan,
+             'location': None, 'is_remote': None, 'job_url': 'https://a/2', 'date_posted': None},
+            {'site': 'google', 'title': 'Estágio', 'company': 'C', 'city': None, 'state': 'RJ',
+             'location': None, 'is_remote': True, 'job_url': 'None', 'date_posted': '2026-02-03'},
+            {'site': None, 'title': 'Trainee', 'company': 'D', 'city': None, 'state': None,
+             'location': 'Recife, PE', 'is_remote': False, 'job_url': 'https://a/4', 'date_posted': '2026-02-04'},
+            {'site': 'indeed', 'title': 'Remoto', 'company': 'E', 'city': np.nan, 'state': None,
+             'location': np.nan, 'is_remote': True, 'job_url': 'https://a/5', 'date_posted': '2026-02-05'},
+            {'site': 'indeed', 'title': 'Sem local', 'company': 'F', 'city': '', 'state': '',
+             'location': '', 'is_remote': False, 'job_url': np.nan, 'date_posted': '2026-02-06'},
+        ])
+        
+        expected_locations = [scraper._parse_location(row) for _, row in df.iterrows()]
+        expected_titles = [scraper._safe_str(row.get('title'), 'Vaga') for _, row in df.iterrows()]
+        
+        assert location_column(df).tolist() == expected_locations
+        assert safe_str_column(df, 'title', 'Vaga').tolist() == expected_titles
+        
+        jobs = scraper._convert(df, "matrix")
+        assert [job['link'] for job in jobs] == ['https://a/1', 'https://a/2', 'https://a/4', 'https://a/5']
+        assert jobs[0]['titulo'] == '🔵 Dev Junior'
+        assert jobs[1]['empresa'] == 'Empresa'
+        assert jobs[2]['plataforma'] == 'JobSpy (Unknown)'
+        assert all(isinstance(job['localizacao'], str) for job in jobs)
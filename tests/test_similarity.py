@@ -0,0 +1,84 @@
+"""
+Unit tests for the MinHash-LSH similarity index
+"""
+import pytest
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from similarity import LSHIndex, MinHasher, jaccard, normalize_signature, shingles
+from database import JobDatabase
+
+
+def _job(i, titulo, empresa):
+    return {
+        "titulo": titulo,
+        "empresa": empresa,
+        "localizacao": "Remoto",
+        "link": f"https://example.com/job/{i}",
+        "data_publicacao": "2024-01-01",
+        "data_coleta": "2024-01-01 10:00:00",
+        "plataforma": "Test",
+    }
+
+
+class TestSignature:
+    """Test suite for signature normalization"""
+
+    def test_normalize_strips_decoration(self):
+        """Emoji, accents and punctuation do not change the signature"""
+        assert normalize_signature("🟣 Estágio em TI!", "ACME S.A.") == "estagio em ti acme s a"
+
+    def test_similar_texts_share_shingles(self):
+        a = shingles(normalize_signature("Desenvolvedor Python Junior", "Acme"))
+        b = shingles(normalize_signature("Desenvolvedor Python Jr", "Acme"))
+        c = shingles(normalize_signature("Analista Financeiro", "Globex"))
+
+        assert jaccard(a, b) > 0.6
+        assert jaccard(a, c) < 0.2
+
+
+class TestLSHIndex:
+    """Test suite for the in-memory LSH index"""
+
+    def test_candidates_found_for_near_duplicates(self):
+        index = LSHIndex()
+        index.add(1, "Desenvolvedor Python Junior", "Acme Tecnologia")
+        index.add(2, "Analista de Suporte", "Globex")
+
+        assert index.candidates("🔵 Desenvolvedor Python Júnior", "ACME Tecnologia") == {1}
+        assert 1 not in index.candidates("Motorista", "Initech")
+
+    def test_bands_must_divide_permutations(self):
+        with pytest.raises(ValueError):
+            MinHasher(num_perm=10, bands=4)
+
+
+class TestPersistentIndex:
+    """Test suite for the job_lsh table behind JobDatabase"""
+
+    def test_index_updated_on_insert(self, tmp_path):
+        db = JobDatabase(str(tmp_path / "jobs.db"))
+        db.add_jobs_batch([_job(1, "Desenvolvedor Python Junior", "Acme Tecnologia"),
+                           _job(2, "Analista de Dados", "Globex")])
+
+        similar = db.find_similar_jobs("Vaga: Desenvolvedor Python Junior", "Acme Tecnologia")
+
+        assert similar[0]["link"] == "https://example.com/job/1"
+        db.close()
+
+    def test_missing_rows_indexed_on_open(self, tmp_path):
+        """Rows written by another writer are picked up when the database opens"""
+        path = str(tmp_path / "jobs.db")
+        db = JobDatabase(path)
+        with db._write() as conn:
+            conn.execute("INSERT INTO jobs (link, titulo, empresa) VALUES (?, ?, ?)",
+                         ("https://x/1", "Engenheiro de Dados Pleno", "Hooli"))
+        db.close()
+
+        reopened = JobDatabase(path)
+        assert reopened.find_similar_jobs("Engenheiro de Dados Pleno", "Hooli")
+        assert reopened.is_fuzzy_duplicate(_job(9, "Engenheiro de Dados Pleno", "Hooli"))
+        reopened.close()